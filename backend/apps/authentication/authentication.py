@@ -0,0 +1,98 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from apps.authentication.tokens import (
+    PlayerTokenUser,
+    are_player_claims_fresh,
+)
+
+PLAYER_RELATED_FIELDS = (
+    'player__country',
+    'player__city',
+    'player__rating',
+)
+
+
+class PlayerJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication loading the user with player, country, city
+    and rating in one query.
+    Permissions, filters and viewsets get the player of the request
+    with apps.players.context.get_request_player() without a query.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _('Token contained no recognizable user identification')
+            ) from e
+
+        try:
+            user = self.user_model.objects.select_related(
+                *PLAYER_RELATED_FIELDS
+            ).get(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(
+                _('User not found'), code='user_not_found'
+            ) from e
+
+        if not user.is_active:
+            raise AuthenticationFailed(
+                _('User is inactive'), code='user_inactive'
+            )
+
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."),
+                code='password_changed',
+            )
+
+        return user
+
+
+class PlayerTokenAuthentication(PlayerJWTAuthentication):
+    """
+    JWT authentication trusting player claims of the access token.
+    Read only requests of registered players get PlayerTokenUser built
+    from the claims without a query. Other requests, tokens without
+    claims and not registered players are authenticated from the
+    database, so a player registered after the token was issued is not
+    rejected by the stale claim.
+    Tokens issued before the registration or location of the player
+    changed are authenticated from the database too, until they are
+    refreshed. The change is marked in the cache, if the mark is evicted
+    the old claims are used until the access token expires.
+    Read only requests skip the is_active and revoked token checks, so
+    a deactivated user or a changed password takes effect on them only
+    when the access token expires.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if (
+            request.method in SAFE_METHODS
+            and validated_token.get('is_registered') is True
+            and validated_token.get(api_settings.USER_ID_CLAIM) is not None
+            and are_player_claims_fresh(validated_token)
+        ):
+            return PlayerTokenUser(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
@@ -5,11 +5,14 @@ from phonenumber_field.serializerfields import PhoneNumberField
 from rest_framework import exceptions, serializers
 from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import (
-    RefreshToken,
     UntypedToken,
 )
 
 from apps.authentication.enums import APIEnums
+from apps.authentication.tokens import (
+    PlayerRefreshToken,
+    get_refresh_token_class,
+)
 from apps.players.constants import PlayerStrEnums
 from apps.players.serializers import PlayerAuthSerializer
 from volleybolley.settings import INSTALLED_APPS, SIMPLE_JWT
@@ -177,13 +180,14 @@ class GoogleUserDataSerializer(AuthBaseSerializer):
 
 class CustomTokenRefreshSerializer(serializers.Serializer):
     refresh_token = serializers.CharField()
-    token_class = RefreshToken
     rotate = SIMPLE_JWT.get('ROTATE_REFRESH_TOKENS', False)
     blacklist = SIMPLE_JWT.get('BLACKLIST_AFTER_ROTATION', False)
     show_refresh = SIMPLE_JWT.get('SHOW_REFRESH_TOKEN', False)
 
     def validate(self, attrs: dict[str, Any]) -> dict[str, str]:
-        refresh = self.token_class(attrs['refresh_token'])
+        refresh = get_refresh_token_class()(attrs['refresh_token'])
+        if isinstance(refresh, PlayerRefreshToken):
+            refresh.update_player_claims()
         data = {'access_token': str(refresh.access_token)}
 
         if self.rotate:
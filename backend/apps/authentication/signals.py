@@ -0,0 +1,23 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.authentication.tokens import (
+    PLAYER_CLAIM_FIELDS,
+    mark_player_claims_stale,
+)
+from apps.players.models import Player
+
+
+@receiver(post_save, sender=Player)
+def mark_changed_player_claims(sender, instance, created, **kwargs):
+    """
+    Make token claims of the player stale if its registration or
+    location changed, so read only requests load it from the database.
+    """
+    if created or not set(PLAYER_CLAIM_FIELDS) & (
+        instance.get_changed_fields()
+    ):
+        return
+    user_id = instance.user_id
+    transaction.on_commit(lambda: mark_player_claims_stale(user_id))
@@ -0,0 +1,120 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.core.cache import make_key
+from apps.players.models import Player
+
+PLAYER_CLAIMS = (
+    'player_id',
+    'is_registered',
+    'country_id',
+    'city_id',
+    'claims_at',
+)
+
+# Player fields copied to the claims.
+PLAYER_CLAIM_FIELDS = ('is_registered', 'country_id', 'city_id')
+
+
+def get_player_claims(player: Player | None) -> dict:
+    """Return claims describing the player of the token user."""
+    if player is None:
+        return {}
+    return {
+        'player_id': player.pk,
+        'is_registered': player.is_registered,
+        'country_id': player.country_id,
+        'city_id': player.city_id,
+        'claims_at': time.time(),
+    }
+
+
+def _claims_changed_key(user_id) -> str:
+    return make_key('player_claims_changed', user_id)
+
+
+def mark_player_claims_stale(user_id) -> None:
+    """
+    Make player claims of the user tokens issued before now stale.
+    The mark lives as long as an access token, older tokens are expired
+    by then.
+    """
+    cache.set(
+        _claims_changed_key(user_id),
+        time.time(),
+        timeout=int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()),
+    )
+
+
+def are_player_claims_fresh(token) -> bool:
+    """Return True if the player did not change since claims were issued."""
+    changed_at = cache.get(
+        _claims_changed_key(token[api_settings.USER_ID_CLAIM])
+    )
+    return changed_at is None or token.get('claims_at', 0) > changed_at
+
+
+class PlayerRefreshToken(RefreshToken):
+    """
+    Refresh token carrying claims of the player, which are copied to
+    every access token issued from it.
+    The claims are reloaded from the database on every token refresh.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token.update_player_claims()
+        return token
+
+    def update_player_claims(self) -> None:
+        """Reload claims of the player of the token user."""
+        for claim in PLAYER_CLAIMS:
+            self.payload.pop(claim, None)
+        player = Player.objects.filter(
+            user_id=self[api_settings.USER_ID_CLAIM]
+        ).first()
+        self.payload.update(get_player_claims(player))
+
+
+def get_refresh_token_class() -> type[RefreshToken]:
+    """Return refresh token class enabled by PLAYER_TOKEN_CLAIMS setting."""
+    if settings.PLAYER_TOKEN_CLAIMS:
+        return PlayerRefreshToken
+    return RefreshToken
+
+
+class PlayerTokenUser(TokenUser):
+    """
+    Request user built from the access token claims without a query.
+    Its player has only the claimed fields loaded, other fields are
+    deferred and relations are not cached, so both are loaded from the
+    database on access.
+    """
+
+    @cached_property
+    def player(self) -> Player:
+        claims = {
+            'id': self.token['player_id'],
+            'user_id': self.id,
+            'is_registered': self.token['is_registered'],
+            'country_id': self.token.get('country_id'),
+            'city_id': self.token.get('city_id'),
+        }
+        fields = [
+            field
+            for field in Player._meta.concrete_fields
+            if field.attname in claims
+        ]
+        return Player.from_db(
+            DEFAULT_DB_ALIAS,
+            [field.attname for field in fields],
+            [claims[field.attname] for field in fields],
+        )
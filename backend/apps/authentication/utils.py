@@ -8,9 +8,9 @@ from firebase_admin import auth, credentials
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.authentication.serializers import LoginSerializer
+from apps.authentication.tokens import get_refresh_token_class
 from apps.players.models import Player
 from apps.users.models import User
 
@@ -24,7 +24,7 @@ def get_serialized_data(user: User) -> LoginSerializer:
     and player instance.
     """
     if user and user.is_active:
-        refresh = RefreshToken.for_user(user)
+        refresh = get_refresh_token_class().for_user(user)
         serializer = LoginSerializer(
             instance={
                 'access_token': str(refresh.access_token),
@@ -0,0 +1,242 @@
+import hashlib
+import logging
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from functools import wraps
+from threading import Lock
+from typing import Any, NamedTuple
+
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.renderers import JSONRenderer
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAMESPACE: str = 'cache'
+TAG_NAMESPACE: str = 'tag'
+
+
+def make_key(*parts: Any) -> str:
+    """Build namespaced cache key from parts: make_key('faq', 1)."""
+    return ':'.join([CACHE_NAMESPACE, *(str(part) for part in parts)])
+
+
+def _tag_key(tag: str) -> str:
+    return f'{TAG_NAMESPACE}:{tag}'
+
+
+def get_tag_versions(tags: Iterable[str]) -> dict[str, int]:
+    """
+    Return current versions of tags.
+    Missing tags get a new version, so values cached with an evicted
+    tag version are never served again.
+    """
+    tag_keys = {tag: _tag_key(tag) for tag in sorted(set(tags))}
+    if not tag_keys:
+        return {}
+    versions = cache.get_many(tag_keys.values())
+    for tag_key in tag_keys.values():
+        if tag_key not in versions:
+            cache.add(tag_key, time.time_ns(), timeout=None)
+            versions[tag_key] = cache.get(tag_key)
+    return {tag: versions[tag_key] for tag, tag_key in tag_keys.items()}
+
+
+def _versioned_key(key: str, tags: Iterable[str]) -> str:
+    """Add digest of tag versions to the key."""
+    versions = get_tag_versions(tags)
+    if not versions:
+        return key
+    digest = hashlib.md5(
+        repr(sorted(versions.items())).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f'{key}:{digest}'
+
+
+def get_or_set(
+    key: str,
+    loader: Callable[[], Any],
+    timeout: int | None = None,
+    tags: Iterable[str] = (),
+) -> Any:
+    """
+    Read-through caching: return cached value for key or call loader,
+    cache and return its result. None results are not cached.
+    Args:
+        key (str): Cache key, see make_key().
+        loader (callable): Function to compute the value on cache miss.
+        timeout (int, optional): TTL in seconds, default from CACHES.
+        tags (iterable, optional): Tags to invalidate the value with.
+    """
+    versioned_key = _versioned_key(key, tags)
+    value = cache.get(versioned_key)
+    if value is not None:
+        return value
+    value = loader()
+    if value is None:
+        return value
+    if timeout is None:
+        cache.set(versioned_key, value)
+    else:
+        cache.set(versioned_key, value, timeout=timeout)
+    return value
+
+
+def invalidate_tags(*tags: str) -> None:
+    """
+    Make all values cached with any of tags stale.
+    Tag versions are dropped, stale values expire by their TTL.
+    """
+    cache.delete_many([_tag_key(tag) for tag in tags])
+    logger.debug(f'Cache tags invalidated: {", ".join(tags)}')
+
+
+def invalidate_tags_on_commit(*tags: str) -> None:
+    """
+    Invalidate tags now and once more after transaction commit,
+    so values loaded from uncommitted state are not kept in cache.
+    """
+    invalidate_tags(*tags)
+    transaction.on_commit(lambda: invalidate_tags(*tags))
+
+
+def cached(
+    key: str | Callable[..., str],
+    timeout: int | None = None,
+    tags: Iterable[str] = (),
+) -> Callable:
+    """
+    Decorator for read-through caching of function result.
+    Key can be a string or a function of decorated function arguments.
+
+        @cached(lambda country_id: make_key('cities', country_id),
+                tags=['locations'])
+        def get_cities(country_id): ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if callable(key) else key
+            return get_or_set(
+                cache_key,
+                lambda: func(*args, **kwargs),
+                timeout=timeout,
+                tags=tags,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+class CachedPayload(NamedTuple):
+    """Pre-rendered JSON response body with its validators."""
+
+    content: bytes
+    etag: str
+    last_modified: datetime | None = None
+
+
+def build_payload(
+    data: Any, last_modified: datetime | None = None
+) -> CachedPayload:
+    """Render data to JSON once and compute strong ETag of the content."""
+    content = JSONRenderer().render(data)
+    etag = f'"{hashlib.sha256(content).hexdigest()}"'
+    return CachedPayload(content, etag, last_modified)
+
+
+def payload_response(
+    request: HttpRequest,
+    payload: CachedPayload,
+    max_age: int,
+    private: bool = False,
+) -> HttpResponse:
+    """
+    Return pre-rendered payload with ETag, Last-Modified and Cache-Control
+    headers, or 304 Not Modified for matching conditional request.
+    """
+    # HTTP dates have second precision, drop microseconds to compare.
+    last_modified = (
+        int(payload.last_modified.timestamp())
+        if payload.last_modified
+        else None
+    )
+    response = get_conditional_response(
+        request, etag=payload.etag, last_modified=last_modified
+    )
+    if response is None:
+        response = HttpResponse(
+            payload.content, content_type='application/json'
+        )
+    response['ETag'] = payload.etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    if private:
+        patch_cache_control(response, private=True, max_age=max_age)
+    else:
+        patch_cache_control(response, public=True, max_age=max_age)
+    return response
+
+
+class VersionedLocalCache:
+    """
+    In-process cache for rarely changed rows (notification templates,
+    active notification time settings, player autocomplete indexes).
+    Every value is stored with the version it was loaded at. The version
+    counter lives in Django cache, so invalidate() makes values stale in
+    every process sharing that cache. TTL limits staleness of values
+    if the version can not be shared.
+    Arguments:
+        version_key (str): Django cache key of the version counter.
+        ttl (int): Maximum age of local values in seconds.
+    Methods:
+        get_or_load(key, loader): Returns fresh cached value or loads it.
+        invalidate(): Bumps version and drops local values.
+        clear(): Drops local values only.
+    """
+
+    def __init__(self, version_key: str, ttl: int):
+        self.version_key = version_key
+        self.ttl = ttl
+        self._values: dict[str, tuple[int, float, Any]] = {}
+        self._lock = Lock()
+
+    def get_version(self) -> int:
+        """Return current version of cached values."""
+        return cache.get_or_set(self.version_key, time.time_ns, timeout=None)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        """
+        Return value for key if it is loaded at current version and not
+        expired, otherwise call loader and cache its result.
+        """
+        version = self.get_version()
+        now = time.monotonic()
+        cached = self._values.get(key)
+        if cached is not None:
+            cached_version, expires_at, value = cached
+            if cached_version == version and expires_at > now:
+                return value
+        value = loader()
+        with self._lock:
+            self._values[key] = (version, now + self.ttl, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Make cached values stale in all processes."""
+        try:
+            cache.incr(self.version_key)
+        except ValueError:
+            cache.set(self.version_key, time.time_ns(), timeout=None)
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop values cached in current process."""
+        with self._lock:
+            self._values.clear()
@@ -14,6 +14,12 @@ class GenderChoices(m.TextChoices):
 
 DEFAULT_FAQ: str = 'default_faq'
 
+CURRENCIES_CACHE_TAG: str = 'currencies'
+REFERENCE_DATA_CACHE_TIMEOUT: int = 60 * 60 * 24
+REFERENCE_DATA_MAX_AGE: int = 60 * 10
+FAQ_CACHE_TAG: str = 'faq'
+FAQ_MAX_AGE: int = 60 * 5
+
 
 class ContactTypes(m.TextChoices):
     """Contact type enums for contact model."""
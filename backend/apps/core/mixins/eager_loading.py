@@ -0,0 +1,25 @@
+from django.db.models import Prefetch, QuerySet
+
+
+class EagerLoadingMixin:
+    """
+    Serializer mixin with prefetch profile.
+    Describes related objects read by the serializer, so a queryset can
+    load them in a fixed number of queries regardless of its size.
+    Attributes:
+        select_related_fields (tuple): Lookups for select_related().
+        prefetch_related_fields (tuple): Lookups or Prefetch objects
+            for prefetch_related().
+    """
+
+    select_related_fields: tuple[str, ...] = ()
+    prefetch_related_fields: tuple[str | Prefetch, ...] = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset: QuerySet) -> QuerySet:
+        """Return queryset loading related objects of the serializer."""
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        return queryset
@@ -1,13 +1,12 @@
 from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
 
+from apps.players.context import get_request_player
+
 
 class IsNotRegisteredPlayer(IsAuthenticated):
     def has_permission(self, request, view):
-        return bool(
-            request.user.is_authenticated
-            and request.user
-            and not request.user.player.is_registered
-        )
+        player = get_request_player(request)
+        return bool(player is not None and not player.is_registered)
 
     def has_object_permission(self, request, view, obj):
         return bool(request.user == obj.user or request.method in SAFE_METHODS)
@@ -15,8 +14,5 @@ class IsNotRegisteredPlayer(IsAuthenticated):
 
 class IsRegisteredPlayer(IsNotRegisteredPlayer):
     def has_permission(self, request, view):
-        return bool(
-            request.user.is_authenticated
-            and request.user
-            and request.user.player.is_registered
-        )
+        player = get_request_player(request)
+        return bool(player is not None and player.is_registered)
@@ -1,12 +1,15 @@
-from django.db import connection
-from django.db.models.signals import post_migrate, post_save
+from django.db import connection, transaction
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
 
-from apps.core.models import FAQ
+from apps.core.cache import invalidate_tags_on_commit
+from apps.core.constants import CURRENCIES_CACHE_TAG, FAQ_CACHE_TAG
+from apps.core.models import FAQ, CurrencyType
 from apps.core.utils import (
     initialize_faq,
 )
-from apps.notifications.models import NotificationsTime
+from apps.notifications.cache import notification_settings_cache
+from apps.notifications.models import NotificationsBase, NotificationsTime
 
 
 def table_exists(table_name):
@@ -35,12 +38,40 @@ def deactivate_other_notification_times(
         )
 
 
+@receiver(post_save, sender=NotificationsBase)
+@receiver(post_delete, sender=NotificationsBase)
+@receiver(post_save, sender=NotificationsTime)
+@receiver(post_delete, sender=NotificationsTime)
+def invalidate_notification_settings_cache(sender, **kwargs):
+    """
+    Invalidate cached notification templates and active notification time
+    settings when any of them is changed. Invalidated once more after
+    commit, so other processes can not cache uncommitted state.
+    """
+    notification_settings_cache.invalidate()
+    transaction.on_commit(notification_settings_cache.invalidate)
+
+
 @receiver(post_save, sender=FAQ)
 def deactivate_other_faqs(sender, instance: FAQ, **kwargs):
     """
     Ensure only one FAQ is active at a time.
     When an FAQ instance is saved and is marked as active,
     deactivate all other FAQ instances.
+    Cached FAQ payload is regenerated on the next request.
     """
     if instance.is_active:
         FAQ.objects.exclude(id=instance.id).update(is_active=False)
+    invalidate_tags_on_commit(FAQ_CACHE_TAG)
+
+
+@receiver(post_delete, sender=FAQ)
+def invalidate_faq_cache(sender, **kwargs):
+    """Regenerate cached FAQ payload when an FAQ is deleted."""
+    invalidate_tags_on_commit(FAQ_CACHE_TAG)
+
+
+@receiver([post_save, post_delete], sender=CurrencyType)
+def invalidate_currencies_cache(sender, **kwargs):
+    """Regenerate cached currencies list when currency types change."""
+    invalidate_tags_on_commit(CURRENCIES_CACHE_TAG)
@@ -5,6 +5,20 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.cache import (
+    CachedPayload,
+    build_payload,
+    get_or_set,
+    make_key,
+    payload_response,
+)
+from apps.core.constants import (
+    CURRENCIES_CACHE_TAG,
+    FAQ_CACHE_TAG,
+    FAQ_MAX_AGE,
+    REFERENCE_DATA_CACHE_TIMEOUT,
+    REFERENCE_DATA_MAX_AGE,
+)
 from apps.core.models import FAQ, CurrencyType
 from apps.core.permissions import IsRegisteredPlayer
 from apps.core.serializers import CurrencyListSerializer
@@ -13,6 +27,9 @@ from apps.core.serializers import CurrencyListSerializer
 class FAQView(APIView):
     """
     View to retrieve the active FAQ.
+    Served from cached pre-rendered JSON with ETag and Last-Modified
+    (FAQ.updated_at), so clients revalidating with If-None-Match or
+    If-Modified-Since get 304 without downloading the content again.
     """
 
     permission_classes = [IsRegisteredPlayer]
@@ -52,18 +69,35 @@ class FAQView(APIView):
         security=[{'Bearer': []}, {'JWT': []}],
     )
     def get(self, request, *args, **kwargs):
-        faq = FAQ.get_active()
-        if faq:
-            return Response({'faq': faq.content})
+        payload = get_or_set(
+            make_key('faq'),
+            self.build_payload,
+            timeout=REFERENCE_DATA_CACHE_TIMEOUT,
+            tags=[FAQ_CACHE_TAG],
+        )
+        if payload:
+            return payload_response(
+                request, payload, max_age=FAQ_MAX_AGE, private=True
+            )
         return Response(
             {'faq': 'No active FAQ available.'},
             status=status.HTTP_404_NOT_FOUND,
         )
 
+    @staticmethod
+    def build_payload() -> CachedPayload | None:
+        """Render active FAQ to JSON, None if there is no active FAQ."""
+        faq = FAQ.get_active()
+        if faq is None:
+            return None
+        return build_payload({'faq': faq.content}, faq.updated_at)
+
 
 class CurrenciesView(APIView):
     """
     View to retrieve all available currency types.
+    Served from cached pre-rendered JSON, cache is invalidated
+    when currency types or countries are changed.
     """
 
     permission_classes = [AllowAny]
@@ -80,8 +114,20 @@ class CurrenciesView(APIView):
     )
     def get(self, request, *args, **kwargs):
         """Retrieve all currency types."""
+        payload = get_or_set(
+            make_key('currencies'),
+            self.build_payload,
+            timeout=REFERENCE_DATA_CACHE_TIMEOUT,
+            tags=[CURRENCIES_CACHE_TAG],
+        )
+        return payload_response(
+            request, payload, max_age=REFERENCE_DATA_MAX_AGE
+        )
 
+    @staticmethod
+    def build_payload() -> CachedPayload:
+        """Render all currency types to JSON."""
         serializer = CurrencyListSerializer(
-            {'currencies': CurrencyType.objects.all()}
+            {'currencies': CurrencyType.objects.select_related('country')}
         )
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return build_payload(serializer.data)
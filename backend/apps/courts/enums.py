@@ -7,6 +7,12 @@ class LocationEnums(int, Enum):
     MAX_LATITUDE = 90
     MIN_LONGITUDE = -180
     MAX_LONGITUDE = 180
+    GEOHASH_LENGTH = 12
+    GEOHASH_MAX_CELLS = 9
+    EARTH_RADIUS_KM = 6371
+    DEFAULT_RADIUS_KM = 10
+    MAX_RADIUS_KM = 100
+    BATCH_SIZE = 1000
 
 
 class CourtEnums(int, Enum):
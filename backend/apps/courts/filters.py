@@ -1,19 +1,130 @@
+from django import forms
+from django.utils.translation import gettext_lazy as _
 from django_filters import rest_framework as filters
 
+from apps.courts.enums import LocationEnums
+from apps.courts.geo import box_filter, nearby_filter
+
 from .models import Court
 
+LOCATION_PREFIX = 'location__'
+
+
+class BoundingBoxField(forms.CharField):
+    """
+    Bounding box as 'min_lon,min_lat,max_lon,max_lat'.
+    min_lon greater than max_lon means the box crosses the antimeridian.
+    """
+
+    def to_python(self, value):
+        value = super().to_python(value)
+        if not value:
+            return None
+        try:
+            west, south, east, north = (float(v) for v in value.split(','))
+        except ValueError as e:
+            raise forms.ValidationError(
+                _('Expected min_lon,min_lat,max_lon,max_lat.')
+            ) from e
+        if not (
+            LocationEnums.MIN_LATITUDE.value
+            <= south
+            <= north
+            <= LocationEnums.MAX_LATITUDE.value
+        ):
+            raise forms.ValidationError(_('Invalid latitude range.'))
+        if not all(
+            LocationEnums.MIN_LONGITUDE.value
+            <= lon
+            <= LocationEnums.MAX_LONGITUDE.value
+            for lon in (west, east)
+        ):
+            raise forms.ValidationError(_('Invalid longitude range.'))
+        return south, west, north, east
+
+
+class BoundingBoxFilter(filters.Filter):
+    field_class = BoundingBoxField
+
+
+class CourtFilterForm(forms.Form):
+    def clean(self):
+        cleaned_data = super().clean()
+        if (cleaned_data.get('lat') is None) != (
+            cleaned_data.get('lon') is None
+        ):
+            raise forms.ValidationError(
+                _('Both lat and lon are required for the radius search.')
+            )
+        return cleaned_data
+
 
 class CourtFilter(filters.FilterSet):
     """Filter for the Court model.
 
     Filtering is performed by partial match of the court_name field
     in the related CourtLocation model.
+    Courts around the point are selected with lat, lon and radius in km
+    and ordered from the nearest one, courts inside the box are selected
+    with bbox. Both searches read locations by geohash prefixes.
     """
 
+    GEO_PARAMS = ('lat', 'lon', 'bbox')
+
     search = filters.CharFilter(
         field_name='location__court_name', lookup_expr='icontains'
     )
+    lat = filters.NumberFilter(
+        method='filter_nearby',
+        label=_('Latitude of the point'),
+        min_value=LocationEnums.MIN_LATITUDE.value,
+        max_value=LocationEnums.MAX_LATITUDE.value,
+    )
+    lon = filters.NumberFilter(
+        method='filter_nearby',
+        label=_('Longitude of the point'),
+        min_value=LocationEnums.MIN_LONGITUDE.value,
+        max_value=LocationEnums.MAX_LONGITUDE.value,
+    )
+    radius = filters.NumberFilter(
+        method='filter_nearby',
+        label=_(
+            f'Radius in km, default {LocationEnums.DEFAULT_RADIUS_KM.value}'
+        ),
+        min_value=0,
+        max_value=LocationEnums.MAX_RADIUS_KM.value,
+    )
+    bbox = BoundingBoxFilter(
+        method='filter_bbox', label=_('min_lon,min_lat,max_lon,max_lat')
+    )
 
     class Meta:
         model = Court
-        fields = ('search',)
+        fields = ('search', 'lat', 'lon', 'radius', 'bbox')
+        form = CourtFilterForm
+
+    def filter_nearby(self, queryset, name, value):
+        """Point filters are applied together in filter_queryset."""
+        return queryset
+
+    def filter_bbox(self, queryset, name, value):
+        if value is None:
+            return queryset
+        return box_filter(queryset, *value, prefix=LOCATION_PREFIX)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        latitude = self.form.cleaned_data.get('lat')
+        longitude = self.form.cleaned_data.get('lon')
+        if latitude is None:
+            return queryset
+        radius = self.form.cleaned_data.get('radius')
+        if radius is None:
+            radius = LocationEnums.DEFAULT_RADIUS_KM.value
+        return nearby_filter(
+            queryset,
+            float(latitude),
+            float(longitude),
+            float(radius),
+            prefix=LOCATION_PREFIX,
+        )
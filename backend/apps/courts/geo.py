@@ -0,0 +1,219 @@
+"""
+Geohash helpers for court location search on plain Postgres.
+
+Geohash interleaves longitude and latitude bits into a base32 string,
+so locations of one grid cell share the same prefix of the hash and
+a cell is read from an ordinary btree index with LIKE 'prefix%'.
+A radius search covers the bounding box of the circle with a few cells,
+reads candidates by prefixes and keeps only locations within the radius.
+"""
+
+import math
+
+from django.db import models
+from django.db.models.functions import (
+    ASin,
+    Cos,
+    Least,
+    Power,
+    Radians,
+    Sin,
+    Sqrt,
+)
+
+from apps.courts.enums import LocationEnums
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def cell_bits(precision: int) -> tuple[int, int]:
+    """Return numbers of longitude and latitude bits of the geohash."""
+    bits = precision * 5
+    return (bits + 1) // 2, bits // 2
+
+
+def encode_cell(x: int, y: int, precision: int) -> str:
+    """Return geohash of the cell with longitude and latitude indexes."""
+    lon_bits, lat_bits = cell_bits(precision)
+    value = 0
+    for bit in range(precision * 5):
+        if bit % 2 == 0:
+            lon_bits -= 1
+            value = (value << 1) | ((x >> lon_bits) & 1)
+        else:
+            lat_bits -= 1
+            value = (value << 1) | ((y >> lat_bits) & 1)
+    return ''.join(
+        BASE32[(value >> shift) & 31]
+        for shift in range((precision - 1) * 5, -1, -5)
+    )
+
+
+def cell_index(value: float, minimum: int, span: int, bits: int) -> int:
+    """Return index of the cell containing value, edges included."""
+    index = int((value - minimum) / span * (1 << bits))
+    return min(max(index, 0), (1 << bits) - 1)
+
+
+def encode(
+    latitude: float,
+    longitude: float,
+    precision: int = LocationEnums.GEOHASH_LENGTH.value,
+) -> str:
+    """Return geohash of the point."""
+    lon_bits, lat_bits = cell_bits(precision)
+    x = cell_index(longitude, LocationEnums.MIN_LONGITUDE.value, 360, lon_bits)
+    y = cell_index(latitude, LocationEnums.MIN_LATITUDE.value, 180, lat_bits)
+    return encode_cell(x, y, precision)
+
+
+def bounding_box(
+    latitude: float, longitude: float, radius: float
+) -> tuple[float, float, float, float]:
+    """
+    Return (south, west, north, east) of the circle with radius in km.
+    West and east are not wrapped, so a box crossing the antimeridian
+    has west < -180 or east > 180.
+    """
+    delta_lat = math.degrees(radius / LocationEnums.EARTH_RADIUS_KM.value)
+    south = max(latitude - delta_lat, LocationEnums.MIN_LATITUDE.value)
+    north = min(latitude + delta_lat, LocationEnums.MAX_LATITUDE.value)
+    widest = max(abs(south), abs(north))
+    if widest >= LocationEnums.MAX_LATITUDE.value:
+        return (
+            south,
+            LocationEnums.MIN_LONGITUDE.value,
+            north,
+            LocationEnums.MAX_LONGITUDE.value,
+        )
+    delta_lon = delta_lat / math.cos(math.radians(widest))
+    if delta_lon >= LocationEnums.MAX_LONGITUDE.value:
+        return (
+            south,
+            LocationEnums.MIN_LONGITUDE.value,
+            north,
+            LocationEnums.MAX_LONGITUDE.value,
+        )
+    return south, longitude - delta_lon, north, longitude + delta_lon
+
+
+def covering_cells(
+    south: float,
+    west: float,
+    north: float,
+    east: float,
+    max_cells: int = LocationEnums.GEOHASH_MAX_CELLS.value,
+) -> set[str]:
+    """
+    Return geohashes of cells covering the box.
+    The longest geohash is chosen, for which the box is covered by
+    at most max_cells cells, so every cell is one short index range scan.
+    """
+    for precision in range(LocationEnums.GEOHASH_LENGTH.value, 0, -1):
+        lon_bits, lat_bits = cell_bits(precision)
+        lon_cells = 1 << lon_bits
+        min_lon = LocationEnums.MIN_LONGITUDE.value
+        min_lat = LocationEnums.MIN_LATITUDE.value
+        first_x = math.floor((west - min_lon) / 360 * lon_cells)
+        last_x = math.floor((east - min_lon) / 360 * lon_cells)
+        columns = min(last_x - first_x + 1, lon_cells)
+        first_y = cell_index(south, min_lat, 180, lat_bits)
+        last_y = cell_index(north, min_lat, 180, lat_bits)
+        if columns * (last_y - first_y + 1) <= max_cells:
+            return {
+                encode_cell(x % lon_cells, y, precision)
+                for x in range(first_x, first_x + columns)
+                for y in range(first_y, last_y + 1)
+            }
+    return {''}
+
+
+def geohash_q(
+    south: float, west: float, north: float, east: float, prefix: str = ''
+) -> models.Q:
+    """
+    Return condition selecting locations from cells covering the box.
+    Arguments:
+        prefix (str): Lookup path to CourtLocation, e.g. 'location__'.
+    """
+    condition = models.Q()
+    for cell in covering_cells(south, west, north, east):
+        condition |= models.Q(**{f'{prefix}geohash__startswith': cell})
+    return condition
+
+
+def box_q(
+    south: float, west: float, north: float, east: float, prefix: str = ''
+) -> models.Q:
+    """
+    Return condition selecting locations inside the box.
+    The box crosses the antimeridian if west is greater than east.
+    Arguments:
+        prefix (str): Lookup path to CourtLocation, e.g. 'location__'.
+    """
+    if west > east:
+        east += 360
+    condition = geohash_q(south, west, north, east, prefix) & models.Q(
+        **{f'{prefix}latitude__range': (south, north)}
+    )
+    if east > LocationEnums.MAX_LONGITUDE.value:
+        return condition & (
+            models.Q(**{f'{prefix}longitude__gte': west})
+            | models.Q(**{f'{prefix}longitude__lte': east - 360})
+        )
+    return condition & models.Q(**{f'{prefix}longitude__range': (west, east)})
+
+
+def distance_expression(
+    latitude: float, longitude: float, prefix: str = ''
+) -> models.Func:
+    """
+    Return haversine distance in km from the point to location.
+    Arguments:
+        prefix (str): Lookup path to CourtLocation, e.g. 'location__'.
+    """
+    location_lat = Radians(f'{prefix}latitude')
+    location_lon = Radians(f'{prefix}longitude')
+    point_lat = math.radians(latitude)
+    point_lon = math.radians(longitude)
+    haversine = Power(Sin((location_lat - point_lat) / 2), 2) + Cos(
+        location_lat
+    ) * math.cos(point_lat) * Power(Sin((location_lon - point_lon) / 2), 2)
+    return (
+        2
+        * LocationEnums.EARTH_RADIUS_KM.value
+        * ASin(Least(Sqrt(haversine), 1.0), output_field=models.FloatField())
+    )
+
+
+def nearby_filter(
+    queryset: models.QuerySet,
+    latitude: float,
+    longitude: float,
+    radius: float,
+    prefix: str = '',
+) -> models.QuerySet:
+    """
+    Return queryset rows with location within radius in km from the point,
+    annotated with distance and ordered from the nearest one.
+    """
+    return (
+        queryset.filter(
+            geohash_q(*bounding_box(latitude, longitude, radius), prefix)
+        )
+        .annotate(distance=distance_expression(latitude, longitude, prefix))
+        .filter(distance__lte=radius)
+        .order_by('distance')
+    )
+
+
+def box_filter(
+    queryset: models.QuerySet,
+    south: float,
+    west: float,
+    north: float,
+    east: float,
+    prefix: str = '',
+) -> models.QuerySet:
+    """Return queryset rows with location inside the box."""
+    return queryset.filter(box_q(south, west, north, east, prefix))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.courts.models import CourtLocation
+
+
+class Command(BaseCommand):
+    """
+    Recompute geohash of every court location.
+    Run after adding the geohash column and whenever coordinates were
+    changed bypassing CourtLocation.save() (bulk updates, raw SQL).
+    """
+
+    help = 'Recompute geohash of court locations'
+
+    def handle(self, *args, **options):
+        updated = CourtLocation.objects.all().update_geohash()
+        self.stdout.write(
+            self.style.SUCCESS(f'Geohash updated for {updated} locations')
+        )
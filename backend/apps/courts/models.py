@@ -4,9 +4,39 @@ from django.utils.translation import gettext_lazy as _
 
 from apps.core.models import Tag
 from apps.courts.enums import CourtEnums, LocationEnums
+from apps.courts.geo import box_filter, encode, nearby_filter
 from apps.locations.models import City, Country
 
 
+class CourtLocationQuerySet(models.QuerySet):
+    def nearby(self, latitude: float, longitude: float, radius: float):
+        """
+        Returns locations within radius in km from the point,
+        annotated with distance and ordered from the nearest one.
+        """
+        return nearby_filter(self, latitude, longitude, radius)
+
+    def in_box(self, south: float, west: float, north: float, east: float):
+        """
+        Returns locations inside the box.
+        The box crosses the antimeridian if west is greater than east.
+        """
+        return box_filter(self, south, west, north, east)
+
+    def update_geohash(self) -> int:
+        """Recomputes geohash of the locations, returns changed count."""
+        changed = []
+        for location in self.only('pk', 'latitude', 'longitude', 'geohash'):
+            geohash = encode(location.latitude, location.longitude)
+            if location.geohash != geohash:
+                location.geohash = geohash
+                changed.append(location)
+        self.model.objects.bulk_update(
+            changed, ['geohash'], batch_size=LocationEnums.BATCH_SIZE.value
+        )
+        return len(changed)
+
+
 class CourtLocation(models.Model):
     """Court location model."""
 
@@ -55,6 +85,16 @@ class CourtLocation(models.Model):
     city = models.ForeignKey(
         City, verbose_name=_('City'), on_delete=models.SET_NULL, null=True
     )
+    geohash = models.CharField(
+        _('Geohash'),
+        max_length=LocationEnums.GEOHASH_LENGTH.value,
+        default='',
+        db_index=True,
+        editable=False,
+        help_text=_('Computed from latitude and longitude on save'),
+    )
+
+    objects = CourtLocationQuerySet.as_manager()
 
     class Meta:
         verbose_name = _('Location')
@@ -74,6 +114,13 @@ class CourtLocation(models.Model):
             return f'{self.country.name}, {self.city.name}'
         return None
 
+    def save(self, *args, **kwargs):
+        self.geohash = encode(self.latitude, self.longitude)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'geohash'}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.court_name
 
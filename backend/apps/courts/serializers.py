@@ -4,10 +4,29 @@ from rest_framework import serializers
 from apps.core.constants import ContactTypes
 from apps.core.models import Tag
 from apps.core.serializers import ContactCreateSerializer, ContactSerializer
+from apps.courts.enums import LocationEnums
 from apps.courts.models import Court, CourtLocation
 from apps.locations.models import City, Country
 
 
+class NearbyQuerySerializer(serializers.Serializer):
+    """Query parameters of the search around the point."""
+
+    lat = serializers.FloatField(
+        min_value=LocationEnums.MIN_LATITUDE.value,
+        max_value=LocationEnums.MAX_LATITUDE.value,
+    )
+    lon = serializers.FloatField(
+        min_value=LocationEnums.MIN_LONGITUDE.value,
+        max_value=LocationEnums.MAX_LONGITUDE.value,
+    )
+    radius = serializers.FloatField(
+        min_value=0,
+        max_value=LocationEnums.MAX_RADIUS_KM.value,
+        default=LocationEnums.DEFAULT_RADIUS_KM.value,
+    )
+
+
 class LocationSerializer(serializers.ModelSerializer):
     """Location serializer for all fields exclude id."""
 
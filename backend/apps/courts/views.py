@@ -8,6 +8,7 @@ from apps.core.permissions import IsRegisteredPlayer
 from apps.courts.filters import CourtFilter
 from apps.courts.models import Court
 from apps.courts.serializers import CourtSerializer
+from apps.players.context import get_request_player
 
 
 class CourtViewSet(mixins.ListModelMixin, GenericViewSet):
@@ -26,17 +27,30 @@ class CourtViewSet(mixins.ListModelMixin, GenericViewSet):
     permission_classes = [IsRegisteredPlayer]
 
     def get_queryset(self):
-        player = getattr(self.request.user, 'player', None)
-        country = getattr(player, 'country', None)
-        city = getattr(player, 'city', None)
-        if country is None or city is None:
+        player = get_request_player(self.request)
+        if any(
+            param in self.request.query_params
+            for param in CourtFilter.GEO_PARAMS
+        ):
+            return super().get_queryset()
+        if (
+            player is None
+            or player.country_id is None
+            or player.city_id is None
+        ):
             return super().get_queryset()
 
-        if country.name == 'Cyprus':
-            return super().get_queryset().filter(location__country=country)
+        if player.country.name == 'Cyprus':
+            return (
+                super()
+                .get_queryset()
+                .filter(location__country_id=player.country_id)
+            )
 
-        if country.name == 'Thailand':
-            return super().get_queryset().filter(location__city=city)
+        if player.country.name == 'Thailand':
+            return (
+                super().get_queryset().filter(location__city_id=player.city_id)
+            )
         return super().get_queryset()
 
     @swagger_auto_schema(
@@ -44,6 +58,11 @@ class CourtViewSet(mixins.ListModelMixin, GenericViewSet):
         operation_summary='List of filtered courts',
         operation_description="""
         **Returns:** a list of courts filtered depending on players location.
+
+        Pass `lat`, `lon` and optional `radius` in km to get courts
+        around the point ordered from the nearest one, or `bbox` as
+        `min_lon,min_lat,max_lon,max_lat` to get courts inside the box.
+        Geo search is not limited by the player location.
         """,
         responses={
             200: openapi.Response('Success', CourtSerializer(many=True)),
@@ -2,7 +2,7 @@ from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
 
 from apps.event.enums import EventIntEnums
-from apps.event.models import Game, GameInvitation, Tourney
+from apps.event.models import Game, GameInvitation, GameWaitlist, Tourney
 
 
 class BaseEventAdmin(admin.ModelAdmin):
@@ -44,3 +44,11 @@ class GameInvitationAdmin(admin.ModelAdmin):
     ordering = ('game',)
     empty_value_display = _('Not defined')
     list_per_page = EventIntEnums.ADMIN_LIST_PER_PAGE.value
+
+
+@admin.register(GameWaitlist)
+class GameWaitlistAdmin(admin.ModelAdmin):
+    list_display = ('id', 'game', 'player', 'created_at')
+    ordering = ('game', 'id')
+    empty_value_display = _('Not defined')
+    list_per_page = EventIntEnums.ADMIN_LIST_PER_PAGE.value
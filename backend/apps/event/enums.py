@@ -1,4 +1,4 @@
-from enum import IntEnum
+from enum import IntEnum, StrEnum
 
 
 class EventIntEnums(IntEnum):
@@ -14,3 +14,17 @@ class EventIntEnums(IntEnum):
     MAX_PLAYERS = 24
     MAX_TEAMS = 24
     MIN_TEAMS = 3
+
+    GAMES_PAGE_SIZE = 20
+    GAMES_MAX_PAGE_SIZE = 100
+
+    FEED_ROLE_LENGTH = 10
+    FEED_REBUILD_BATCH_SIZE = 5000
+
+
+class RelatedGamesStrategy(StrEnum):
+    """SQL shapes of the query for games related to a player."""
+
+    DISTINCT = 'distinct'
+    EXISTS = 'exists'
+    UNION = 'union'
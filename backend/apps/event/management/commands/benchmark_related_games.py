@@ -0,0 +1,170 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.core.models import CurrencyType
+from apps.courts.models import Court, CourtLocation
+from apps.event.enums import RelatedGamesStrategy
+from apps.event.models import Game
+from apps.players.models import Player
+
+User = get_user_model()
+
+BENCHMARK_PREFIX = 'benchmark_related_games'
+
+
+class Command(BaseCommand):
+    """
+    Compare SQL strategies of Game.objects.player_related_games().
+    Seeds players and games inside a transaction, measures upcoming and
+    archive queries of random players with every strategy and rolls
+    the transaction back, so the database is left unchanged.
+    """
+
+    help = 'Benchmark strategies of player related games query'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--players', type=int, default=2000, help='Players to seed'
+        )
+        parser.add_argument(
+            '--games', type=int, default=20000, help='Games to seed'
+        )
+        parser.add_argument(
+            '--players-per-game',
+            type=int,
+            default=10,
+            help='Participants of every seeded game',
+        )
+        parser.add_argument(
+            '--samples',
+            type=int,
+            default=50,
+            help='Number of random players to query',
+        )
+        parser.add_argument(
+            '--explain',
+            action='store_true',
+            help='Print EXPLAIN ANALYZE of every strategy',
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            players = self.seed(
+                options['players'],
+                options['games'],
+                options['players_per_game'],
+            )
+            sample = random.sample(
+                players, min(options['samples'], len(players))
+            )
+            for strategy in RelatedGamesStrategy:
+                self.benchmark(strategy, sample, options['explain'])
+            transaction.set_rollback(True)
+
+    def get_queries(self, player, strategy):
+        """Return hot queries built on player related games."""
+        current_time = timezone.now()
+        related = Game.objects.player_related_games(player, strategy)
+        return {
+            'upcoming': related.filter(start_time__gt=current_time).order_by(
+                'start_time'
+            ),
+            'archive': related.filter(end_time__lt=current_time).order_by(
+                '-end_time'
+            ),
+        }
+
+    def benchmark(self, strategy, players, explain):
+        timings = {}
+        for player in players:
+            for name, queryset in self.get_queries(player, strategy).items():
+                started = time.perf_counter()
+                list(queryset.values_list('pk', flat=True))
+                timings.setdefault(name, []).append(
+                    (time.perf_counter() - started) * 1000
+                )
+        for name, values in timings.items():
+            values.sort()
+            p95 = values[int(len(values) * 0.95) - 1 if len(values) > 1 else 0]
+            self.stdout.write(
+                f'{strategy.value:>8} {name:>8}: '
+                f'median {statistics.median(values):.3f} ms, '
+                f'p95 {p95:.3f} ms'
+            )
+        if explain:
+            for name, queryset in self.get_queries(
+                players[0], strategy
+            ).items():
+                self.stdout.write(f'{strategy.value} {name}:')
+                self.stdout.write(queryset.explain(analyze=True))
+
+    def seed(self, players_count, games_count, players_per_game):
+        """Create players with games and return the players."""
+        self.stdout.write(
+            f'Seeding {players_count} players and {games_count} games...'
+        )
+        users = User.objects.bulk_create(
+            User(
+                username=f'{BENCHMARK_PREFIX}_{i}',
+                first_name='Benchmark',
+                last_name=str(i),
+            )
+            for i in range(players_count)
+        )
+        players = Player.objects.bulk_create(
+            Player(user=user, is_registered=True) for user in users
+        )
+        location = CourtLocation.objects.create(
+            longitude=0,
+            latitude=0,
+            court_name=BENCHMARK_PREFIX,
+        )
+        court = Court.objects.create(location=location)
+        currency_type = CurrencyType.objects.first()
+        if currency_type is None:
+            currency_type = CurrencyType.objects.create(
+                currency_type=CurrencyType.CurrencyTypeChoices.EUR,
+                currency_name=CurrencyType.CurrencyNameChoices.EUR,
+            )
+        current_time = timezone.now()
+        games = []
+        for _ in range(games_count):
+            start_time = current_time + timedelta(
+                hours=random.randint(-24 * 365, 24 * 30)
+            )
+            games.append(
+                Game(
+                    host=random.choice(players),
+                    court=court,
+                    message=BENCHMARK_PREFIX,
+                    start_time=start_time,
+                    end_time=start_time + timedelta(hours=2),
+                    max_players=players_per_game,
+                    payment_type='CASH',
+                    payment_account='Cash money',
+                    currency_type=currency_type,
+                )
+            )
+        games = Game.objects.bulk_create(games, batch_size=5000)
+        through = Game.players.through
+        through.objects.bulk_create(
+            (
+                through(game_id=game.pk, player_id=player.pk)
+                for game in games
+                for player in random.sample(
+                    players, min(players_per_game, len(players))
+                )
+            ),
+            batch_size=10000,
+        )
+        with connection.cursor() as cursor:
+            for model in (Game, through, Player):
+                cursor.execute(f'ANALYZE {model._meta.db_table}')
+        return players
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.event.models import PlayerEventFeed
+
+
+class Command(BaseCommand):
+    """
+    Recreate the player event feed from games, their players and
+    invitations. Run after adding the feed table and whenever games were
+    changed bypassing the model signals (raw SQL, bulk updates).
+    """
+
+    help = 'Rebuild the player event feed from scratch'
+
+    def handle(self, *args, **options):
+        created = PlayerEventFeed.objects.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f'Player event feed rebuilt: {created} rows')
+        )
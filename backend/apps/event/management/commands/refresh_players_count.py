@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.event.models import Game
+
+
+class Command(BaseCommand):
+    """
+    Recount players of every game into Game.current_players.
+    Run after adding the counter column and whenever players were changed
+    bypassing the relation managers (raw SQL, cascade deletes of players).
+    """
+
+    help = 'Recount current players of games'
+
+    def handle(self, *args, **options):
+        updated = Game.objects.all().refresh_players_count()
+        self.stdout.write(
+            self.style.SUCCESS(f'Players recounted for {updated} games')
+        )
@@ -76,6 +76,30 @@ class EventMixin(m.Model):
     class Meta:
         abstract = True
         ordering = ('start_time',)
+        # Time window queries: upcoming games of host or court,
+        # archive and rate notifications by end time. Partial indexes
+        # cover active events, which are most of the queried rows.
+        indexes = [
+            m.Index(
+                fields=['host', 'start_time'],
+                name='%(class)s_host_start_idx',
+            ),
+            m.Index(
+                fields=['court', 'start_time'],
+                name='%(class)s_court_start_idx',
+            ),
+            m.Index(fields=['end_time'], name='%(class)s_end_time_idx'),
+            m.Index(
+                fields=['start_time'],
+                name='%(class)s_active_start_idx',
+                condition=m.Q(is_active=True),
+            ),
+            m.Index(
+                fields=['end_time'],
+                name='%(class)s_active_end_idx',
+                condition=m.Q(is_active=True),
+            ),
+        ]
 
 
 class StatsQuerySetMixin:
@@ -1,55 +1,98 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date
+from itertools import chain
 
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.db import models as m
+from django.db.models.functions import Coalesce, Greatest
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
 from apps.core.mixins.created_updated import CreatedUpdatedMixin
-from apps.event.enums import EventIntEnums
+from apps.courts.geo import nearby_filter
+from apps.event.enums import EventIntEnums, RelatedGamesStrategy
 from apps.event.mixins import EventMixin, StatsQuerySetMixin
 
+# Feed rows collected by PlayerEventFeedQuerySet.batch().
+_feed_batch = ContextVar('feed_batch', default=None)
+
 
 class GameQuerySet(m.query.QuerySet, StatsQuerySetMixin):
     def player_located_games(self, player):
         """Basic queryset for games."""
-        country = getattr(player, 'country', None)
-        city = getattr(player, 'city', None)
-        if country is None or city is None:
+        if player.country_id is None or player.city_id is None:
             return self
         if player.country.name == 'Cyprus':
-            return self.filter(court__location__country=player.country)
+            return self.filter(court__location__country_id=player.country_id)
         if player.country.name == 'Thailand':
-            return self.filter(court__location__city=player.city)
+            return self.filter(court__location__city_id=player.city_id)
         return self
 
-    def player_related_games(self, player):
-        """Returns games in which the user is a host or player."""
+    def player_related_games(self, player, strategy=None):
+        """
+        Returns games in which the user is a host or player.
+        Strategy selects SQL shape of the query, all return the same games:
+            distinct: OR over join with players table and DISTINCT.
+            exists: host condition OR EXISTS subquery on players table.
+            union: id IN (host games UNION participant games).
+        Defaults to settings.GAME_RELATED_GAMES_STRATEGY.
+        """
+        strategy = RelatedGamesStrategy(
+            strategy or settings.GAME_RELATED_GAMES_STRATEGY
+        )
+        if strategy == RelatedGamesStrategy.EXISTS:
+            return self.filter(
+                m.Q(host=player)
+                | m.Exists(
+                    self.model.players.through.objects.filter(
+                        game=m.OuterRef('pk'), player=player
+                    )
+                )
+            )
+        if strategy == RelatedGamesStrategy.UNION:
+            host_games = self.model.objects.filter(host=player).values('pk')
+            participant_games = self.model.players.through.objects.filter(
+                player=player
+            ).values('game_id')
+            return self.filter(pk__in=host_games.union(participant_games))
         return self.filter(m.Q(host=player) | m.Q(players=player)).distinct()
 
     def future_games(self):
-        """Returns games with start_time in the future."""
+        """Returns active games with start_time in the future."""
         current_time = now()
-        return self.filter(start_time__gt=current_time).order_by('start_time')
+        return self.filter(
+            is_active=True, start_time__gt=current_time
+        ).order_by('start_time')
+
+    def feed_games(self, player, *roles):
+        """
+        Returns active upcoming games in which the user has one of the roles.
+        Games are selected by a range scan of the player event feed.
+        """
+        return self.filter(
+            is_active=True,
+            pk__in=PlayerEventFeed.objects.upcoming(player, roles).values(
+                'game_id'
+            ),
+        ).order_by('start_time')
 
     def invited_games(self, player):
         """Returns games in which the user was invited."""
-        return (
-            self.player_located_games(player)
-            .future_games()
-            .filter(game_invites__invited=player)
+        return self.player_located_games(player).feed_games(
+            player, PlayerEventFeed.Roles.INVITED
         )
 
     def upcoming_games(self, player):
         """Returns upcoming games in which the user is a host or player."""
-        return self.player_related_games(player).future_games()
+        return self.feed_games(
+            player, PlayerEventFeed.Roles.HOST, PlayerEventFeed.Roles.PLAYER
+        )
 
     def my_upcoming_games(self, player):
         """Returns upcoming games in which the user is a host."""
-        return self.upcoming_games(player).filter(host=player)
-
-    def nearest_game(self, player):
-        """Returns nearest upcoming game where user is a host or player."""
-        return self.upcoming_games(player).first()
+        return self.feed_games(player, PlayerEventFeed.Roles.HOST)
 
     def archive_games(self, player):
         """Returns past games in which the user is a host or player."""
@@ -64,10 +107,35 @@ class GameQuerySet(m.query.QuerySet, StatsQuerySetMixin):
         """Returns recent past games in which the user is a host or player."""
         return self.archive_games(player).order_by('-start_time')[:limit]
 
+    def nearby_games(self, latitude, longitude, radius):
+        """
+        Returns upcoming public games on courts within radius in km
+        from the point, ordered from the nearest court.
+        """
+        games = self.filter(
+            is_private=False, is_active=True, start_time__gt=now()
+        )
+        return nearby_filter(
+            games, latitude, longitude, radius, prefix='court__location__'
+        ).order_by('distance', 'start_time', 'id')
+
     def get_stats_for_day(self, day: date) -> int:
         """Returns number of games created on a specific day."""
         return self.filter(created_at__date=day).count()
 
+    def refresh_players_count(self) -> int:
+        """Recounts players of the games into current_players."""
+        players_count = (
+            self.model.players.through.objects.filter(game=m.OuterRef('pk'))
+            .order_by()
+            .values('game')
+            .annotate(count=m.Count('pk'))
+            .values('count')
+        )
+        return self.update(
+            current_players=Coalesce(m.Subquery(players_count), 0)
+        )
+
 
 class GameManager(m.Manager):
     def get_queryset(self):
@@ -85,14 +153,18 @@ class GameManager(m.Manager):
         """
         return self.get_queryset().player_located_games(player)
 
-    def player_related_games(self, player):
+    def player_related_games(self, player, strategy=None):
         """Returns games in which the user is a host or player."""
-        return self.get_queryset().player_related_games(player)
+        return self.get_queryset().player_related_games(player, strategy)
 
     def invited_games(self, player):
         """Returns games in which the user was invited."""
         return self.get_queryset().invited_games(player)
 
+    def future_games(self):
+        """Returns active games with start_time in the future."""
+        return self.get_queryset().future_games()
+
     def upcoming_games(self, player):
         """Returns upcoming games in which the user is a host or player."""
         return self.get_queryset().upcoming_games(player)
@@ -105,13 +177,39 @@ class GameManager(m.Manager):
         """Returns past games in which the user is a host or player."""
         return self.get_queryset().archive_games(player)
 
-    def nearest_game(self, player):
-        """Returns nearest upcoming game where user is a host or player."""
-        return self.get_queryset().nearest_game(player)
-
     def recent_games(self, player, limit):
         return self.get_queryset().recent_games(player, limit)
 
+    def nearby_games(self, latitude, longitude, radius):
+        """
+        Returns upcoming public games on courts within radius in km
+        from the point, ordered from the nearest court.
+        Courts are selected by geohash prefixes of their locations,
+        so the query reads only a few index ranges of locations.
+        """
+        return self.get_queryset().nearby_games(latitude, longitude, radius)
+
+    def preview(self, player) -> dict:
+        """
+        Returns start time of the nearest upcoming game where user is a host
+        or player and number of games the user is invited to.
+        Both values are aggregated in one query over the player event feed,
+        inactive games are skipped.
+        """
+        roles = PlayerEventFeed.Roles
+        return PlayerEventFeed.objects.filter(
+            player=player, game__is_active=True
+        ).aggregate(
+            upcoming_game_time=m.Min(
+                'start_time',
+                filter=m.Q(
+                    role__in=(roles.HOST, roles.PLAYER),
+                    start_time__gt=now(),
+                ),
+            ),
+            invites=m.Count('pk', filter=m.Q(role=roles.INVITED)),
+        )
+
     def stats_for_day(self, day: date) -> int:
         """Returns number of games created on a specific day."""
         return self.get_queryset().get_stats_for_day(day)
@@ -153,6 +251,43 @@ class GameInvitation(m.Model):
         return str(_(f'Invitation in {self.game} for {self.invited}'))
 
 
+class GameWaitlist(m.Model):
+    """Queue of players waiting for a free place in the full game."""
+
+    game = m.ForeignKey(
+        'event.Game', on_delete=m.CASCADE, related_name='waitlist'
+    )
+
+    player = m.ForeignKey(
+        'players.Player', on_delete=m.CASCADE, related_name='game_waitlists'
+    )
+
+    created_at = m.DateTimeField(
+        verbose_name=_('Created at'),
+        auto_now_add=True,
+    )
+
+    class Meta:
+        verbose_name = _('Game waitlist entry')
+        verbose_name_plural = _('Game waitlist entries')
+        ordering = ('id',)
+        constraints = [
+            m.UniqueConstraint(
+                fields=('game', 'player'), name='unique_game_waitlist_player'
+            )
+        ]
+
+    def __str__(self):
+        return str(_(f'{self.player} is waiting for {self.game}'))
+
+    @property
+    def position(self) -> int:
+        """Position of the player in the waitlist, starting from 1."""
+        return GameWaitlist.objects.filter(
+            game_id=self.game_id, pk__lte=self.pk
+        ).count()
+
+
 class Game(EventMixin, CreatedUpdatedMixin):
     """Game model."""
 
@@ -168,6 +303,11 @@ class Game(EventMixin, CreatedUpdatedMixin):
         related_name='games_players',
         blank=True,
     )
+    current_players = m.PositiveIntegerField(
+        verbose_name=_('Current number of players'),
+        default=0,
+        editable=False,
+    )
     objects = GameManager()
 
     def __str__(self):
@@ -180,10 +320,98 @@ class Game(EventMixin, CreatedUpdatedMixin):
         )
         return name[: EventIntEnums.STR_MAX_LEN.value]
 
+    def add_player(self, player) -> bool:
+        """
+        Adds the player to the game if there is a free place.
+        The place is taken with one conditional UPDATE of current_players,
+        the row lock orders parallel joins and the condition is rechecked
+        on the locked row, so the game can not be overbooked.
+        Returns True if the player takes part in the game.
+        """
+        with transaction.atomic():
+            has_place = Game.objects.filter(
+                pk=self.pk, current_players__lt=m.F('max_players')
+            ).update(current_players=m.F('current_players') + 1)
+            if not has_place:
+                return self.players.filter(pk=player.pk).exists()
+            try:
+                with transaction.atomic():
+                    # The through row is saved directly: players.add()
+                    # would send m2m_changed and count the player twice.
+                    self.players.through.objects.create(
+                        game=self, player=player
+                    )
+            except IntegrityError:
+                # Already joined, release the taken place.
+                transaction.set_rollback(True)
+                return True
+            PlayerEventFeed.objects.add(
+                PlayerEventFeed.Roles.PLAYER, [self], [player.pk]
+            )
+        self.refresh_from_db(fields=['players', 'current_players'])
+        return True
+
+    def remove_player(self, player) -> bool:
+        """
+        Removes the player from the game and gives the free place
+        to the first player of the waitlist in the same transaction.
+        Returns False if the player does not take part in the game.
+        """
+        with transaction.atomic():
+            removed = self.players.through.objects.filter(
+                game=self, player=player
+            ).delete()[0]
+            if not removed:
+                return False
+            PlayerEventFeed.objects.filter(
+                game=self, player=player, role=PlayerEventFeed.Roles.PLAYER
+            ).delete()
+            Game.objects.filter(pk=self.pk).update(
+                current_players=Greatest(m.F('current_players') - 1, 0)
+            )
+            self.promote_waitlist()
+        self.refresh_from_db(fields=['players', 'current_players'])
+        return True
+
+    def promote_waitlist(self) -> list[int]:
+        """
+        Moves the first waiting players to free places of the game.
+        Waitlist rows are taken with FOR UPDATE SKIP LOCKED, so parallel
+        promotions never take the same player. Invitations of promoted
+        players are deleted, the players are notified after commit.
+        Returns ids of the promoted players.
+        """
+        from apps.notifications.tasks import send_waitlist_promotion_task
+
+        promoted = []
+        waiting = (
+            self.waitlist.select_related('player')
+            .select_for_update(skip_locked=True, of=('self',))
+            .order_by('id')
+        )
+        with transaction.atomic():
+            while (entry := waiting.first()) is not None:
+                if not self.add_player(entry.player):
+                    break
+                entry.delete()
+                # Deleting invitations removes their INVITED feed rows too.
+                GameInvitation.objects.filter(
+                    game=self, invited=entry.player
+                ).delete()
+                promoted.append(entry.player_id)
+            if promoted:
+                transaction.on_commit(
+                    lambda: send_waitlist_promotion_task.delay(
+                        self.id, promoted
+                    )
+                )
+        return promoted
+
     class Meta:
         verbose_name = _('Game')
         verbose_name_plural = _('Games')
         default_related_name = 'games'
+        indexes = EventMixin.Meta.indexes
 
 
 class Tourney(EventMixin, CreatedUpdatedMixin):
@@ -215,3 +443,162 @@ class Tourney(EventMixin, CreatedUpdatedMixin):
         verbose_name = _('Tourney')
         verbose_name_plural = _('Tourneys')
         default_related_name = 'tournaments'
+        indexes = EventMixin.Meta.indexes
+
+
+class PlayerEventFeedQuerySet(m.QuerySet):
+    def upcoming(self, player, roles):
+        """Returns upcoming feed rows of the player with one of the roles."""
+        return self.filter(player=player, role__in=roles, start_time__gt=now())
+
+    def add(self, role, games, player_ids):
+        """
+        Adds feed rows of the role for every player in every game.
+        Inside batch() the rows are only collected.
+        """
+        rows = [
+            self.model(
+                player_id=player_id,
+                game_id=game.pk,
+                role=role,
+                start_time=game.start_time,
+                end_time=game.end_time,
+            )
+            for game in games
+            for player_id in player_ids
+        ]
+        batch = _feed_batch.get()
+        if batch is not None:
+            batch.extend(rows)
+            return
+        self.bulk_create(rows, ignore_conflicts=True)
+
+    @contextmanager
+    def batch(self):
+        """
+        Collects rows added inside the block, including the ones added
+        by receivers, and creates them with one INSERT on exit.
+        """
+        if _feed_batch.get() is not None:
+            yield
+            return
+        rows = []
+        token = _feed_batch.set(rows)
+        try:
+            yield
+        finally:
+            _feed_batch.reset(token)
+        self.bulk_create(rows, ignore_conflicts=True)
+
+    def rebuild(self) -> int:
+        """
+        Recreates the feed from games, their players and invitations.
+        Returns number of created rows.
+        """
+        roles = self.model.Roles
+        batch_size = EventIntEnums.FEED_REBUILD_BATCH_SIZE.value
+        sources = (
+            (
+                roles.HOST,
+                Game.objects.values_list(
+                    'host_id', 'pk', 'start_time', 'end_time'
+                ),
+            ),
+            (
+                roles.PLAYER,
+                Game.players.through.objects.values_list(
+                    'player_id',
+                    'game_id',
+                    'game__start_time',
+                    'game__end_time',
+                ),
+            ),
+            (
+                roles.INVITED,
+                GameInvitation.objects.values_list(
+                    'invited_id',
+                    'game_id',
+                    'game__start_time',
+                    'game__end_time',
+                ).distinct(),
+            ),
+        )
+        rows = chain.from_iterable(
+            (
+                self.model(
+                    player_id=player_id,
+                    game_id=game_id,
+                    role=role,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+                for player_id, game_id, start_time, end_time in (
+                    queryset.iterator(chunk_size=batch_size)
+                )
+            )
+            for role, queryset in sources
+        )
+        created = 0
+        with transaction.atomic():
+            self.all().delete()
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) == batch_size:
+                    created += len(self.bulk_create(batch))
+                    batch = []
+            created += len(self.bulk_create(batch))
+        return created
+
+
+class PlayerEventFeed(m.Model):
+    """
+    Denormalized feed of the games related to the player.
+    One row per role of the player in the game, start and end time
+    are copied from the game, so the home screen lists are range scans
+    of the player rows. Kept in sync by apps.event.signals.
+    """
+
+    class Roles(m.TextChoices):
+        HOST = 'host', _('Host')
+        PLAYER = 'player', _('Player')
+        INVITED = 'invited', _('Invited')
+
+    # Both keys are covered by the composite indexes below.
+    player = m.ForeignKey(
+        'players.Player',
+        on_delete=m.CASCADE,
+        related_name='event_feed',
+        db_index=False,
+    )
+    game = m.ForeignKey(
+        'event.Game', on_delete=m.CASCADE, related_name='feed', db_index=False
+    )
+    role = m.CharField(
+        verbose_name=_('Role'),
+        max_length=EventIntEnums.FEED_ROLE_LENGTH.value,
+        choices=Roles.choices,
+    )
+    start_time = m.DateTimeField(verbose_name=_('Start date and time'))
+    end_time = m.DateTimeField(verbose_name=_('End date and time'))
+
+    objects = PlayerEventFeedQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _('Player event feed')
+        verbose_name_plural = _('Player event feed')
+        constraints = [
+            m.UniqueConstraint(
+                fields=('game', 'player', 'role'),
+                name='unique_player_event_feed_role',
+            )
+        ]
+        indexes = [
+            m.Index(
+                fields=['player', 'role', 'start_time'],
+                name='event_feed_role_start_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.player_id} {self.role} {self.game_id}'
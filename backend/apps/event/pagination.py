@@ -0,0 +1,138 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from django.db import models as m
+from django.utils.translation import gettext_lazy as _
+from drf_yasg import openapi
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from apps.event.enums import EventIntEnums
+
+
+class GameKeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination for game lists.
+    Games are ordered by (ordering_field, id) and the next page is
+    selected by comparison with the last game of the previous page
+    instead of OFFSET, so deep pages cost the same as the first one.
+    Pagination is opt-in: lists are paginated only when the request has
+    `cursor` or `page_size` query parameter.
+    Arguments:
+        ordering_field (str): Datetime field to order games by.
+        descending (bool): Order from the latest games.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = EventIntEnums.GAMES_PAGE_SIZE.value
+    max_page_size = EventIntEnums.GAMES_MAX_PAGE_SIZE.value
+    invalid_cursor_message = _('Invalid cursor')
+
+    def __init__(self, ordering_field: str, descending: bool = False):
+        self.ordering_field = ordering_field
+        self.descending = descending
+        self.next_position = None
+        self.request = None
+
+    def is_requested(self, request) -> bool:
+        """Check if client asked for paginated list."""
+        return (
+            self.cursor_query_param in request.query_params
+            or self.page_size_query_param in request.query_params
+        )
+
+    def get_ordering(self) -> tuple[str, str]:
+        if self.descending:
+            return f'-{self.ordering_field}', '-id'
+        return self.ordering_field, 'id'
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def encode_cursor(self, position: tuple[datetime, int]) -> str:
+        value, pk = position
+        data = json.dumps({'v': value.isoformat(), 'id': pk})
+        return urlsafe_b64encode(data.encode()).decode()
+
+    def decode_cursor(self, request) -> tuple[datetime, int] | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            data = json.loads(urlsafe_b64decode(encoded.encode()))
+            return datetime.fromisoformat(data['v']), int(data['id'])
+        except (TypeError, ValueError, KeyError) as e:
+            raise NotFound(self.invalid_cursor_message) from e
+
+    def filter_after(self, queryset, position: tuple[datetime, int]):
+        """Return games following the position in the list order."""
+        value, pk = position
+        lookup = 'lt' if self.descending else 'gt'
+        return queryset.filter(
+            m.Q(**{f'{self.ordering_field}__{lookup}': value})
+            | m.Q(**{self.ordering_field: value, f'id__{lookup}': pk})
+        )
+
+    def paginate_queryset(self, queryset, request, view=None) -> list:
+        self.request = request
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.get_ordering())
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = self.filter_after(queryset, position)
+        games = list(queryset[: page_size + 1])
+        page = games[:page_size]
+        if len(games) > page_size:
+            last = page[-1]
+            self.next_position = (
+                getattr(last, self.ordering_field),
+                last.pk,
+            )
+        return page
+
+    def get_next_link(self) -> str | None:
+        if self.next_position is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(self.next_position),
+        )
+
+    def get_paginated_response(self, data) -> Response:
+        return Response({'games': data, 'next': self.get_next_link()})
+
+
+GAME_PAGINATION_PARAMETERS = [
+    openapi.Parameter(
+        GameKeysetPagination.cursor_query_param,
+        openapi.IN_QUERY,
+        description=(
+            'Cursor of the page from the `next` link. '
+            'The list is paginated if the parameter is passed.'
+        ),
+        type=openapi.TYPE_STRING,
+        required=False,
+    ),
+    openapi.Parameter(
+        GameKeysetPagination.page_size_query_param,
+        openapi.IN_QUERY,
+        description=(
+            'Number of games on the page, '
+            f'max {GameKeysetPagination.max_page_size}. '
+            'The list is paginated if the parameter is passed.'
+        ),
+        type=openapi.TYPE_INTEGER,
+        required=False,
+    ),
+]
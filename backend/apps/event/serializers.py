@@ -1,18 +1,32 @@
+from django.db import transaction
+from django.db.models import Prefetch
 from django.utils import timezone
-from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
 from apps.core.constants import GenderChoices
+from apps.core.mixins.eager_loading import EagerLoadingMixin
 from apps.core.models import CurrencyType, GameLevel
 from apps.courts.models import Court
 from apps.courts.serializers import LocationSerializer
 from apps.event.enums import EventIntEnums
-from apps.event.models import Game, GameInvitation
+from apps.event.models import Game, GameInvitation, PlayerEventFeed
+from apps.notifications.tasks import send_invite_notifications_task
 from apps.players.models import Payment, Player
 from apps.players.serializers import PlayerGameSerializer
 
+# Related objects read by PlayerGameSerializer of the game host.
+HOST_RELATED_FIELDS = ('host__user', 'host__rating')
+# Related objects read by LocationSerializer of the game court.
+COURT_LOCATION_RELATED_FIELDS = (
+    'court__location__country',
+    'court__location__city',
+)
+
+
+class BaseGameSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    select_related_fields = ('currency_type',)
+    prefetch_related_fields = ('player_levels',)
 
-class BaseGameSerializer(serializers.ModelSerializer):
     game_id = serializers.IntegerField(source='pk', read_only=True)
 
     start_time = serializers.DateTimeField(format='iso-8601')
@@ -79,10 +93,20 @@ class BaseGameSerializer(serializers.ModelSerializer):
 
 
 class GameSerializer(BaseGameSerializer):
-    """Uses for create requests."""
+    """
+    Uses for create requests.
+    Invited players are validated with a few set-based queries and
+    the game is created with all invitations in one transaction.
+    """
+
+    prefetch_related_fields = BaseGameSerializer.prefetch_related_fields + (
+        'players',
+    )
 
-    players = serializers.PrimaryKeyRelatedField(
-        queryset=Player.objects.all(), many=True, required=False
+    players = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        write_only=True,
     )
     court_id = serializers.PrimaryKeyRelatedField(
         source='court', queryset=Court.objects.all()
@@ -122,35 +146,26 @@ class GameSerializer(BaseGameSerializer):
     def create(self, validated_data):
         host = self.context['request'].user.player
         validated_data['host'] = host
-        players = validated_data.pop('players')
+        player_ids = validated_data.pop('players', [])
         levels = validated_data.pop('player_levels')
 
-        game = Game.objects.create(
-            currency_type=self.get_currency_type(),
-            payment_account=self.get_payment_account(
-                validated_data['payment_type']
-            ),
-            **validated_data,
-        )
-
-        game.players.add(host)
-        game.player_levels.set(levels)
-        for player in players:
-            serializer = GameInviteSerializer(
-                data={
-                    'host': game.host.id,
-                    'invited': player.id,
-                    'game': game.id,
-                },
-                context=self.context,
+        with transaction.atomic(), PlayerEventFeed.objects.batch():
+            game = Game.objects.create(
+                currency_type=self.get_currency_type(),
+                payment_account=self.get_payment_account(
+                    validated_data['payment_type']
+                ),
+                **validated_data,
             )
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
+            game.players.add(host)
+            game.player_levels.add(*levels)
+            if player_ids:
+                GameInviteListSerializer.invite(host, game, player_ids)
         return game
 
     def validate_players(self, value):
         host = self.context['request'].user.player
-        if host in value:
+        if host.id in value:
             raise serializers.ValidationError('You can not invite yourself.')
         if len(value) != len(set(value)):
             raise serializers.ValidationError(
@@ -158,10 +173,59 @@ class GameSerializer(BaseGameSerializer):
             )
         return value
 
+    def validate(self, value):
+        value = super().validate(value)
+        player_ids = value.get('players')
+        if player_ids:
+            self.validate_players_levels(
+                player_ids, [level.name for level in value['player_levels']]
+            )
+        return value
+
+    @staticmethod
+    def validate_players_levels(player_ids, levels):
+        """Validate invited players exist and have allowed levels."""
+        grades = dict(
+            Player.objects.filter(id__in=player_ids).values_list(
+                'id', 'rating__grade'
+            )
+        )
+        messages = serializers.PrimaryKeyRelatedField.default_error_messages
+        for pk in player_ids:
+            if pk not in grades:
+                raise serializers.ValidationError(
+                    {'players': messages['does_not_exist'].format(pk_value=pk)}
+                )
+        for pk in player_ids:
+            if grades[pk] not in levels:
+                raise serializers.ValidationError(
+                    {
+                        'players': f'Level of the player {grades[pk]} '
+                        'not allowed in this game. '
+                        f'Allowed levels: {", ".join(levels)}'
+                    }
+                )
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data['players'] = [player.pk for player in instance.players.all()]
+        return data
+
 
 class GameDetailSerializer(BaseGameSerializer):
     """Game serializer uses for retrieve requests."""
 
+    select_related_fields = (
+        BaseGameSerializer.select_related_fields
+        + HOST_RELATED_FIELDS
+        + COURT_LOCATION_RELATED_FIELDS
+    )
+    prefetch_related_fields = BaseGameSerializer.prefetch_related_fields + (
+        Prefetch(
+            'players', queryset=Player.objects.select_related('user', 'rating')
+        ),
+    )
+
     host = PlayerGameSerializer()
 
     court_location = LocationSerializer(source='court.location')
@@ -177,44 +241,118 @@ class GameDetailSerializer(BaseGameSerializer):
         ]
 
 
-class GameInviteSerializer(serializers.ModelSerializer):
-    invited = serializers.PrimaryKeyRelatedField(
-        write_only=True, queryset=Player.objects.all()
+class GameInviteListSerializer(serializers.Serializer):
+    """
+    Invites a list of players to the game from context.
+    All players are validated with a few set-based queries, invitations
+    are created with one INSERT and invited players get one batch
+    of notifications after commit.
+    """
+
+    players = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False
     )
 
-    class Meta:
-        model = GameInvitation
-        fields = ('host', 'invited', 'game')
-        validators = [
-            serializers.UniqueTogetherValidator(
-                queryset=GameInvitation.objects.all(),
-                fields=('host', 'invited', 'game'),
-                message=_('This invitation already exists!'),
+    def validate_players(self, value):
+        if len(value) != len(set(value)):
+            raise serializers.ValidationError(
+                'The players should not repeat themselves.'
             )
-        ]
+        return value
 
     def validate(self, attrs):
-        host = attrs.get('host')
-        invited = attrs.get('invited')
-        game = attrs.get('game')
-        levels = [level.name for level in game.player_levels.all()]
-        if host == invited:
+        game = self.context['game']
+        host = self.context['request'].user.player
+        player_ids = attrs['players']
+        self.validate_invited(
+            host,
+            player_ids,
+            game.player_levels.values_list('name', flat=True),
+        )
+        self.check_players(
+            game.players.filter(id__in=player_ids).values_list(
+                'id', flat=True
+            ),
+            'These players are already participate in the game',
+        )
+        self.check_players(
+            GameInvitation.objects.filter(
+                host=host, game=game, invited_id__in=player_ids
+            ).values_list('invited_id', flat=True),
+            'These players have already been invited',
+        )
+        return attrs
+
+    @classmethod
+    def validate_invited(cls, host, player_ids, levels):
+        """Validate the host can invite players to a game of levels."""
+        if host.id in player_ids:
             raise serializers.ValidationError(
                 {'invited': 'You can not invite yourself.'}
             )
-        if invited in game.players.all():
-            raise serializers.ValidationError(
-                {'invited': 'This player is already participate in the game.'}
+        grades = dict(
+            Player.objects.filter(id__in=player_ids).values_list(
+                'id', 'rating__grade'
             )
-        if invited.rating.grade not in levels:
+        )
+        cls.check_players(
+            set(player_ids) - grades.keys(), 'Players do not exist'
+        )
+        levels = set(levels)
+        cls.check_players(
+            [pk for pk, grade in grades.items() if grade not in levels],
+            'Level of these players not allowed in this game. '
+            f'Allowed levels: {", ".join(sorted(levels))}',
+        )
+
+    @staticmethod
+    def check_players(player_ids, message):
+        """Raise validation error listing invalid players if any."""
+        player_ids = sorted(player_ids)
+        if player_ids:
             raise serializers.ValidationError(
                 {
-                    'invited': f'Level of the player {invited.rating.grade} '
-                    'not allowed in this game. '
-                    f'Allowed levels: {", ".join(levels)}'
+                    'invited': f'{message}: '
+                    f'{", ".join(str(pk) for pk in player_ids)}.'
                 }
             )
-        return attrs
+
+    def create(self, validated_data):
+        return self.invite(
+            self.context['request'].user.player,
+            self.context['game'],
+            validated_data['players'],
+        )
+
+    @staticmethod
+    def invite(host, game, player_ids):
+        """
+        Create invitations and their feed rows with one INSERT each
+        and send notifications to invited players after commit.
+        Inside the transaction of the game creation no savepoint is
+        made, a failed invite rolls back the whole game.
+        """
+        with transaction.atomic(savepoint=False):
+            invitations = GameInvitation.objects.bulk_create(
+                GameInvitation(host=host, invited_id=pk, game=game)
+                for pk in player_ids
+            )
+            PlayerEventFeed.objects.add(
+                PlayerEventFeed.Roles.INVITED, [game], player_ids
+            )
+            transaction.on_commit(
+                lambda: send_invite_notifications_task.delay(
+                    game.id, player_ids
+                )
+            )
+        return invitations
+
+
+class GameWaitlistSerializer(serializers.Serializer):
+    """Result of joining the waitlist of the game."""
+
+    is_joined = serializers.BooleanField(read_only=True)
+    position = serializers.IntegerField(read_only=True, allow_null=True)
 
 
 class TourneySerializer(serializers.ModelSerializer):
@@ -225,7 +363,9 @@ class TourneyShortSerializer(serializers.ModelSerializer):
     pass
 
 
-class GameShortSerializer(serializers.ModelSerializer):
+class GameShortSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    select_related_fields = HOST_RELATED_FIELDS + COURT_LOCATION_RELATED_FIELDS
+
     game_id = serializers.IntegerField(source='pk')
 
     host = PlayerGameSerializer()
@@ -256,6 +396,22 @@ class GameShortSerializer(serializers.ModelSerializer):
         ]
 
 
+class GameNearbySerializer(GameShortSerializer):
+    distance = serializers.FloatField(read_only=True)
+
+    class Meta(GameShortSerializer.Meta):
+        fields = GameShortSerializer.Meta.fields + ['distance']
+        read_only_fields = GameShortSerializer.Meta.read_only_fields + [
+            'distance'
+        ]
+
+
+class GameNearbyListSerializer(serializers.Serializer):
+    games = serializers.ListSerializer(
+        child=GameNearbySerializer(), read_only=True
+    )
+
+
 class GameListShortSerializer(serializers.Serializer):
     games = serializers.ListSerializer(
         child=GameShortSerializer(), read_only=True
@@ -1,77 +1,111 @@
-from django.db.models.signals import post_save
+from django.db import models as m
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
-from django.utils import timezone
 
-from apps.event.models import Game, GameInvitation, Tourney
-from apps.notifications.constants import NotificationTypes
-from apps.notifications.models import NotificationsTime
-from apps.notifications.tasks import send_event_notification_task
+from apps.event.models import Game, GameInvitation, PlayerEventFeed
 
 
-def schedule_event_notifications(instance, event_type):  # noqa: RET503
+@receiver(m2m_changed, sender=Game.players.through)
+def update_current_players(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
     """
-    Schedule notifications for the event (Game or Tourney).
-    Sends notifications 1 hour and 1 day before the event start time.
+    Keeps Game.current_players in sync with players added or removed
+    through the relation managers (game creation, admin, fixtures).
+    Joining by the API updates the counter itself, see Game.add_player().
     """
-    now = timezone.now()
-    notification_type = {
-        'game': NotificationTypes.GAME_REMINDER,
-        'tourney': NotificationTypes.TOURNEY_REMINDER,
-    }.get(
-        event_type.lower(),
-    )
-    if not notification_type:
-        return False
-    start_time = instance.start_time
-    pre_event_notification_time = (
-        start_time - NotificationsTime.get_pre_event_time()
-    )
-    if pre_event_notification_time > now:
-        return send_event_notification_task.apply_async(
-            args=[
-                instance.id,
-                notification_type,
-            ],
-            eta=pre_event_notification_time,
-        )
-    advance_notification_time = (
-        start_time - NotificationsTime.get_advance_notification_time()
-    )
-    if (start_time - now).days >= 1:
-        return send_event_notification_task.apply_async(
-            args=[
-                instance.id,
-                notification_type,
-            ],
-            eta=advance_notification_time,
+    if reverse and action == 'pre_clear':
+        instance._cleared_game_ids = list(
+            instance.games_players.values_list('pk', flat=True)
         )
-    return False
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        game_ids = [instance.pk]
+    elif action == 'post_clear':
+        game_ids = instance.__dict__.pop('_cleared_game_ids', [])
+    else:
+        game_ids = pk_set
+    Game.objects.filter(pk__in=game_ids).refresh_players_count()
 
 
-@receiver(post_save, sender=Game)
-def game_created_handler(sender, instance, created, **kwargs):
-    if created:
-        schedule_event_notifications(instance, event_type='game')
+@receiver(m2m_changed, sender=Game.players.through)
+def update_players_feed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keeps player rows of the event feed in sync with players changed
+    through the relation managers.
+    Joining by the API updates the feed itself, see Game.add_player().
+    """
+    feed = PlayerEventFeed.objects.filter(role=PlayerEventFeed.Roles.PLAYER)
+    relation = 'player' if reverse else 'game'
+    if action == 'post_add':
+        if reverse:
+            PlayerEventFeed.objects.add(
+                PlayerEventFeed.Roles.PLAYER,
+                Game.objects.filter(pk__in=pk_set).only(
+                    'start_time', 'end_time'
+                ),
+                [instance.pk],
+            )
+        else:
+            PlayerEventFeed.objects.add(
+                PlayerEventFeed.Roles.PLAYER, [instance], pk_set
+            )
+    elif action == 'post_remove':
+        other = 'game' if reverse else 'player'
+        feed.filter(**{relation: instance, f'{other}__in': pk_set}).delete()
+    elif action == 'post_clear':
+        feed.filter(**{relation: instance}).delete()
 
 
-@receiver(post_save, sender=Tourney)
-def tourney_created_handler(sender, instance, created, **kwargs):
+@receiver(post_save, sender=Game)
+def update_game_feed(sender, instance, created, **kwargs):
+    """Adds the host row of a new game, copies changes of the game."""
     if created:
-        schedule_event_notifications(instance, event_type='tourney')
+        PlayerEventFeed.objects.add(
+            PlayerEventFeed.Roles.HOST, [instance], [instance.host_id]
+        )
+        return
+    PlayerEventFeed.objects.filter(game=instance).update(
+        start_time=instance.start_time,
+        end_time=instance.end_time,
+        player=m.Case(
+            m.When(
+                role=PlayerEventFeed.Roles.HOST, then=m.Value(instance.host_id)
+            ),
+            default=m.F('player'),
+            output_field=m.BigIntegerField(),
+        ),
+    )
 
 
 @receiver(post_save, sender=GameInvitation)
-def game_invitation_created_handler(sender, instance, created, **kwargs):
+def add_invitation_feed(sender, instance, created, **kwargs):
+    """
+    Adds the invited row of a single invitation.
+    Invitations created in bulk add their rows themselves,
+    see GameInviteListSerializer.invite().
+    """
     if created:
-        send_event_notification_task.delay(
-            instance.game.id, NotificationTypes.GAME_INVITE
+        PlayerEventFeed.objects.add(
+            PlayerEventFeed.Roles.INVITED,
+            [instance.game],
+            [instance.invited_id],
         )
 
 
-# @receiver(post_save, sender=TourneyInvitation)
-# def tourney_invitation_created_handler(sender, instance, created, **kwargs):
-#     if created:
-#         send_event_notification_task.delay(
-#             instance.tourney.id,
-#             NotificationTypes.TOURNEY_INVITE
-#         )
+@receiver(post_delete, sender=GameInvitation)
+def delete_invitation_feed(sender, instance, **kwargs):
+    """Deletes the invited row if no other invitation to the game is left."""
+    PlayerEventFeed.objects.filter(
+        player_id=instance.invited_id,
+        game_id=instance.game_id,
+        role=PlayerEventFeed.Roles.INVITED,
+    ).exclude(
+        m.Exists(
+            GameInvitation.objects.filter(
+                game=m.OuterRef('game'), invited=m.OuterRef('player')
+            )
+        )
+    ).delete()
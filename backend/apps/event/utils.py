@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 
+from django.db.models import QuerySet
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.response import Response
@@ -47,15 +48,27 @@ def process_rate_notifications_for_recent_events():
     send_rate_notification_for_events(Tourney, hour_ago)
 
 
+def get_events_to_rate(
+    event_type: type[Game | Tourney], closed_event_time: datetime
+) -> QuerySet:
+    """
+    Returns active events ended since closed_event_time.
+    Rate notification deactivates the event, so it is sent once.
+    """
+    return event_type.objects.filter(
+        is_active=True,
+        end_time__gte=closed_event_time,
+        end_time__lt=timezone.now(),
+    )
+
+
 def send_rate_notification_for_events(
     event_type: type[Game | Tourney], hour_ago: datetime
 ) -> bool:
     """
     Sends notification to all players in the event to rate other players.
     """
-    events = event_type.objects.filter(
-        end_time__gte=hour_ago, end_time__lt=timezone.now()
-    )
+    events = get_events_to_rate(event_type, hour_ago)
     if issubclass(event_type, Game):
         notification_type = NotificationTypes.GAME_RATE
     else:
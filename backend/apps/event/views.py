@@ -1,4 +1,6 @@
+from django.db import transaction
 from django.db.models import Q
+from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
@@ -13,19 +15,32 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from apps.core.mixins.eager_loading import EagerLoadingMixin
 from apps.core.serializers import EmptyBodySerializer
-from apps.event.models import Game, GameInvitation
+from apps.courts.enums import LocationEnums
+from apps.courts.serializers import NearbyQuerySerializer
+from apps.event.enums import EventIntEnums
+from apps.event.models import Game, GameInvitation, GameWaitlist
+from apps.event.pagination import (
+    GAME_PAGINATION_PARAMETERS,
+    GameKeysetPagination,
+)
 from apps.event.permissions import IsHostOrReadOnly, IsPlayerInEvent
 from apps.event.serializers import (
     # EventListShortSerializer,
     GameDetailSerializer,
-    GameInviteSerializer,
+    GameInviteListSerializer,
     GameJoinDetailSerializer,
     GameListShortSerializer,
+    GameNearbyListSerializer,
+    GameNearbySerializer,
     GameSerializer,
     GameShortSerializer,
+    GameWaitlistSerializer,
 )
 from apps.event.utils import process_rate_players_request
+from apps.notifications.tasks import inform_removed_players_task
+from apps.players.context import get_request_player
 from apps.players.serializers import PlayerListShortSerializer
 
 
@@ -38,28 +53,65 @@ class GameViewSet(
     http_method_names = ['get', 'post', 'delete']
 
     def get_queryset(self):
-        player = getattr(self.request.user, 'player', None)
+        player = get_request_player(self.request)
         if (
             player is None
-            or player.country is None
-            or self.action in ('joining_game', 'delete_invitation')
+            or player.country_id is None
+            or self.action
+            in (
+                'joining_game',
+                'delete_invitation',
+                'waitlist',
+                'leave_game',
+                'remove_player',
+            )
         ):
             qs = Game.objects.all()
         elif self.action == 'rate_players':
             qs = Game.objects.archive_games(player)
         else:
             qs = Game.objects.player_located_games(player)
-        return qs.select_related('host', 'court').prefetch_related('players')
+        return self.eager_load(qs)
+
+    def eager_load(self, queryset):
+        """
+        Load related objects read by the action serializer with queryset,
+        so the number of queries does not depend on the number of games.
+        """
+        serializer_class = self.get_serializer_class()
+        if issubclass(serializer_class, EagerLoadingMixin):
+            return serializer_class.setup_eager_loading(queryset)
+        return queryset.select_related('host', 'court')
+
+    def games_list_response(self, games, ordering_field, descending=False):
+        """
+        Return games wrapped in {'games': [...]}.
+        If the client asked for pagination, return one page of games
+        and the link to the next page, see GameKeysetPagination.
+        """
+        games = self.eager_load(games)
+        paginator = GameKeysetPagination(ordering_field, descending)
+        if paginator.is_requested(self.request):
+            page = paginator.paginate_queryset(games, self.request, view=self)
+            serializer = self.get_serializer(page, many=True)
+            return paginator.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(games, many=True)
+        return Response(
+            data={'games': serializer.data}, status=status.HTTP_200_OK
+        )
 
     def get_serializer_class(self, *args, **kwargs):
         if self.action in ('retrieve', 'joining_game'):
             return GameDetailSerializer
 
         if self.action == 'invite_players':
-            return GameInviteSerializer
+            return GameInviteListSerializer
 
-        if self.action in ('my_games', 'archive', 'invites', 'upcoming'):
+        if self.action == 'my_games':
             return GameShortSerializer
+
+        if self.action == 'nearby_games':
+            return GameNearbySerializer
         return GameSerializer
 
     @swagger_auto_schema(
@@ -97,14 +149,13 @@ class GameViewSet(
     )
     def invite_players(self, request, *args, **kwargs):
         """Creates invitations to the game for players on the list."""
-        game_id = self.get_object().id
-        host_id = request.user.player.id
-        for player_id in request.data['players']:
-            serializer = self.get_serializer(
-                data={'host': host_id, 'invited': player_id, 'game': game_id}
-            )
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
+        game = self.get_object()
+        serializer = self.get_serializer(
+            data=request.data,
+            context={**self.get_serializer_context(), 'game': game},
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
         return Response(status=status.HTTP_201_CREATED)
 
     @swagger_auto_schema(
@@ -144,24 +195,8 @@ class GameViewSet(
     def preview(self, request, *args, **kwargs):
         """Returns the time of the next game and the number of invitations."""
 
-        upcoming_game = Game.objects.nearest_game(request.user.player)
-        if upcoming_game is not None:
-            upcoming_game_time = upcoming_game.start_time
-        else:
-            upcoming_game_time = None
-        invites = (
-            GameInvitation.objects.filter(invited=request.user.player)
-            .values('game')
-            .distinct()
-            .count()
-        )
-        return Response(
-            data={
-                'upcoming_game_time': upcoming_game_time,
-                'invites': invites,
-            },
-            status=status.HTTP_200_OK,
-        )
+        preview = Game.objects.preview(request.user.player)
+        return Response(data=preview, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
         tags=['games'],
@@ -174,8 +209,12 @@ class GameViewSet(
         created by the current player.
         The player is the host of the events.
 
+        Pass `cursor` or `page_size` query parameter to get the games
+        by pages, the link to the next page is returned in `next`.
+
         **Returns:** game objects, tournament objects
         """,
+        manual_parameters=GAME_PAGINATION_PARAMETERS,
         responses={
             200: openapi.Response(
                 'Success', GameListShortSerializer
@@ -190,9 +229,7 @@ class GameViewSet(
         """Retrieves the list of games created by the user."""
 
         my_games = Game.objects.my_upcoming_games(request.user.player)
-        serializer = self.get_serializer(my_games, many=True)
-        wrapped_data = {'games': serializer.data}
-        return Response(data=wrapped_data, status=status.HTTP_200_OK)
+        return self.games_list_response(my_games, 'start_time')
 
     @swagger_auto_schema(
         tags=['games'],
@@ -203,8 +240,12 @@ class GameViewSet(
         Get two lists of the archived games and tournaments
         related to the current player.
 
+        Pass `cursor` or `page_size` query parameter to get the games
+        by pages, the link to the next page is returned in `next`.
+
         **Returns:** game objects, tournament objects
         """,
+        manual_parameters=GAME_PAGINATION_PARAMETERS,
         responses={
             200: openapi.Response(
                 'Success', GameListShortSerializer
@@ -219,9 +260,9 @@ class GameViewSet(
         """Retrieves the list of archived games related to user."""
 
         archived_games = Game.objects.archive_games(request.user.player)
-        serializer = self.get_serializer(archived_games, many=True)
-        wrapped_data = {'games': serializer.data}
-        return Response(data=wrapped_data, status=status.HTTP_200_OK)
+        return self.games_list_response(
+            archived_games, 'end_time', descending=True
+        )
 
     @swagger_auto_schema(
         tags=['games'],
@@ -234,8 +275,12 @@ class GameViewSet(
         to which the current player has been invited.
         The player hasn't yet managed the invitations.
 
+        Pass `cursor` or `page_size` query parameter to get the games
+        by pages, the link to the next page is returned in `next`.
+
         **Returns:** game objects, tournament objects
         """,
+        manual_parameters=GAME_PAGINATION_PARAMETERS,
         responses={
             200: openapi.Response(
                 'Success', GameListShortSerializer
@@ -250,9 +295,7 @@ class GameViewSet(
         """Retrieving upcoming games to which the player has been invited."""
 
         invited_games = Game.objects.invited_games(request.user.player)
-        serializer = self.get_serializer(invited_games, many=True)
-        wrapped_data = {'games': serializer.data}
-        return Response(data=wrapped_data, status=status.HTTP_200_OK)
+        return self.games_list_response(invited_games, 'start_time')
 
     @swagger_auto_schema(
         tags=['games'],
@@ -265,8 +308,12 @@ class GameViewSet(
         in which the current player will participate.
         The player has accepted the invitations or is host of the events.
 
+        Pass `cursor` or `page_size` query parameter to get the games
+        by pages, the link to the next page is returned in `next`.
+
         **Returns:** game objects, tournament objects
         """,
+        manual_parameters=GAME_PAGINATION_PARAMETERS,
         responses={
             200: openapi.Response(
                 'Success', GameListShortSerializer
@@ -281,9 +328,44 @@ class GameViewSet(
         """Retrieving upcoming games that the player participates in."""
 
         upcoming_games = Game.objects.upcoming_games(request.user.player)
-        serializer = self.get_serializer(upcoming_games, many=True)
-        wrapped_data = {'games': serializer.data}
-        return Response(data=wrapped_data, status=status.HTTP_200_OK)
+        return self.games_list_response(upcoming_games, 'start_time')
+
+    @swagger_auto_schema(
+        tags=['games'],
+        operation_summary='Get list of upcoming public games near the point',
+        operation_description=f"""
+        Get the list of upcoming public games on courts within `radius`
+        km from the point (`lat`, `lon`), ordered from the nearest court.
+        Default radius is {LocationEnums.DEFAULT_RADIUS_KM.value} km,
+        max radius is {LocationEnums.MAX_RADIUS_KM.value} km.
+        At most {EventIntEnums.GAMES_MAX_PAGE_SIZE.value} games are returned.
+
+        **Returns:** game objects with distance to the court in km
+        """,
+        query_serializer=NearbyQuerySerializer,
+        responses={
+            200: openapi.Response('Success', GameNearbyListSerializer),
+            400: 'Bad request',
+            401: 'Unauthorized',
+            403: 'Forbidden',
+        },
+        security=[{'Bearer': []}, {'JWT': []}],
+    )
+    @action(methods=['get'], detail=False, url_path='nearby')
+    def nearby_games(self, request, *args, **kwargs):
+        """Retrieving upcoming public games near the point."""
+        query = NearbyQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        games = Game.objects.nearby_games(
+            query.validated_data['lat'],
+            query.validated_data['lon'],
+            query.validated_data['radius'],
+        )
+        games = self.eager_load(games)[
+            : EventIntEnums.GAMES_MAX_PAGE_SIZE.value
+        ]
+        serializer = self.get_serializer(games, many=True)
+        return Response({'games': serializer.data}, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
         tags=['games'],
@@ -322,14 +404,12 @@ class GameViewSet(
 
         game = self.get_object()
         player = request.user.player
-        if game.max_players > game.players.count():
-            is_joined = {'is_joined': True}
-            game.players.add(player)
+        is_joined = {'is_joined': game.add_player(player)}
+        if is_joined['is_joined']:
             GameInvitation.objects.filter(
                 Q(game=game) & Q(invited=player)
             ).delete()
-        else:
-            is_joined = {'is_joined': False}
+            GameWaitlist.objects.filter(game=game, player=player).delete()
         serializer = self.get_serializer(game, context={'request': request})
         data = serializer.data.copy()
         data.update(is_joined)
@@ -371,6 +451,171 @@ class GameViewSet(
             )
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @swagger_auto_schema(
+        tags=['games'],
+        method='post',
+        operation_summary='Join the waitlist of the game',
+        operation_description="""
+        The current player joins the game if it has a free place,
+        otherwise the player is put in the waitlist of the game.
+        The first player of the waitlist is moved to the game when
+        a place becomes free and gets a push notification.
+
+        **Returns:** is_joined and position of the player in the waitlist.
+        """,
+        request_body=EmptyBodySerializer,
+        responses={
+            200: openapi.Response('Joined the game', GameWaitlistSerializer),
+            201: openapi.Response(
+                'Put in the waitlist', GameWaitlistSerializer
+            ),
+            400: 'Bad request',
+            401: 'Unauthorized',
+            403: 'Forbidden',
+        },
+        security=[{'Bearer': []}, {'JWT': []}],
+    )
+    @swagger_auto_schema(
+        tags=['games'],
+        method='delete',
+        operation_summary='Leave the waitlist of the game',
+        operation_description="""
+        The current player leaves the waitlist of the game.
+
+        **Returns:** empty body response.
+        """,
+        responses={
+            204: 'No content',
+            400: 'Bad request',
+            401: 'Unauthorized',
+            403: 'Forbidden',
+        },
+        security=[{'Bearer': []}, {'JWT': []}],
+    )
+    @action(
+        methods=['post', 'delete'],
+        detail=True,
+        url_path='waitlist',
+        permission_classes=[IsAuthenticated],
+    )
+    def waitlist(self, request, *args, **kwargs):
+        """Puts the player in the waitlist of the game or removes it."""
+        game = self.get_object()
+        player = request.user.player
+        if request.method == 'DELETE':
+            delete_count = GameWaitlist.objects.filter(
+                game=game, player=player
+            ).delete()[0]
+            if not delete_count:
+                return Response(
+                    data={'error': _('You are not in the waitlist!')},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        if game.players.filter(pk=player.pk).exists():
+            return Response(
+                data={'error': _('You already participate in the game!')},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        is_joined = game.add_player(player)
+        if not is_joined:
+            entry = GameWaitlist.objects.get_or_create(
+                game=game, player=player
+            )[0]
+            # A place could become free after the join attempt.
+            is_joined = player.pk in game.promote_waitlist()
+        if is_joined:
+            GameInvitation.objects.filter(game=game, invited=player).delete()
+            serializer = GameWaitlistSerializer(
+                {'is_joined': True, 'position': None}
+            )
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = GameWaitlistSerializer(
+            {'is_joined': False, 'position': entry.position}
+        )
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @swagger_auto_schema(
+        tags=['games'],
+        operation_summary='Leave the game by player',
+        operation_description="""
+        The current player leaves the game, the free place is given
+        to the first player of the waitlist.
+
+        **Returns:** empty body response.
+        """,
+        request_body=EmptyBodySerializer,
+        responses={
+            204: 'No content',
+            400: 'Bad request',
+            401: 'Unauthorized',
+            403: 'Forbidden',
+        },
+        security=[{'Bearer': []}, {'JWT': []}],
+    )
+    @action(
+        methods=['post'],
+        detail=True,
+        url_path='leave-game',
+        permission_classes=[IsAuthenticated],
+    )
+    def leave_game(self, request, *args, **kwargs):
+        """Removes the player from the game and promotes the waitlist."""
+        game = self.get_object()
+        player = request.user.player
+        if game.host_id == player.pk:
+            return Response(
+                data={'error': _('The host can not leave the game!')},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not game.remove_player(player):
+            return Response(
+                data={'error': _('You do not participate in the game!')},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @swagger_auto_schema(
+        tags=['games'],
+        operation_summary='Remove player from the game by host',
+        operation_description="""
+        The host removes the player from the game, the free place is given
+        to the first player of the waitlist.
+        The removed player gets a push notification.
+
+        **Returns:** empty body response.
+        """,
+        responses={
+            204: 'No content',
+            400: 'Bad request',
+            401: 'Unauthorized',
+            403: 'Forbidden',
+            404: 'Not found',
+        },
+        security=[{'Bearer': []}, {'JWT': []}],
+    )
+    @action(
+        methods=['delete'],
+        detail=True,
+        url_path=r'players/(?P<player_id>\d+)',
+    )
+    def remove_player(self, request, player_id, *args, **kwargs):
+        """Removes the player from the game and promotes the waitlist."""
+        game = self.get_object()
+        player = get_object_or_404(game.players, pk=player_id)
+        if game.host_id == player.pk:
+            return Response(
+                data={'error': _('The host can not leave the game!')},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        game.remove_player(player)
+        transaction.on_commit(
+            lambda: inform_removed_players_task.delay(
+                game.id, player.id, 'game'
+            )
+        )
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
     @swagger_auto_schema(
         tags=['games'],
         method='get',
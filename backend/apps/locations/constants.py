@@ -5,3 +5,6 @@ class LocationsEnums(int, Enum):
     """Enum for Country and City models constants."""
 
     MAX_LENGTH = 100
+
+
+LOCATIONS_CACHE_TAG: str = 'locations'
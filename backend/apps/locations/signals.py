@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.cache import invalidate_tags_on_commit
+from apps.core.constants import CURRENCIES_CACHE_TAG
+from apps.locations.constants import LOCATIONS_CACHE_TAG
+from apps.locations.models import City, Country
+
+
+@receiver([post_save, post_delete], sender=Country)
+def invalidate_country_caches(sender, **kwargs):
+    """
+    Regenerate cached countries and currencies lists when country changes.
+    Currencies hold country ID, which is set to NULL without signals.
+    """
+    invalidate_tags_on_commit(LOCATIONS_CACHE_TAG, CURRENCIES_CACHE_TAG)
+
+
+@receiver([post_save, post_delete], sender=City)
+def invalidate_city_caches(sender, **kwargs):
+    """Regenerate cached countries list when city changes."""
+    invalidate_tags_on_commit(LOCATIONS_CACHE_TAG)
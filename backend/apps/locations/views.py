@@ -7,6 +7,18 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.cache import (
+    CachedPayload,
+    build_payload,
+    get_or_set,
+    make_key,
+    payload_response,
+)
+from apps.core.constants import (
+    REFERENCE_DATA_CACHE_TIMEOUT,
+    REFERENCE_DATA_MAX_AGE,
+)
+from apps.locations.constants import LOCATIONS_CACHE_TAG
 from apps.locations.models import Country
 from apps.locations.serializers import CountryListSerializer
 
@@ -14,6 +26,11 @@ logger = logging.getLogger(__name__)
 
 
 class CountryListView(APIView):
+    """
+    Countries with cities served from cached pre-rendered JSON.
+    Cache is invalidated when countries or cities are changed.
+    """
+
     permission_classes = [AllowAny]
 
     @swagger_auto_schema(
@@ -25,13 +42,25 @@ class CountryListView(APIView):
     )
     def get(self, request):
         try:
-            countries = Country.objects.prefetch_related('cities').all()
-            serializer = CountryListSerializer({'countries': countries})
-
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            payload = get_or_set(
+                make_key('countries'),
+                self.build_payload,
+                timeout=REFERENCE_DATA_CACHE_TIMEOUT,
+                tags=[LOCATIONS_CACHE_TAG],
+            )
+            return payload_response(
+                request, payload, max_age=REFERENCE_DATA_MAX_AGE
+            )
 
         except Exception as e:
             error_msg = f'Internal server error: {e}.'
             logger.error(error_msg)
 
             return Response(status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @staticmethod
+    def build_payload() -> CachedPayload:
+        """Render all countries with their cities to JSON."""
+        countries = Country.objects.prefetch_related('cities').all()
+        serializer = CountryListSerializer({'countries': countries})
+        return build_payload(serializer.data)
@@ -0,0 +1,10 @@
+from apps.core.cache import VersionedLocalCache
+from apps.notifications.constants import (
+    NOTIFICATION_SETTINGS_CACHE_TTL,
+    NOTIFICATION_SETTINGS_VERSION_KEY,
+)
+
+notification_settings_cache = VersionedLocalCache(
+    version_key=NOTIFICATION_SETTINGS_VERSION_KEY,
+    ttl=NOTIFICATION_SETTINGS_CACHE_TTL,
+)
@@ -18,6 +18,7 @@ class NotificationTypes:
     GAME_REMINDER: str = 'game_reminder'
     GAME_RATE: str = 'game_rate'
     GAME_REMOVED: str = 'game_removed'
+    GAME_PROMOTED: str = 'game_promoted'
 
     TOURNEY_INVITE: str = 'tourney_join'
     TOURNEY_REMINDER: str = 'tourney_reminder'
@@ -28,6 +29,7 @@ class NotificationTypes:
         (GAME_REMINDER, 'game_reminder'),
         (GAME_RATE, 'game_rate'),
         (GAME_REMOVED, 'game_removed'),
+        (GAME_PROMOTED, 'game_promoted'),
         (TOURNEY_INVITE, 'tourney_join'),
         (TOURNEY_REMINDER, 'tourney_reminder'),
         (TOURNEY_RATE, 'tourney_rate'),
@@ -63,6 +65,11 @@ NOTIFICATION_INIT_DATA = {
         'body': 'See details in the app.',
         'screen': 'removed',
     },
+    NotificationTypes.GAME_PROMOTED: {
+        'title': 'You have joined the game',
+        'body': 'A place in the game became free for you!',
+        'screen': 'inGame',
+    },
     NotificationTypes.TOURNEY_INVITE: {
         'title': 'Tournament Invitation',
         'body': 'You are invited to a tournament!',
@@ -86,6 +93,11 @@ NOTIFICATION_INIT_DATA = {
 }
 
 RETRY_PUSH_TIME: int = 60
+RETRY_BATCH_LIMIT: int = 10000
+NOTIFICATION_SETTINGS_CACHE_TTL: int = 300
+NOTIFICATION_SETTINGS_VERSION_KEY: str = 'notifications:settings:version'
+FCM_MULTICAST_MAX_TOKENS: int = 500
+FCM_INVALID_TOKEN_MESSAGE: str = 'registration token'
 
 
 class NotificationTimePreset:
@@ -0,0 +1,77 @@
+import logging
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class PushDispatchPool:
+    """
+    Bounded thread pool to send push notifications concurrently.
+    Worker threads live as long as the pool, and pyfcm keeps one HTTP
+    session per thread, so keep-alive connections to FCM are reused
+    between dispatches instead of being opened for every notification.
+    Arguments:
+        max_workers (int): Maximum number of concurrent requests.
+    Methods:
+        dispatch(send, items): Calls send for every item concurrently.
+        shutdown(): Stops worker threads.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max(1, max_workers)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create executor on first use (after Celery worker fork)."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix='push-dispatch',
+                    )
+        return self._executor
+
+    @staticmethod
+    def _call(send: Callable[[T], object], item: T) -> Exception | None:
+        """Call send for item and return raised exception if any."""
+        try:
+            send(item)
+        except Exception as e:
+            return e
+        return None
+
+    def dispatch(
+        self,
+        send: Callable[[T], object],
+        items: Iterable[T],
+    ) -> list[tuple[T, Exception | None]]:
+        """
+        Call send for every item using up to max_workers threads.
+        Args:
+            send (callable): Function sending one notification.
+            items (iterable): Items to pass to send function.
+        Returns:
+            list: Pairs of item and exception raised by send
+                (None for successful calls) in the order of items.
+        """
+        items = list(items)
+        if self.max_workers == 1 or len(items) <= 1:
+            return [(item, self._call(send, item)) for item in items]
+        errors = self._get_executor().map(
+            lambda item: self._call(send, item), items
+        )
+        return list(zip(items, errors, strict=True))
+
+    def shutdown(self) -> None:
+        """Stop worker threads, pool can still be used afterwards."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
@@ -1,9 +1,11 @@
 from datetime import timedelta
 
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from apps.core.enums import CoreFieldLength
+from apps.notifications.cache import notification_settings_cache
 from apps.notifications.constants import (
     DEVICE_PLATFORM_LENGTH,
     DEVICE_TOKEN_MAX_LENGTH,
@@ -43,6 +45,19 @@ class DeviceQuerySet(models.QuerySet):
         """Return active devices for a specific player."""
         return self.active().filter(player_id=player_id)
 
+    def by_players(self, player_ids):
+        """Return active devices of all given players."""
+        return self.active().filter(player_id__in=player_ids)
+
+    def deactivate_tokens(self, tokens):
+        """
+        Deactivate devices with given tokens with one UPDATE query.
+        Returns the number of deactivated devices.
+        """
+        return self.filter(token__in=tokens, is_active=True).update(
+            is_active=False
+        )
+
 
 class DeviceManager(models.Manager):
     """
@@ -69,6 +84,14 @@ class DeviceManager(models.Manager):
         """Return active devices for a specific player."""
         return self.get_queryset().by_player(player_id)
 
+    def by_players(self, player_ids):
+        """Return active devices of all given players."""
+        return self.get_queryset().by_players(player_ids)
+
+    def deactivate_tokens(self, tokens):
+        """Deactivate devices with given tokens."""
+        return self.get_queryset().deactivate_tokens(tokens)
+
     def update_or_create_token(
         self, token, player, platform=None, is_active=True
     ):
@@ -143,6 +166,23 @@ class NotificationsBase(models.Model):
     def __str__(self):
         return f'Notification Type: {self.type}'
 
+    @classmethod
+    def get_by_type(cls, notification_type: str) -> 'NotificationsBase':
+        """
+        Get notification template by type from in-process cache.
+        All templates are loaded with one query.
+        Raises DoesNotExist if there is no template of this type.
+        """
+        templates = notification_settings_cache.get_or_load(
+            'templates', lambda: cls.objects.in_bulk(field_name='type')
+        )
+        try:
+            return templates[notification_type]
+        except KeyError as e:
+            raise cls.DoesNotExist(
+                f'Notification type {notification_type} does not exist.'
+            ) from e
+
     @classmethod
     def create_db_model_types(cls):
         """
@@ -247,8 +287,10 @@ class NotificationsTime(models.Model):
 
     @classmethod
     def get_active(cls) -> 'NotificationsTime':
-        """Get the active NotificationsTime instance."""
-        return cls.objects.filter(is_active=True).first()
+        """Get the active NotificationsTime instance from in-process cache."""
+        return notification_settings_cache.get_or_load(
+            'active_time', lambda: cls.objects.filter(is_active=True).first()
+        )
 
     @classmethod
     def get_pre_event_time(cls) -> timedelta:
@@ -264,3 +306,47 @@ class NotificationsTime(models.Model):
     def get_advance_notification_time(cls) -> timedelta:
         """Get advance notification time."""
         return cls.get_active().advance_notification
+
+
+class NotificationRetryQuerySet(models.QuerySet):
+    """Custom QuerySet for NotificationRetry model."""
+
+    def due(self, now=None):
+        """Return retries whose retry window has come."""
+        return self.filter(retry_at__lte=now or timezone.now())
+
+
+class NotificationRetry(models.Model):
+    """
+    Push notification failed with transient FCM error.
+    Retries of one window are replayed together as one batched send.
+    """
+
+    token = models.CharField(max_length=DEVICE_TOKEN_MAX_LENGTH)
+    notification_type = models.CharField(
+        max_length=NOTIFICATION_TYPE_MAX_LENGTH,
+        choices=NotificationTypes.CHOICES,
+        verbose_name=_('Notification type'),
+    )
+    event_id = models.PositiveIntegerField(
+        null=True, blank=True, verbose_name=_('Game or tourney ID')
+    )
+    attempt = models.PositiveSmallIntegerField(
+        default=1, verbose_name=_('Retry attempt')
+    )
+    retry_at = models.DateTimeField(
+        db_index=True, verbose_name=_('Retry window')
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    objects = NotificationRetryQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _('Notification retry')
+        verbose_name_plural = _('Notification retries')
+        ordering = ['retry_at']
+
+    def __str__(self):
+        return (
+            f'Retry {self.attempt} of {self.notification_type} '
+            f'at {self.retry_at}'
+        )
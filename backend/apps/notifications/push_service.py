@@ -7,20 +7,24 @@ from threading import Lock
 import firebase_admin
 from celery import current_app
 from django.conf import settings
-from firebase_admin import credentials
+from firebase_admin import credentials, messaging
+from firebase_admin.exceptions import FirebaseError
 from pyfcm import FCMNotification
 from pyfcm.errors import FCMError
 
 from apps.event.models import Game, Tourney
 from apps.notifications.constants import (
-    RETRY_PUSH_TIME,
+    FCM_MULTICAST_MAX_TOKENS,
     NotificationTypes,
 )
+from apps.notifications.dispatch import PushDispatchPool
 from apps.notifications.models import (
     Device,
     Notifications,
     NotificationsBase,
 )
+from apps.notifications.retry import enqueue_retries
+from apps.notifications.utils import is_permanent_fcm_error
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +70,7 @@ class PushService:
     Attributes:
         fb_admin: Firebase app instance.
         push_service: FCMNotification instance for sending notifications.
+        dispatcher: PushDispatchPool to send notifications concurrently.
         fb_available (bool): Flag  if FCM service is available.
         celery_available (bool): Flag if Celery workers are available.
         _initialized (bool): Flag if services have been initialized.
@@ -74,6 +79,8 @@ class PushService:
         get_status(): Returns current status of services.
         process_notifications_by_type(type, player_id=None, event_id=None):
             Sends notifications to multiple devices using FCM.
+        send_push_notifications_batch(devices, notification, event_id=None):
+            Sends notifications with FCM multicast requests.
     """
 
     _instance = None
@@ -90,6 +97,9 @@ class PushService:
     def __init__(self):
         if self._initialized:
             return
+        self.dispatcher = PushDispatchPool(
+            max_workers=settings.PUSH_DISPATCH_MAX_WORKERS
+        )
         self._initialize_services()
 
     def __bool__(self):
@@ -232,6 +242,7 @@ class PushService:
         notification_type: str,
         player_id: int | None = None,
         event_id: int | None = None,
+        player_ids: list[int] | None = None,
     ) -> dict | None:
         """
         Send notifications to multiple devices using FCM.
@@ -242,6 +253,8 @@ class PushService:
                 notifications.
             event_id (int, optional):
                 Game ID to include in the notification data.
+            player_ids (list, optional): Player IDs to send one batch of
+                player-specific notifications to.
         Returns:
             dict: Statistics of notification sending.
         """
@@ -263,8 +276,14 @@ class PushService:
                 notification_type=notification_type,
                 player_id=player_id,
                 event_id=event_id,
+                player_ids=player_ids,
+            )
+            send_method = (
+                self.send_push_notifications_batch
+                if settings.PUSH_BATCH_SEND
+                else self.send_push_notifications
             )
-            stats_msg = self.send_push_notifications(
+            stats_msg = send_method(
                 devices=devices, notification=notification, event_id=event_id
             )
             return {
@@ -288,6 +307,7 @@ class PushService:
         notification_type: str,
         player_id: int | None,
         event_id: int | None,
+        player_ids: list[int] | None = None,
     ) -> list[Device]:
         """
         Get queryset of devices to send notifications to based on type.
@@ -295,6 +315,8 @@ class PushService:
             type (str): Type of notification to send.
             player_id (int, optional): Player ID for player-specific
                 notifications.
+            player_ids (list, optional): Player IDs for player-specific
+                notifications, used instead of player_id if given.
         Returns:
             QuerySet: QuerySet of Device objects to send notifications to.
         """
@@ -306,9 +328,15 @@ class PushService:
             devices = Device.objects.in_game(event_id)
         elif notification_type in [
             NotificationTypes.GAME_INVITE,
+            NotificationTypes.GAME_PROMOTED,
+            NotificationTypes.GAME_REMOVED,
             NotificationTypes.TOURNEY_INVITE,
+            NotificationTypes.TOURNEY_REMOVED,
         ]:
-            devices = Device.objects.by_player(player_id)
+            if player_ids is not None:
+                devices = Device.objects.by_players(player_ids)
+            else:
+                devices = Device.objects.by_player(player_id)
         elif notification_type in [
             NotificationTypes.TOURNEY_REMINDER,
             NotificationTypes.TOURNEY_RATE,
@@ -330,7 +358,7 @@ class PushService:
         Returns:
             Notification: NotificationsBase object with title, body, screen.
         """
-        return NotificationsBase.objects.get(type=notification_type)
+        return NotificationsBase.get_by_type(notification_type)
 
     @service_required
     def send_push_notifications(
@@ -338,6 +366,7 @@ class PushService:
         devices: list[Device],
         notification: NotificationsBase,
         event_id: int | None = None,
+        retry_attempt: int = 0,
     ) -> dict[str, int]:
         """
         Send push notifications to multiple devices.
@@ -347,23 +376,40 @@ class PushService:
                 body, and screen.
             event_id (int, optional): Game ID to include in the
                 notification data.
+            retry_attempt (int, optional): Number of retry the send is.
         """
         result = {
             'total_devices': len(devices),
             'successful': 0,
             'failed': 0,
+            'deactivated': 0,
         }
         if not devices:
             logger.warning('No devices provided, skipping notification')
             return result
-        for d in devices:
-            is_notify = self._send_notification_by_device_internal(
-                device=d, notification=notification, event_id=event_id
-            )
-            if is_notify:
-                result['successful'] += 1
+        data_message = self._get_data_message(notification, event_id)
+        devices_with_token = [d for d in devices if d.token]
+        result['failed'] = len(devices) - len(devices_with_token)
+        send_results = self.dispatcher.dispatch(
+            lambda device: self._notify_device(
+                device, notification, data_message
+            ),
+            devices_with_token,
+        )
+        delivered: list[Device] = []
+        failed: list[tuple[Device, Exception]] = []
+        for device, error in send_results:
+            if error is None:
+                delivered.append(device)
                 continue
-            result['failed'] += 1
+            self._log_send_error(device, error)
+            failed.append((device, error))
+        self.bulk_create_db_models(delivered, notification, event_id)
+        result['deactivated'] = self._handle_failed_devices(
+            failed, notification, event_id, retry_attempt
+        )
+        result['successful'] = len(delivered)
+        result['failed'] += len(failed)
         logger.info(
             f'Push notification "{notification.type}" results: '
             f'{result["successful"]}/{result["total_devices"]} successful, '
@@ -371,6 +417,94 @@ class PushService:
         )
         return result
 
+    @service_required
+    def send_push_notifications_batch(
+        self,
+        devices: list[Device],
+        notification: NotificationsBase,
+        event_id: int | None = None,
+        retry_attempt: int = 0,
+    ) -> dict[str, int]:
+        """
+        Send push notifications to multiple devices with FCM multicast.
+        Tokens are grouped into chunks of FCM_MULTICAST_MAX_TOKENS,
+        per-token results are collected from each batch response and
+        notifications for delivered devices are saved with one bulk insert.
+        Falls back to per-device sending if Firebase app is not available.
+        Args:
+            devices (list): Devices to send the notification to.
+            notification (Notification): Notification object containing title,
+                body, and screen.
+            event_id (int, optional): Game ID to include in the
+                notification data.
+            retry_attempt (int, optional): Number of retry the send is.
+        """
+        if not getattr(self, 'fb_admin', None):
+            logger.warning(
+                'Firebase app not available, sending notifications '
+                'device by device'
+            )
+            return self.send_push_notifications(
+                devices=devices,
+                notification=notification,
+                event_id=event_id,
+                retry_attempt=retry_attempt,
+            )
+        devices = [d for d in devices if d.token]
+        result = {
+            'total_devices': len(devices),
+            'successful': 0,
+            'failed': 0,
+            'deactivated': 0,
+        }
+        if not devices:
+            logger.warning('No devices provided, skipping notification')
+            return result
+        fcm_notification = messaging.Notification(
+            title=notification.title, body=notification.body
+        )
+        data_message = self._get_data_message(notification, event_id)
+        delivered: list[Device] = []
+        failed: list[tuple[Device, Exception]] = []
+        for start in range(0, len(devices), FCM_MULTICAST_MAX_TOKENS):
+            chunk = devices[start : start + FCM_MULTICAST_MAX_TOKENS]
+            message = messaging.MulticastMessage(
+                tokens=[d.token for d in chunk],
+                notification=fcm_notification,
+                data=data_message,
+            )
+            try:
+                batch_response = messaging.send_each_for_multicast(
+                    message, app=self.fb_admin
+                )
+            except (FirebaseError, ValueError) as e:
+                logger.warning(
+                    f'FCM multicast request for {len(chunk)} devices '
+                    f'failed: {str(e)}'
+                )
+                failed.extend((device, e) for device in chunk)
+                continue
+            for device, response in zip(
+                chunk, batch_response.responses, strict=True
+            ):
+                if response.success:
+                    delivered.append(device)
+                    continue
+                self._log_send_error(device, response.exception)
+                failed.append((device, response.exception))
+        self.bulk_create_db_models(delivered, notification, event_id)
+        result['deactivated'] = self._handle_failed_devices(
+            failed, notification, event_id, retry_attempt
+        )
+        result['successful'] = len(delivered)
+        result['failed'] = len(failed)
+        logger.info(
+            f'Batch push notification "{notification.type}" results: '
+            f'{result["successful"]}/{result["total_devices"]} successful, '
+            f'{result["failed"]} failed'
+        )
+        return result
+
     @service_required
     def send_notification_by_device(
         self,
@@ -405,58 +539,112 @@ class PushService:
         This method is NOT decorated with @service_required
         to avoid double checking.
         """
-        error_occurred = False
         if not device.token:
             logger.warning('Empty device token, skipping notification')
             return False
-        data_message = {'screen': notification.screen}
-        if event_id:
-            data_message['gameId'] = str(event_id)
+        data_message = self._get_data_message(notification, event_id)
+        try:
+            self._notify_device(device, notification, data_message)
+        except Exception as e:
+            self._log_send_error(device, e)
+            self._handle_failed_devices([(device, e)], notification, event_id)
+            return False
+        self.create_db_model(device, notification, event_id)
+        return True
 
+    def _notify_device(
+        self,
+        device: Device,
+        notification: NotificationsBase,
+        data_message: dict[str, str],
+    ) -> None:
+        """Send notification request to FCM, raises error on failure."""
         masked_token = device.token[:8] + '...'
+        logger.debug(f'Sending notification to device {masked_token}')
+        self.push_service.notify(
+            fcm_token=device.token,
+            notification_title=notification.title,
+            notification_body=notification.body,
+            data_payload=data_message,
+        )
+        logger.debug(
+            f'Notification sent successfully to device {masked_token}'
+        )
+
+    def _log_send_error(self, device: Device, error: Exception) -> None:
+        """Log error of sending notification to the device."""
+        masked_token = device.token[:8] + '...'
+        if isinstance(error, FCMError | FirebaseError):
+            logger.warning(f'FCM Error for token {masked_token}: {str(error)}')
+            return
+        logger.error(
+            f'Unexpected error sending to {masked_token}: {str(error)}'
+        )
+
+    def _handle_failed_devices(
+        self,
+        failed: list[tuple[Device, Exception]],
+        notification: NotificationsBase,
+        event_id: int | None = None,
+        retry_attempt: int = 0,
+    ) -> int:
+        """
+        Deactivate devices with permanent FCM errors (unregistered or
+        invalid tokens) with one query and queue the rest for the next
+        batched retry.
+        Returns the number of deactivated devices.
+        """
+        dead_tokens = []
+        retry_tokens = []
+        for device, error in failed:
+            if is_permanent_fcm_error(error):
+                dead_tokens.append(device.token)
+                continue
+            retry_tokens.append(device.token)
         try:
-            logger.debug(f'Sending notification to device {masked_token}')
-            self.push_service.notify(
-                fcm_token=device.token,
-                notification_title=notification.title,
-                notification_body=notification.body,
-                data_payload=data_message,
+            enqueue_retries(
+                retry_tokens, notification.type, event_id, retry_attempt + 1
             )
-            logger.debug(
-                f'Notification sent successfully to device {masked_token}'
-            )
-            self.create_db_model(device, notification, event_id)
-            return True
-        except FCMError as e:
-            error_occurred = True
-            logger.warning(f'FCM Error for token {masked_token}: {str(e)}')
-            return False
         except Exception as e:
-            error_occurred = True
             logger.error(
-                f'Unexpected error sending to {masked_token}: {str(e)}'
+                f'Failed to queue {len(retry_tokens)} retries: {str(e)}'
             )
-            return False
-        finally:
-            if error_occurred:
-                try:
-                    from apps.notifications.tasks import (
-                        retry_notification_task,
-                    )
+        if not dead_tokens:
+            return 0
+        deactivated = Device.objects.deactivate_tokens(dead_tokens)
+        logger.info(
+            f'Deactivated {deactivated} device(s) with permanent FCM errors'
+        )
+        return deactivated
 
-                    retry_notification_task.apply_async(
-                        args=[device.token, notification.type, event_id],
-                        countdown=RETRY_PUSH_TIME,
-                    )
-                    logger.info(
-                        f'Scheduled retry task for token {masked_token} '
-                        f'in 60 seconds'
-                    )
-                except Exception as celery_error:
-                    logger.error(
-                        f'Failed to schedule retry task for {masked_token}: '
-                        f'{str(celery_error)}'
-                    )
+    def _get_data_message(
+        self,
+        notification: NotificationsBase,
+        event_id: int | None = None,
+    ) -> dict[str, str]:
+        """Build FCM data payload for the notification."""
+        data_message = {'screen': notification.screen}
+        if event_id:
+            data_message['gameId'] = str(event_id)
+        return data_message
+
+    def _get_event_data(
+        self,
+        notification: NotificationsBase,
+        event_id: int | None = None,
+    ) -> dict:
+        """Return event relation (game or tourney) for notification model."""
+        data = {}
+        if event_id:
+            if 'game' in notification.type:
+                game_obj = Game.objects.filter(id=event_id).first()
+                if game_obj:
+                    data['game'] = game_obj
+            elif 'tourney' in notification.type:
+                tourney_obj = Tourney.objects.filter(id=event_id).first()
+                if tourney_obj:
+                    data['tourney'] = tourney_obj
+        return data
 
     def create_db_model(
         self,
@@ -471,16 +659,11 @@ class PushService:
             notification_type (str): Type of notification sent.
             event_id (int, optional): Game ID for the notification data.
         """
-        data = {'player': device.player, 'notification_type': notification}
-        if event_id:
-            if 'game' in notification.type:
-                game_obj = Game.objects.filter(id=event_id).first()
-                if game_obj:
-                    data['game'] = game_obj
-            elif 'tourney' in notification.type:
-                tourney_obj = Tourney.objects.filter(id=event_id).first()
-                if tourney_obj:
-                    data['tourney'] = tourney_obj
+        data = {
+            'player': device.player,
+            'notification_type': notification,
+            **self._get_event_data(notification, event_id),
+        }
         try:
             Notifications.objects.create(**data)
             logger.debug(
@@ -495,3 +678,43 @@ class PushService:
             )
             return False
         return True
+
+    def bulk_create_db_models(
+        self,
+        devices: list[Device],
+        notification: NotificationsBase,
+        event_id: int | None = None,
+    ) -> int:
+        """
+        Create notification models for all devices with one bulk insert.
+        Event object is resolved once for the whole batch.
+        Args:
+            devices (list): Devices the notification was delivered to.
+            notification (Notification): Notification type sent.
+            event_id (int, optional): Game or tourney ID for the notification.
+        Returns:
+            int: Number of created notification models.
+        """
+        if not devices:
+            return 0
+        event_data = self._get_event_data(notification, event_id)
+        try:
+            created = Notifications.objects.bulk_create(
+                [
+                    Notifications(
+                        player_id=device.player_id,
+                        notification_type=notification,
+                        **event_data,
+                    )
+                    for device in devices
+                ]
+            )
+        except Exception as e:
+            logger.error(
+                f'Error creating notification DB models for '
+                f'{len(devices)} devices: {str(e)}',
+                exc_info=True,
+            )
+            return 0
+        logger.debug(f'{len(created)} notification DB models created')
+        return len(created)
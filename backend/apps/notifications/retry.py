@@ -0,0 +1,121 @@
+import logging
+import math
+import random
+from collections import defaultdict
+from datetime import UTC, datetime
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.notifications.constants import (
+    MAX_RETRIES,
+    RETRY_BATCH_LIMIT,
+    RETRY_PUSH_TIME,
+)
+from apps.notifications.models import Device, NotificationRetry
+
+logger = logging.getLogger(__name__)
+
+
+def get_retry_time(attempt: int, now: datetime | None = None) -> datetime:
+    """
+    Return start of the retry window for the given attempt.
+    Delay grows exponentially with random jitter and is rounded up
+    to the window boundary, so failures of one window are replayed
+    together.
+    """
+    now = now or timezone.now()
+    delay = RETRY_PUSH_TIME * 2 ** (attempt - 1)
+    delay += random.uniform(0, delay)
+    window = math.ceil((now.timestamp() + delay) / RETRY_PUSH_TIME)
+    return datetime.fromtimestamp(window * RETRY_PUSH_TIME, tz=UTC)
+
+
+def enqueue_retries(
+    tokens: list[str],
+    notification_type: str,
+    event_id: int | None = None,
+    attempt: int = 1,
+) -> int:
+    """
+    Save failed tokens to the retry queue with one bulk insert.
+    Tokens which used all MAX_RETRIES attempts are dropped.
+    Returns the number of queued retries.
+    """
+    if not tokens:
+        return 0
+    if attempt > MAX_RETRIES:
+        logger.warning(
+            f'Dropped {len(tokens)} "{notification_type}" notification(s) '
+            f'after {MAX_RETRIES} retries'
+        )
+        return 0
+    retry_at = get_retry_time(attempt)
+    NotificationRetry.objects.bulk_create(
+        [
+            NotificationRetry(
+                token=token,
+                notification_type=notification_type,
+                event_id=event_id,
+                attempt=attempt,
+                retry_at=retry_at,
+            )
+            for token in tokens
+        ]
+    )
+    logger.info(
+        f'Queued {len(tokens)} "{notification_type}" notification(s) '
+        f'for retry {attempt} at {retry_at}'
+    )
+    return len(tokens)
+
+
+def process_due_retries(push_service, now: datetime | None = None) -> dict:
+    """
+    Replay due retries with one batched send per notification type,
+    event and attempt. Rows are taken with SKIP LOCKED, so several
+    workers never replay the same retry.
+    A batch failing with an error is logged and queued with the next
+    attempt, so it does not stop the other batches.
+    Args:
+        push_service (PushService): Service to send notifications with.
+        now (datetime, optional): Time to check retry windows against.
+    Returns:
+        dict: Number of replayed retries and sent batches.
+    """
+    with transaction.atomic():
+        due = list(
+            NotificationRetry.objects.due(now)
+            .select_for_update(skip_locked=True)
+            .order_by('retry_at')[:RETRY_BATCH_LIMIT]
+        )
+        NotificationRetry.objects.filter(pk__in=[r.pk for r in due]).delete()
+    batches = defaultdict(set)
+    for retry in due:
+        key = (retry.notification_type, retry.event_id, retry.attempt)
+        batches[key].add(retry.token)
+    for (notification_type, event_id, attempt), tokens in batches.items():
+        try:
+            devices = list(Device.objects.active().filter(token__in=tokens))
+            if not devices:
+                continue
+            notification = push_service.get_notification_object(
+                notification_type=notification_type
+            )
+            push_service.send_push_notifications_batch(
+                devices=devices,
+                notification=notification,
+                event_id=event_id,
+                retry_attempt=attempt,
+            )
+        except Exception as e:
+            logger.error(
+                f'Failed to replay {len(tokens)} "{notification_type}" '
+                f'retries of event {event_id}: {e}',
+                exc_info=True,
+            )
+            enqueue_retries(
+                list(tokens), notification_type, event_id, attempt + 1
+            )
+    logger.info(f'Replayed {len(due)} retries in {len(batches)} batch(es)')
+    return {'retries': len(due), 'batches': len(batches)}
@@ -16,6 +16,7 @@ from apps.notifications.models import (
     NotificationsTime,
 )
 from apps.notifications.push_service import PushService
+from apps.notifications.retry import process_due_retries
 from apps.notifications.utils import delete_old_devices
 
 logger = logging.getLogger('django.notifications')
@@ -63,6 +64,49 @@ def send_event_notification_task(self, event_id: int, notification_type: str):
     )
 
 
+@shared_task(
+    bind=True, max_retries=MAX_RETRIES, default_retry_delay=RETRY_PUSH_TIME
+)
+def send_invite_notifications_task(
+    self,
+    event_id: int,
+    player_ids: list[int],
+    notification_type: str = NotificationTypes.GAME_INVITE,
+):
+    """
+    Sends one batch of invite notifications to all invited players
+    of the event.
+    """
+    push_service = PushService()
+    if not push_service:
+        logger.error('Push service is not enabled. Check configuration.')
+        return False
+    return push_service.process_notifications_by_type(
+        notification_type=notification_type,
+        event_id=event_id,
+        player_ids=player_ids,
+    )
+
+
+@shared_task(
+    bind=True, max_retries=MAX_RETRIES, default_retry_delay=RETRY_PUSH_TIME
+)
+def send_waitlist_promotion_task(self, event_id: int, player_ids: list[int]):
+    """
+    Inform players that they have been moved from the waitlist
+    to the game.
+    """
+    push_service = PushService()
+    if not push_service:
+        logger.error('Push service is not enabled. Check configuration.')
+        return False
+    return push_service.process_notifications_by_type(
+        notification_type=NotificationTypes.GAME_PROMOTED,
+        event_id=event_id,
+        player_ids=player_ids,
+    )
+
+
 @shared_task(bind=True)
 def retry_notification_task(self, token, notification_type, event_id=None):
     """
@@ -75,7 +119,7 @@ def retry_notification_task(self, token, notification_type, event_id=None):
     """
     try:
         logger.info(f'Retrying notification to token {token[:8]}...')
-        notification = NotificationsBase.objects.get(type=notification_type)
+        notification = NotificationsBase.get_by_type(notification_type)
         push_service = PushService()
         device = Device.objects.filter(token=token).first()
         result = push_service.send_notification_by_device(
@@ -93,6 +137,19 @@ def retry_notification_task(self, token, notification_type, event_id=None):
         )
 
 
+@shared_task
+def process_notification_retries_task():
+    """
+    Replay failed notifications whose retry window has come
+    as batched sends.
+    """
+    push_service = PushService()
+    if not push_service:
+        logger.error('Push service is not enabled. Check configuration.')
+        return False
+    return process_due_retries(push_service)
+
+
 @shared_task(bind=True)
 def inform_removed_players_task(
     self, event_id: int, player_id: int, event_type: str
@@ -139,10 +196,9 @@ def send_rate_notification_for_events(
     Sends notification to all players in the event to rate other players.
     """
     from apps.event.models import Game
+    from apps.event.utils import get_events_to_rate
 
-    events = event_type.objects.filter(
-        end_time__gte=closed_event_time, end_time__lt=timezone.now()
-    )
+    events = get_events_to_rate(event_type, closed_event_time)
     if issubclass(event_type, Game):
         notification_type = NotificationTypes.GAME_RATE
     else:
@@ -3,9 +3,17 @@ from datetime import timedelta
 
 from django.db import transaction
 from django.utils import timezone
+from firebase_admin import messaging
+from firebase_admin.exceptions import InvalidArgumentError
+from pyfcm.errors import (
+    FCMNotRegisteredError,
+    FCMSenderIdMismatchError,
+    InvalidDataError,
+)
 
 from apps.notifications.constants import (
     DEV_NOTIFICATION_TIME,
+    FCM_INVALID_TOKEN_MESSAGE,
     FCM_TOKEN_EXPIRY_DAYS,
     PROD_NOTIFICATION_TIME,
 )
@@ -13,6 +21,26 @@ from apps.notifications.models import Device, NotificationsTime
 
 logger = logging.getLogger(__name__)
 
+PERMANENT_FCM_ERRORS = (
+    FCMNotRegisteredError,
+    FCMSenderIdMismatchError,
+    messaging.UnregisteredError,
+    messaging.SenderIdMismatchError,
+)
+
+
+def is_permanent_fcm_error(error: Exception) -> bool:
+    """
+    Check if FCM error means that the device token will never work again:
+    token is unregistered, belongs to another sender or is malformed.
+    Other errors (server errors, timeouts, quota) are transient.
+    """
+    if isinstance(error, PERMANENT_FCM_ERRORS):
+        return True
+    if isinstance(error, InvalidDataError | InvalidArgumentError):
+        return FCM_INVALID_TOKEN_MESSAGE in str(error)
+    return False
+
 
 def delete_old_devices():
     """
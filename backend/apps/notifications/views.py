@@ -17,7 +17,7 @@ from apps.notifications.serializers import (
     NotificationListSerializer,
     NotificationSerializer,
 )
-from apps.players.models import Player
+from apps.players.context import get_request_player
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +52,7 @@ class NotificationsViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
         context = super().get_serializer_context()
         user = self.request.user
         if not isinstance(user, AnonymousUser):
-            context.update({'player': Player.objects.get(user=user)})
+            context.update({'player': get_request_player(self.request)})
         return context
 
     @swagger_auto_schema(
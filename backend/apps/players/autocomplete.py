@@ -0,0 +1,125 @@
+"""
+In-process prefix index for autocomplete of player names.
+
+Search names of registered players of one search partition (city or
+country, see get_search_partition) are kept in a sorted list, so
+suggestions for a prefix are found with a binary search and read from
+memory without database queries.
+Indexes are built on the first request of a partition and dropped in
+every process when players or their names change, see signals.
+"""
+
+from bisect import bisect_left
+
+from apps.core.cache import VersionedLocalCache
+from apps.players.constants import (
+    PLAYER_AUTOCOMPLETE_VERSION_KEY,
+    PlayerIntEnums,
+)
+from apps.players.models import Player
+from apps.players.search import normalize_search_value
+
+
+class PlayerPrefixIndex:
+    """
+    Sorted search names of registered players of one partition.
+    Arguments:
+        rows: (player_id, first_name, last_name,
+               search_first_name, search_last_name) of the players.
+    """
+
+    def __init__(self, rows):
+        self.players: dict[int, tuple[str, str]] = {}
+        keys = []
+        for player_id, first_name, last_name, *search_names in rows:
+            self.players[player_id] = (first_name, last_name)
+            keys.extend(
+                (search_name, player_id)
+                for search_name in search_names
+                if search_name
+            )
+        keys.sort()
+        self.keys: list[tuple[str, int]] = keys
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def suggest(
+        self, prefix: str, limit: int, exclude: int | None = None
+    ) -> list[dict]:
+        """
+        Return players with first or last name starting with prefix.
+        Exact matches go first, then names in alphabetical order.
+        """
+        suggestions = []
+        seen = {exclude}
+        position = bisect_left(self.keys, (prefix,))
+        while len(suggestions) < limit and position < len(self.keys):
+            search_name, player_id = self.keys[position]
+            if not search_name.startswith(prefix):
+                break
+            position += 1
+            if player_id in seen:
+                continue
+            seen.add(player_id)
+            first_name, last_name = self.players[player_id]
+            suggestions.append(
+                {
+                    'player_id': player_id,
+                    'first_name': first_name,
+                    'last_name': last_name,
+                }
+            )
+        return suggestions
+
+
+def partition_key(partition: tuple[str, int] | None) -> str:
+    if partition is None:
+        return 'all'
+    field, value = partition
+    return f'{field}:{value}'
+
+
+def load_index(partition: tuple[str, int] | None) -> PlayerPrefixIndex:
+    """Build prefix index of registered players of the partition."""
+    players = Player.objects.filter(is_registered=True)
+    if partition is not None:
+        players = players.filter(partition)
+    return PlayerPrefixIndex(
+        players.values_list(
+            'pk',
+            'user__first_name',
+            'user__last_name',
+            'search_first_name',
+            'search_last_name',
+        ).iterator(chunk_size=PlayerIntEnums.SEARCH_UPDATE_BATCH_SIZE)
+    )
+
+
+def get_index(partition: tuple[str, int] | None) -> PlayerPrefixIndex:
+    """Return fresh prefix index of the partition."""
+    return player_autocomplete_cache.get_or_load(
+        partition_key(partition), lambda: load_index(partition)
+    )
+
+
+def suggest_players(
+    partition: tuple[str, int] | None,
+    value: str,
+    limit: int = PlayerIntEnums.AUTOCOMPLETE_LIMIT,
+    exclude: int | None = None,
+) -> list[dict]:
+    """
+    Return registered players of the partition with first or last name
+    starting with value.
+    """
+    prefix = normalize_search_value(value)
+    if not prefix:
+        return []
+    return get_index(partition).suggest(prefix, limit, exclude)
+
+
+player_autocomplete_cache = VersionedLocalCache(
+    version_key=PLAYER_AUTOCOMPLETE_VERSION_KEY,
+    ttl=PlayerIntEnums.AUTOCOMPLETE_CACHE_TTL,
+)
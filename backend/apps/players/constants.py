@@ -32,6 +32,10 @@ class PlayerIntEnums(IntEnum):
     PLAYER_VOTE_LIMIT = 2
     RATING_PERIOD_DAYS = 60
     RECENT_ACTIVITIES_LENGTH = 5
+    SEARCH_UPDATE_BATCH_SIZE = 1000
+    AUTOCOMPLETE_LIMIT = 10
+    AUTOCOMPLETE_MAX_LIMIT = 50
+    AUTOCOMPLETE_CACHE_TTL = 600
 
 
 class Genders(models.TextChoices):
@@ -74,3 +78,5 @@ BASE_PAYMENT_DATA = [
         'is_preferred': False,
     },
 ]
+
+PLAYER_AUTOCOMPLETE_VERSION_KEY: str = 'players:autocomplete:version'
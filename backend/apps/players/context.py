@@ -0,0 +1,42 @@
+"""
+Player of the authenticated user shared by everything in one request:
+permissions, filters, viewsets and serializers.
+"""
+
+from rest_framework_simplejwt.models import TokenUser
+
+from apps.players.models import Player
+
+REQUEST_PLAYER_ATTR = '_request_player'
+
+
+def get_request_player(request) -> Player | None:
+    """
+    Return player of the authenticated user loaded once per request
+    with country, city and rating.
+    A player already cached on the user, e.g. loaded by the authentication,
+    is reused, so the request sees the same player as request.user.player.
+    Otherwise the player is cached on the request only, not on the user,
+    which may outlive the request.
+    A token user has its player built from the access token claims.
+    Arguments:
+        request: DRF Request or Django HttpRequest.
+    """
+    http_request = getattr(request, '_request', request)
+    if hasattr(http_request, REQUEST_PLAYER_ATTR):
+        return getattr(http_request, REQUEST_PLAYER_ATTR)
+    user = request.user
+    player = None
+    if isinstance(user, TokenUser):
+        player = getattr(user, 'player', None)
+    elif user.is_authenticated:
+        if type(user).player.is_cached(user):
+            player = getattr(user, 'player', None)
+        else:
+            player = (
+                Player.objects.select_related('country', 'city', 'rating')
+                .filter(user=user)
+                .first()
+            )
+    setattr(http_request, REQUEST_PLAYER_ATTR, player)
+    return player
@@ -1,7 +1,12 @@
 import django_filters
 from django.db.models import Case, IntegerField, Q, When
 
+from apps.players.context import get_request_player
 from apps.players.models import Player
+from apps.players.search import (
+    get_search_partition,
+    normalize_search_value,
+)
 
 
 class PlayersFilter(django_filters.FilterSet):
@@ -16,50 +21,43 @@ class PlayersFilter(django_filters.FilterSet):
         For Thailand users - also filters by location proximity.
         For Cyprus users - location is ignored.
         Results are sorted by relevance (exact match>startswith>contains).
+        Names are compared in normalized search columns of the players,
+        see apps.players.search.
         """
+        value = normalize_search_value(value)
         if not value:
             return queryset
 
         relevance_sort = Case(
-            When(user__first_name__iexact=value, then=1),
-            When(user__last_name__iexact=value, then=1),
-            When(user__first_name__istartswith=value, then=2),
-            When(user__last_name__istartswith=value, then=2),
+            When(
+                Q(search_first_name=value) | Q(search_last_name=value),
+                then=1,
+            ),
+            When(
+                Q(search_first_name__startswith=value)
+                | Q(search_last_name__startswith=value),
+                then=2,
+            ),
             default=3,
             output_field=IntegerField(),
         )
 
         request = getattr(self, 'request', None)
-        current_user_player = Player.objects.get(user=request.user)
-        current_country = current_user_player.country
-        current_city = current_user_player.city
-        queryset = queryset.exclude(user=request.user)
-        if current_country.name == 'Thailand':
-            filtered_queryset = (
-                queryset.filter(
-                    (
-                        Q(user__first_name__icontains=value)
-                        | Q(user__last_name__icontains=value)
-                    )
-                    & Q(city=current_city)
+        current_user_player = get_request_player(request)
+        queryset = queryset.exclude(user_id=request.user.id)
+        partition = get_search_partition(current_user_player)
+        location = Q(partition) if partition else Q()
+        return (
+            queryset.filter(
+                (
+                    Q(search_first_name__contains=value)
+                    | Q(search_last_name__contains=value)
                 )
-                .annotate(relevance=relevance_sort)
-                .order_by('relevance', 'user__first_name')
+                & location
             )
-        else:
-            filtered_queryset = (
-                queryset.filter(
-                    (
-                        Q(user__first_name__icontains=value)
-                        | Q(user__last_name__icontains=value)
-                    )
-                    & Q(country=current_country)
-                )
-                .annotate(relevance=relevance_sort)
-                .order_by('relevance', 'user__first_name')
-            )
-
-        return filtered_queryset
+            .annotate(relevance=relevance_sort)
+            .order_by('relevance', 'search_first_name', 'search_last_name')
+        )
 
     class Meta:
         model = Player
@@ -0,0 +1,186 @@
+import random
+import statistics
+import string
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Case, IntegerField, Q, When
+from rest_framework.test import APIRequestFactory
+
+from apps.locations.models import City, Country
+from apps.players.filters import PlayersFilter
+from apps.players.models import Player
+from apps.players.search import get_search_names
+
+User = get_user_model()
+
+BENCHMARK_PREFIX = 'benchmark_player_search'
+SYLLABLES = (
+    'an', 'ar', 'be', 'da', 'el', 'ka', 'ki', 'la', 'li', 'ma',
+    'mi', 'na', 'ni', 'or', 'ra', 'ri', 'sa', 'so', 'ta', 'to',
+)  # fmt: skip
+
+
+def legacy_search(queryset, player, value):
+    """Player search on user names as it was before the search columns."""
+    relevance_sort = Case(
+        When(user__first_name__iexact=value, then=1),
+        When(user__last_name__iexact=value, then=1),
+        When(user__first_name__istartswith=value, then=2),
+        When(user__last_name__istartswith=value, then=2),
+        default=3,
+        output_field=IntegerField(),
+    )
+    return (
+        queryset.exclude(user=player.user)
+        .filter(
+            (
+                Q(user__first_name__icontains=value)
+                | Q(user__last_name__icontains=value)
+            )
+            & Q(city=player.city)
+        )
+        .annotate(relevance=relevance_sort)
+        .order_by('relevance', 'user__first_name')
+    )
+
+
+def normalized_search(queryset, player, value):
+    """Player search with PlayersFilter on the search columns."""
+    request = APIRequestFactory().get('/players/', {'search': value})
+    request.user = player.user
+    filter_instance = PlayersFilter({'search': value}, queryset=queryset)
+    filter_instance.request = request
+    return filter_instance.qs
+
+
+class Command(BaseCommand):
+    """
+    Compare keystroke latency of the player search on user names
+    and on the normalized search columns.
+    Seeds players inside a transaction, types random names letter by
+    letter from random players and rolls the transaction back,
+    so the database is left unchanged.
+    """
+
+    help = 'Benchmark player search per keystroke'
+
+    searches = {'legacy': legacy_search, 'normalized': normalized_search}
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--players', type=int, default=100000, help='Players to seed'
+        )
+        parser.add_argument(
+            '--cities', type=int, default=2, help='Cities to seed'
+        )
+        parser.add_argument(
+            '--samples',
+            type=int,
+            default=20,
+            help='Number of names to type',
+        )
+        parser.add_argument(
+            '--keystrokes',
+            type=int,
+            default=5,
+            help='Letters typed from every name',
+        )
+        parser.add_argument(
+            '--explain',
+            action='store_true',
+            help='Print EXPLAIN ANALYZE of every search',
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            players = self.seed(options['players'], options['cities'])
+            sample = random.sample(
+                players, min(options['samples'], len(players))
+            )
+            for name, search in self.searches.items():
+                self.benchmark(
+                    name,
+                    search,
+                    sample,
+                    options['keystrokes'],
+                    options['explain'],
+                )
+            transaction.set_rollback(True)
+
+    def benchmark(self, name, search, players, keystrokes, explain):
+        timings = {}
+        for player in players:
+            target = random.choice(players).user.first_name
+            for length in range(1, min(keystrokes, len(target)) + 1):
+                queryset = search(
+                    Player.objects.all(), player, target[:length]
+                )
+                started = time.perf_counter()
+                list(queryset.values_list('pk', flat=True))
+                timings.setdefault(length, []).append(
+                    (time.perf_counter() - started) * 1000
+                )
+        for length, values in sorted(timings.items()):
+            values.sort()
+            p95 = values[int(len(values) * 0.95) - 1 if len(values) > 1 else 0]
+            self.stdout.write(
+                f'{name:>10} {length} letters: '
+                f'median {statistics.median(values):.3f} ms, '
+                f'p95 {p95:.3f} ms'
+            )
+        if explain:
+            player = players[0]
+            value = player.user.first_name[:2]
+            self.stdout.write(f'{name} "{value}":')
+            self.stdout.write(
+                search(Player.objects.all(), player, value).explain(
+                    analyze=True
+                )
+            )
+
+    def random_name(self):
+        name = ''.join(
+            random.choice(SYLLABLES) for _ in range(random.randint(2, 4))
+        )
+        return name.capitalize()
+
+    def seed(self, players_count, cities_count):
+        """Create players in cities of Thailand and return the players."""
+        self.stdout.write(f'Seeding {players_count} players...')
+        country, _ = Country.objects.get_or_create(name='Thailand')
+        cities = City.objects.bulk_create(
+            City(country=country, name=f'{BENCHMARK_PREFIX}_{i}')
+            for i in range(cities_count)
+        )
+        users = User.objects.bulk_create(
+            (
+                User(
+                    username=f'{BENCHMARK_PREFIX}_{i}',
+                    first_name=self.random_name(),
+                    last_name=self.random_name()
+                    + random.choice(string.ascii_lowercase),
+                )
+                for i in range(players_count)
+            ),
+            batch_size=5000,
+        )
+        players = Player.objects.bulk_create(
+            (
+                Player(
+                    user=user,
+                    country=country,
+                    city=random.choice(cities),
+                    is_registered=True,
+                    **get_search_names(user),
+                )
+                for user in users
+            ),
+            batch_size=5000,
+        )
+        with connection.cursor() as cursor:
+            for model in (User, Player):
+                cursor.execute(f'ANALYZE {model._meta.db_table}')
+        return players
@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.locations.models import Country
+from apps.players.autocomplete import get_index, player_autocomplete_cache
+from apps.players.models import Player
+from apps.players.search import get_search_partition
+
+
+class Command(BaseCommand):
+    """
+    Drop player autocomplete indexes in all processes and build
+    the index of every search partition to check it.
+    Processes rebuild their indexes on the next autocomplete request.
+    Run after changing players bypassing the model signals
+    (bulk updates, raw SQL, update_player_search_names).
+    """
+
+    help = 'Rebuild prefix indexes of player autocomplete'
+
+    def handle(self, *args, **options):
+        player_autocomplete_cache.invalidate()
+        countries = Country.objects.in_bulk()
+        partitions = {
+            get_search_partition(
+                Player(country=countries.get(country_id), city_id=city_id)
+            )
+            for country_id, city_id in Player.objects.filter(
+                is_registered=True
+            )
+            .values_list('country_id', 'city_id')
+            .distinct()
+        }
+        for partition in partitions:
+            started = time.perf_counter()
+            index = get_index(partition)
+            self.stdout.write(
+                f'{partition}: {len(index)} players in '
+                f'{(time.perf_counter() - started) * 1000:.1f} ms'
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt {len(partitions)} indexes')
+        )
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.players.models import Player
+
+
+class Command(BaseCommand):
+    """
+    Recompute normalized search names of every player.
+    Run after adding the search columns and whenever user names were
+    changed bypassing User.save() (bulk updates, raw SQL).
+    """
+
+    help = 'Recompute search names of players'
+
+    def handle(self, *args, **options):
+        updated = Player.objects.update_search_names()
+        self.stdout.write(
+            self.style.SUCCESS(f'Search names updated for {updated} players')
+        )
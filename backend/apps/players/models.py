@@ -16,6 +16,7 @@ from apps.players.constants import (
     PlayerIntEnums,
     PlayerStrEnums,
 )
+from apps.players.search import SEARCH_NAME_FIELDS, get_search_names
 
 User = get_user_model()
 
@@ -32,6 +33,27 @@ class PlayerQuerySet(models.QuerySet):
         """Returns number of players registered on a specific day."""
         return self.filter(user__date_joined__date=day).count()
 
+    def update_search_names(self) -> int:
+        """Recomputes search names of the players, returns changed count."""
+        changed = []
+        for player in self.select_related('user').only(
+            'pk', 'user__first_name', 'user__last_name', *SEARCH_NAME_FIELDS
+        ):
+            search_names = get_search_names(player.user)
+            if any(
+                getattr(player, field) != value
+                for field, value in search_names.items()
+            ):
+                for field, value in search_names.items():
+                    setattr(player, field, value)
+                changed.append(player)
+        self.model.objects.bulk_update(
+            changed,
+            SEARCH_NAME_FIELDS,
+            batch_size=PlayerIntEnums.SEARCH_UPDATE_BATCH_SIZE.value,
+        )
+        return len(changed)
+
 
 class PlayerManager(models.Manager):
     def get_queryset(self):
@@ -41,6 +63,10 @@ class PlayerManager(models.Manager):
         """Returns number of players registered on a specific day."""
         return self.get_queryset().get_stats_for_day(day)
 
+    def update_search_names(self) -> int:
+        """Recomputes search names of all players, returns changed count."""
+        return self.get_queryset().update_search_names()
+
 
 class Player(models.Model):
     """Player model."""
@@ -94,12 +120,90 @@ class Player(models.Model):
         default=False,
         null=False,
     )
+    search_first_name = models.CharField(
+        verbose_name=_('Normalized first name for search'),
+        max_length=PlayerIntEnums.PLAYER_DATA_MAX_LENGTH,
+        default='',
+        editable=False,
+    )
+    search_last_name = models.CharField(
+        verbose_name=_('Normalized last name for search'),
+        max_length=PlayerIntEnums.PLAYER_DATA_MAX_LENGTH,
+        default='',
+        editable=False,
+    )
     objects: PlayerManager = PlayerManager()
 
+    # Fields the autocomplete indexes are built and partitioned by.
+    AUTOCOMPLETE_FIELDS = (
+        'is_registered',
+        'country_id',
+        'city_id',
+        *SEARCH_NAME_FIELDS,
+    )
+
     class Meta:
         verbose_name = _('Player')
         verbose_name_plural = _('Players')
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._autocomplete_state = instance.get_autocomplete_state()
+        return instance
+
+    def get_autocomplete_state(self) -> tuple:
+        """Returns loaded values of the autocomplete fields."""
+        return tuple(
+            self.__dict__.get(field, models.DEFERRED)
+            for field in self.AUTOCOMPLETE_FIELDS
+        )
+
+    def get_changed_fields(self) -> set[str]:
+        """
+        Returns autocomplete fields changed since the player was loaded
+        or saved last time, all of them for a player never loaded.
+        """
+        state = getattr(self, '_autocomplete_state', None)
+        if state is None:
+            return set(self.AUTOCOMPLETE_FIELDS)
+        return {
+            field
+            for field, old, new in zip(
+                self.AUTOCOMPLETE_FIELDS,
+                state,
+                self.get_autocomplete_state(),
+                strict=True,
+            )
+            if old != new
+        }
+
+    def is_autocomplete_changed(self) -> bool:
+        """
+        Returns True if the autocomplete fields changed since the player
+        was loaded or saved last time.
+        """
+        return bool(self.get_changed_fields())
+
+    def save(self, *args, **kwargs):
+        """
+        Fill search names of a new player or of a player with loaded user.
+        Later changes of the user names are copied by the User signal.
+        """
+        if self.user_id is not None and (
+            self._state.adding or Player.user.is_cached(self)
+        ):
+            for field, value in get_search_names(self.user).items():
+                setattr(self, field, value)
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {
+                    *update_fields,
+                    *SEARCH_NAME_FIELDS,
+                }
+        super().save(*args, **kwargs)
+        self._autocomplete_state = self.get_autocomplete_state()
+
     def __str__(self):
         return f'Player {self.user.first_name} {self.user.last_name}'
 
@@ -0,0 +1,41 @@
+"""
+Normalized player names for search.
+
+Player keeps first and last names of the user in search columns,
+case-folded and with collapsed whitespace. The search compares them
+with the normalized search value using plain LIKE, so it does not join
+users and does not apply UPPER() to every row of the scanned players.
+"""
+
+import unicodedata
+
+SEARCH_NAME_FIELDS = ('search_first_name', 'search_last_name')
+
+
+def normalize_search_value(value: str | None) -> str:
+    """Return value in the form stored in the search columns."""
+    if not value:
+        return ''
+    return ' '.join(unicodedata.normalize('NFKC', value).casefold().split())
+
+
+def get_search_names(user) -> dict[str, str]:
+    """Return values of the search columns for the user."""
+    return {
+        'search_first_name': normalize_search_value(user.first_name),
+        'search_last_name': normalize_search_value(user.last_name),
+    }
+
+
+def get_search_partition(player) -> tuple[str, int] | None:
+    """
+    Return (field, id) of the location limiting the player search.
+    Players from Thailand search in their city, other players search
+    in their country, players without country search everywhere.
+    """
+    country = player.country
+    if country is None:
+        return None
+    if country.name == 'Thailand':
+        return 'city', player.city_id
+    return 'country', country.id
@@ -548,6 +548,21 @@ class PlayerListShortSerializer(serializers.Serializer):
     )
 
 
+class PlayerAutocompleteQuerySerializer(serializers.Serializer):
+    search = serializers.CharField(allow_blank=True, trim_whitespace=False)
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=PlayerIntEnums.AUTOCOMPLETE_MAX_LIMIT,
+        default=PlayerIntEnums.AUTOCOMPLETE_LIMIT,
+    )
+
+
+class PlayerSuggestionSerializer(serializers.Serializer):
+    player_id = serializers.IntegerField()
+    first_name = serializers.CharField()
+    last_name = serializers.CharField()
+
+
 class LatestActivitySerializer(serializers.Serializer):
     event_timestamp = serializers.DateTimeField()
     court_location = LocationSerializer(read_only=True)
@@ -1,15 +1,21 @@
 # signals.py
 import logging
 
-from django.db.models.signals import post_save
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from apps.players.autocomplete import player_autocomplete_cache
 from apps.players.constants import (
     BASE_PAYMENT_DATA,
     PlayerStrEnums,
 )
 from apps.players.models import Payment, Player, PlayerRating, PlayerRatingVote
 from apps.players.rating import PlayerRatingManager
+from apps.players.search import get_search_names
+
+User = get_user_model()
 
 logger = logging.getLogger(__name__)
 
@@ -60,3 +66,47 @@ def update_player_rating_on_vote(sender, instance, created, **kwargs):
             logger.info(f'Player id={instance.rated.id} rating {status}')
         except Exception as e:
             logger.error(f'Error updating player rating: {e}')
+
+
+@receiver(post_save, sender=User)
+def update_player_search_names(
+    sender, instance, created, update_fields, **kwargs
+):
+    """
+    Copy changed user names into the search names of the player.
+    Only a player with other search names is updated, so saving the user
+    with the same names does not invalidate autocomplete indexes.
+    """
+    if created:
+        return
+    if update_fields is not None and not (
+        {'first_name', 'last_name'} & set(update_fields)
+    ):
+        return
+    search_names = get_search_names(instance)
+    if (
+        Player.objects.filter(user=instance)
+        .exclude(**search_names)
+        .update(**search_names)
+    ):
+        transaction.on_commit(player_autocomplete_cache.invalidate)
+
+
+@receiver(post_save, sender=Player)
+def invalidate_player_autocomplete(sender, instance, created, **kwargs):
+    """
+    Rebuild autocomplete indexes in all processes if the player could
+    appear in, move between or disappear from the indexes, i.e. its
+    registration, location or search names changed.
+    """
+    if created and not instance.is_registered:
+        return
+    if not instance.is_autocomplete_changed():
+        return
+    transaction.on_commit(player_autocomplete_cache.invalidate)
+
+
+@receiver(post_delete, sender=Player)
+def invalidate_deleted_player_autocomplete(sender, instance, **kwargs):
+    """Rebuild autocomplete indexes without the deleted player."""
+    transaction.on_commit(player_autocomplete_cache.invalidate)
@@ -11,17 +11,23 @@ from rest_framework.viewsets import ReadOnlyModelViewSet
 from apps.core.permissions import IsNotRegisteredPlayer, IsRegisteredPlayer
 from apps.core.serializers import EmptyBodySerializer
 from apps.event.models import Game
+from apps.players.autocomplete import suggest_players
 from apps.players.constants import PlayerIntEnums
+from apps.players.context import get_request_player
+from apps.players.filters import PlayersFilter
 from apps.players.models import Favorite, Payment, Player
+from apps.players.search import get_search_partition
 from apps.players.serializers import (
     AvatarSerializer,
     FavoriteSerializer,
     PaymentSerializer,
     PaymentsSerializer,
+    PlayerAutocompleteQuerySerializer,
     PlayerBaseSerializer,
     PlayerKeyDetailSerializer,
     PlayerListSerializer,
     PlayerRegisterSerializer,
+    PlayerSuggestionSerializer,
 )
 from apps.users.models import User
 
@@ -55,15 +61,20 @@ class PlayerViewSet(ReadOnlyModelViewSet):
             return FavoriteSerializer
         return super().get_serializer_class(*args, **kwargs)
 
+    @property
+    def filterset_class(self):
+        """Search filter is applied to the list of players only."""
+        if self.action == 'list':
+            return PlayersFilter
+        return None
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         user = self.request.user
         if not isinstance(user, AnonymousUser):
             context.update(
                 {
-                    'player': self.queryset.filter(
-                        user=self.request.user
-                    ).first(),
+                    'player': get_request_player(self.request),
                     'current_user': self.request.user,
                 }
             )
@@ -73,7 +84,7 @@ class PlayerViewSet(ReadOnlyModelViewSet):
         queryset = super().get_queryset()
         current_player = None
         if not isinstance(self.request.user, AnonymousUser):
-            current_player = self.request.user.player
+            current_player = get_request_player(self.request)
 
         if self.action != 'register':
             queryset.exclude(is_registered=False)
@@ -109,7 +120,7 @@ class PlayerViewSet(ReadOnlyModelViewSet):
             return None
 
         if self.action == 'list':
-            queryset = queryset.exclude(user=self.request.user)
+            queryset = queryset.exclude(user_id=self.request.user.id)
             is_favorite_subquery = Favorite.objects.filter(
                 player=current_player, favorite=OuterRef('pk')
             )
@@ -122,7 +133,7 @@ class PlayerViewSet(ReadOnlyModelViewSet):
     def get_object(self):
         if self.action in ['me', 'register', 'put_delete_avatar', 'favorite']:
             obj = get_object_or_404(
-                self.queryset.filter(user=self.request.user)
+                self.queryset.filter(user_id=self.request.user.id)
             )
             self.check_object_permissions(self.request, obj)
 
@@ -136,6 +147,9 @@ class PlayerViewSet(ReadOnlyModelViewSet):
         operation_description="""
         **Returns:** a sorted list of all players excluding the current user.
         The favorite players are going first.
+
+        Pass `search` to get players with first or last name containing
+        the value, ordered by relevance: exact match, prefix, contains.
         """,
         responses={
             200: openapi.Response('Success', PlayerListSerializer(many=True)),
@@ -147,6 +161,42 @@ class PlayerViewSet(ReadOnlyModelViewSet):
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
+    @swagger_auto_schema(
+        tags=['players'],
+        operation_summary='Autocomplete player names',
+        operation_description="""
+        Suggestions for the invite search box, served from in-memory
+        prefix index of registered players in the same location
+        as the current player (city in Thailand, country elsewhere).
+
+        **Returns:** players with first or last name starting with
+        `search`, exact matches first, then in alphabetical order.
+        """,
+        query_serializer=PlayerAutocompleteQuerySerializer,
+        responses={
+            200: openapi.Response(
+                'Success', PlayerSuggestionSerializer(many=True)
+            ),
+            400: 'Bad request',
+            401: 'Unauthorized',
+            403: 'Forbidden',
+        },
+        security=[{'Bearer': []}, {'JWT': []}],
+    )
+    @action(methods=['get'], detail=False)
+    def autocomplete(self, request):
+        """Suggest players by the beginning of their names."""
+        query = PlayerAutocompleteQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        player = get_request_player(request)
+        suggestions = suggest_players(
+            get_search_partition(player),
+            query.validated_data['search'],
+            limit=query.validated_data['limit'],
+            exclude=player.pk,
+        )
+        return Response(suggestions, status=status.HTTP_200_OK)
+
     @swagger_auto_schema(
         tags=['players'],
         operation_summary='Get info about player',
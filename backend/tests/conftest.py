@@ -1,7 +1,10 @@
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
+from apps.notifications.cache import notification_settings_cache
+from apps.players.autocomplete import player_autocomplete_cache
 from apps.players.models import Player
 
 User = get_user_model()
@@ -20,6 +23,14 @@ pytest_plugins = [
 ]
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Do not share cached data between tests."""
+    cache.clear()
+    notification_settings_cache.clear()
+    player_autocomplete_cache.clear()
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
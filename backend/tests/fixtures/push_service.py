@@ -1,7 +1,12 @@
 import builtins
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
 from unittest.mock import Mock
 
 import pytest
+from pyfcm import FCMNotification  # type: ignore
 from pyfcm.errors import FCMError  # type: ignore
 
 from apps.notifications.push_service import PushService
@@ -138,6 +143,41 @@ def mock_fcm_service_token_fail():
     return mock_fcm
 
 
+@pytest.fixture
+def mock_fcm_multicast(monkeypatch):
+    """
+    Mock FCM multicast sending.
+    Tokens listed in `failed_tokens` attribute are reported as failed.
+    """
+
+    def send_each_for_multicast(message, app=None):
+        responses = []
+        for token in message.tokens:
+            success = token not in mock_send.failed_tokens
+            responses.append(
+                Mock(
+                    success=success,
+                    exception=None if success else FCMError('Invalid token'),
+                )
+            )
+        return Mock(responses=responses)
+
+    mock_send = Mock(side_effect=send_each_for_multicast)
+    mock_send.failed_tokens = set()
+    monkeypatch.setattr(
+        'apps.notifications.push_service.messaging.send_each_for_multicast',
+        mock_send,
+    )
+    return mock_send
+
+
+@pytest.fixture
+def push_service_batch(push_service_enabled, mock_fcm_multicast):
+    """PushService with Firebase app available for multicast sending."""
+    push_service_enabled.fb_admin = Mock()
+    return push_service_enabled
+
+
 @pytest.fixture
 def mock_celery_inspector_active():
     """Mock active Celery inspector."""
@@ -184,3 +224,90 @@ def mock_tasks_import(monkeypatch):
 
     monkeypatch.setattr(builtins, '__import__', mock_import_func)
     return mock_retry_task
+
+
+class FakeFCMHandler(BaseHTTPRequestHandler):
+    """Handler of FCM HTTP v1 send requests for FakeFCMServer."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        server = self.server
+        length = int(self.headers['Content-Length'])
+        token = json.loads(self.rfile.read(length))['message']['token']
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(server.response_delay)
+        with server.lock:
+            server.in_flight -= 1
+            server.tokens.append(token)
+        status = server.error_statuses.get(token, 200)
+        if status == 200:
+            body = {'name': f'projects/test/messages/{token}'}
+        else:
+            body = {'error': {'code': status}}
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeFCMServer(ThreadingHTTPServer):
+    """
+    Local HTTP server emulating FCM send endpoint.
+    Records received tokens, client connections and maximum number
+    of concurrent requests. Responds with status from `error_statuses`
+    for listed tokens.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), FakeFCMHandler)
+        self.lock = Lock()
+        self.tokens = []
+        self.connections = set()
+        self.error_statuses = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.response_delay = 0.02
+
+    @property
+    def end_point(self):
+        host, port = self.server_address
+        return f'http://{host}:{port}/v1/projects/test/messages:send'
+
+
+@pytest.fixture
+def fake_fcm_server():
+    """Run fake FCM server in background thread."""
+    server = FakeFCMServer()
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fake_fcm_client(fake_fcm_server):
+    """Real FCMNotification client sending requests to fake FCM server."""
+    fake_credentials = Mock(token='fake-access-token', project_id='test')
+    client = FCMNotification(credentials=fake_credentials)
+    client._fcm_end_point = fake_fcm_server.end_point
+    return client
+
+
+@pytest.fixture
+def push_service_fake_fcm(push_service_enabled, fake_fcm_client):
+    """PushService sending notifications to fake FCM server."""
+    push_service_enabled.push_service = fake_fcm_client
+    yield push_service_enabled
+    push_service_enabled.dispatcher.shutdown()
@@ -0,0 +1,163 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.authentication.authentication import (
+    PlayerJWTAuthentication,
+    PlayerTokenAuthentication,
+)
+from apps.authentication.tokens import PlayerRefreshToken, PlayerTokenUser
+from apps.players.context import get_request_player
+
+
+@pytest.mark.django_db
+class TestPlayerJWTAuthentication:
+    """Test the user is authenticated together with the player."""
+
+    def get_request(self, user):
+        token = AccessToken.for_user(user)
+        return Request(
+            APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}'),
+            authenticators=[PlayerJWTAuthentication()],
+        )
+
+    def test_player_is_loaded_with_user(
+        self, player_thailand, django_assert_num_queries
+    ):
+        request = self.get_request(player_thailand.user)
+
+        with django_assert_num_queries(1):
+            assert request.user == player_thailand.user
+        with django_assert_num_queries(0):
+            player = get_request_player(request)
+            assert player == player_thailand
+            assert player.country == player_thailand.country
+            assert player.city == player_thailand.city
+            assert player.rating.grade == player_thailand.rating.grade
+
+    def test_user_without_player(self, active_user, django_assert_num_queries):
+        request = self.get_request(active_user)
+
+        with django_assert_num_queries(1):
+            assert request.user == active_user
+        with django_assert_num_queries(0):
+            assert get_request_player(request) is None
+
+    def test_inactive_user_is_rejected(self, active_user):
+        token = AccessToken.for_user(active_user)
+        active_user.is_active = False
+        active_user.save()
+
+        with pytest.raises(AuthenticationFailed):
+            PlayerJWTAuthentication().get_user(token)
+
+    def test_bearer_token_authenticates_player(
+        self, api_client, player_thailand, django_assert_num_queries
+    ):
+        token = AccessToken.for_user(player_thailand.user)
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        url = reverse('api:players-me')
+
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['country'] == player_thailand.country_id
+
+
+@pytest.mark.django_db
+class TestPlayerTokenAuthentication:
+    """Test read only requests are authenticated from token claims."""
+
+    def get_request(self, token, method='get'):
+        http_request = getattr(APIRequestFactory(), method)(
+            '/', HTTP_AUTHORIZATION=f'Bearer {token}'
+        )
+        return Request(
+            http_request, authenticators=[PlayerTokenAuthentication()]
+        )
+
+    def test_read_request_makes_no_identity_queries(
+        self, player_thailand, django_assert_num_queries
+    ):
+        token = PlayerRefreshToken.for_user(player_thailand.user).access_token
+        request = self.get_request(token)
+
+        with django_assert_num_queries(0):
+            assert isinstance(request.user, PlayerTokenUser)
+            assert request.user.id == player_thailand.user_id
+            player = get_request_player(request)
+            assert player == player_thailand
+            assert player.is_registered is True
+            assert player.country_id == player_thailand.country_id
+            assert player.city_id == player_thailand.city_id
+
+    def test_unclaimed_fields_are_loaded_on_access(
+        self, player_thailand, django_assert_num_queries
+    ):
+        token = PlayerRefreshToken.for_user(player_thailand.user).access_token
+        player = get_request_player(self.get_request(token))
+
+        assert 'gender' in player.get_deferred_fields()
+        with django_assert_num_queries(1):
+            assert player.gender == player_thailand.gender
+        with django_assert_num_queries(1):
+            assert player.rating.grade == player_thailand.rating.grade
+
+    def test_write_request_loads_user(self, player_thailand):
+        token = PlayerRefreshToken.for_user(player_thailand.user).access_token
+        request = self.get_request(token, method='post')
+
+        assert request.user == player_thailand.user
+
+    def test_not_registered_player_loads_user(self, player_thailand):
+        player_thailand.is_registered = False
+        player_thailand.save()
+        token = PlayerRefreshToken.for_user(player_thailand.user).access_token
+        player_thailand.is_registered = True
+        player_thailand.save()
+        request = self.get_request(token)
+
+        assert request.user == player_thailand.user
+        assert get_request_player(request).is_registered is True
+
+    def test_location_change_loads_user_until_refresh(
+        self,
+        player_thailand,
+        player_cyprus,
+        django_capture_on_commit_callbacks,
+    ):
+        token = PlayerRefreshToken.for_user(player_thailand.user).access_token
+        with django_capture_on_commit_callbacks(execute=True):
+            player_thailand.country = player_cyprus.country
+            player_thailand.city = player_cyprus.city
+            player_thailand.save()
+        request = self.get_request(token)
+
+        assert request.user == player_thailand.user
+        assert not isinstance(request.user, PlayerTokenUser)
+        assert get_request_player(request).city_id == player_cyprus.city_id
+
+        token = PlayerRefreshToken.for_user(player_thailand.user).access_token
+        request = self.get_request(token)
+
+        assert isinstance(request.user, PlayerTokenUser)
+        assert get_request_player(request).city_id == player_cyprus.city_id
+
+    def test_other_changes_keep_claims(
+        self, player_thailand, django_capture_on_commit_callbacks
+    ):
+        token = PlayerRefreshToken.for_user(player_thailand.user).access_token
+        with django_capture_on_commit_callbacks(execute=True):
+            player_thailand.gender = 'FEMALE'
+            player_thailand.save()
+
+        assert isinstance(self.get_request(token).user, PlayerTokenUser)
+
+    def test_token_without_claims_loads_user(self, player_thailand):
+        request = self.get_request(AccessToken.for_user(player_thailand.user))
+
+        assert request.user == player_thailand.user
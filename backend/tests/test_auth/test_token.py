@@ -1,7 +1,16 @@
+import time
+
 import pytest
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from apps.authentication.tokens import (
+    PLAYER_CLAIMS,
+    PlayerRefreshToken,
+    get_refresh_token_class,
+)
 
 User = get_user_model()
 
@@ -27,3 +36,66 @@ class TestTokens:
     def _refresh_token(self, client, refresh_token):
         url = reverse('api:auth:token-refresh')
         return client.post(url, {'refresh_token': refresh_token})
+
+
+@pytest.mark.django_db
+class TestPlayerTokens:
+    """Test opt-in player claims of JWT tokens."""
+
+    def test_access_token_carries_player_claims(self, player_thailand):
+        issued_at = time.time()
+        access = PlayerRefreshToken.for_user(player_thailand.user).access_token
+
+        claims = {claim: access[claim] for claim in PLAYER_CLAIMS}
+        assert claims.pop('claims_at') >= issued_at
+        assert claims == {
+            'player_id': player_thailand.id,
+            'is_registered': True,
+            'country_id': player_thailand.country_id,
+            'city_id': player_thailand.city_id,
+        }
+
+    def test_user_without_player_has_no_claims(self, active_user):
+        access = PlayerRefreshToken.for_user(active_user).access_token
+
+        assert not set(PLAYER_CLAIMS) & set(access.payload)
+
+    @pytest.mark.parametrize(
+        'enabled, token_class',
+        ((True, PlayerRefreshToken), (False, RefreshToken)),
+    )
+    def test_token_class_is_opt_in(self, settings, enabled, token_class):
+        settings.PLAYER_TOKEN_CLAIMS = enabled
+
+        assert get_refresh_token_class() is token_class
+
+    def test_claims_are_reloaded_on_refresh(
+        self, api_client, settings, player_thailand
+    ):
+        settings.PLAYER_TOKEN_CLAIMS = True
+        refresh = PlayerRefreshToken.for_user(player_thailand.user)
+        player_thailand.is_registered = False
+        player_thailand.save()
+
+        response = api_client.post(
+            reverse('api:auth:token-refresh'),
+            {'refresh_token': str(refresh)},
+        )
+
+        access = AccessToken(response.data['access_token'])
+        assert access['player_id'] == player_thailand.id
+        assert access['is_registered'] is False
+        assert access['claims_at'] > refresh['claims_at']
+
+    def test_refresh_without_claims_by_default(
+        self, api_client, player_thailand
+    ):
+        refresh = RefreshToken.for_user(player_thailand.user)
+
+        response = api_client.post(
+            reverse('api:auth:token-refresh'),
+            {'refresh_token': str(refresh)},
+        )
+
+        access = AccessToken(response.data['access_token'])
+        assert not set(PLAYER_CLAIMS) & set(access.payload)
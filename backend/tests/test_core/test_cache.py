@@ -0,0 +1,96 @@
+from unittest.mock import Mock
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.cache import (
+    cached,
+    get_or_set,
+    get_tag_versions,
+    invalidate_tags,
+    make_key,
+)
+
+
+@pytest.mark.django_db
+class TestCacheHelpers:
+    """Tests for read-through cache helpers."""
+
+    def test_tests_use_local_memory_cache(self):
+        """Test suite must not depend on Redis."""
+        assert settings.CACHES['default']['BACKEND'].endswith('LocMemCache')
+
+    def test_make_key_is_namespaced(self):
+        assert make_key('countries', 1) == 'cache:countries:1'
+
+    def test_get_or_set_calls_loader_once(self):
+        loader = Mock(return_value={'value': 1})
+
+        first = get_or_set(make_key('test'), loader)
+        second = get_or_set(make_key('test'), loader)
+
+        assert first == second == {'value': 1}
+        loader.assert_called_once()
+
+    def test_get_or_set_respects_timeout(self, monkeypatch):
+        set_mock = Mock(wraps=cache.set)
+        monkeypatch.setattr(cache, 'set', set_mock)
+
+        get_or_set(make_key('ttl'), lambda: 'value', timeout=10)
+
+        assert set_mock.call_args.kwargs['timeout'] == 10
+
+    def test_none_is_not_cached(self):
+        loader = Mock(return_value=None)
+
+        get_or_set(make_key('none'), loader)
+        get_or_set(make_key('none'), loader)
+
+        assert loader.call_count == 2
+
+    def test_none_is_not_stored(self, monkeypatch):
+        set_mock = Mock(wraps=cache.set)
+        monkeypatch.setattr(cache, 'set', set_mock)
+
+        get_or_set(make_key('none'), lambda: None, timeout=10)
+
+        set_mock.assert_not_called()
+        assert make_key('none') not in cache
+
+    def test_invalidate_tags_makes_tagged_values_stale(self):
+        loader = Mock(side_effect=['old', 'new', 'other'])
+
+        assert get_or_set(make_key('a'), loader, tags=['t1']) == 'old'
+        invalidate_tags('t1')
+
+        assert get_or_set(make_key('a'), loader, tags=['t1']) == 'new'
+        assert get_or_set(make_key('a'), loader) == 'other'
+
+    def test_invalidate_tags_keeps_other_tags(self):
+        loader = Mock(side_effect=['value', 'unexpected'])
+        get_or_set(make_key('b'), loader, tags=['t1', 't2'])
+        versions = get_tag_versions(['t1', 't2'])
+
+        invalidate_tags('t3')
+
+        assert get_tag_versions(['t1', 't2']) == versions
+        assert get_or_set(make_key('b'), loader, tags=['t2', 't1']) == 'value'
+
+    def test_cached_decorator_uses_key_function(self):
+        calls = []
+
+        @cached(lambda pk: make_key('item', pk), tags=['items'])
+        def get_item(pk):
+            """Return item."""
+            calls.append(pk)
+            return {'pk': pk}
+
+        assert get_item(1) == {'pk': 1}
+        assert get_item(1) == {'pk': 1}
+        assert get_item(2) == {'pk': 2}
+        invalidate_tags('items')
+        assert get_item(1) == {'pk': 1}
+
+        assert calls == [1, 2, 1]
+        assert get_item.__doc__ == 'Return item.'
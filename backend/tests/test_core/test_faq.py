@@ -107,7 +107,7 @@ def test_faq_api_returns_active_faq(auth_api_client_registered_player):
     url = reverse('api:faq')
     response = auth_api_client_registered_player.get(url)
     assert response.status_code == status.HTTP_200_OK
-    assert response.data['faq'] == faq.content
+    assert response.json()['faq'] == faq.content
 
 
 @pytest.mark.django_db
@@ -135,3 +135,95 @@ def test_faq_api_for_unregistered_player(
     url = reverse('api:faq')
     response = auth_api_client_with_not_registered_player.get(url)
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestFAQAPICache:
+    """Test FAQ endpoint caching and conditional requests."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        FAQ.objects.all().delete()
+        self.faq = FAQ.objects.create(content='Cached FAQ', is_active=True)
+        self.url = reverse('api:faq')
+
+    def test_response_has_validators(self, auth_api_client_registered_player):
+        response = auth_api_client_registered_player.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag']
+        assert response['Last-Modified']
+        assert 'private' in response['Cache-Control']
+
+    def test_if_none_match_returns_not_modified(
+        self, auth_api_client_registered_player
+    ):
+        etag = auth_api_client_registered_player.get(self.url)['ETag']
+
+        response = auth_api_client_registered_player.get(
+            self.url, HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+        assert not response.content
+
+    def test_if_modified_since_returns_not_modified(
+        self, auth_api_client_registered_player
+    ):
+        last_modified = auth_api_client_registered_player.get(self.url)[
+            'Last-Modified'
+        ]
+
+        response = auth_api_client_registered_player.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_cached_faq_is_not_queried(
+        self,
+        auth_api_client_registered_player,
+        django_assert_num_queries,
+    ):
+        auth_api_client_registered_player.get(self.url)
+
+        with django_assert_num_queries(0):
+            response = auth_api_client_registered_player.get(self.url)
+
+        assert response.json()['faq'] == 'Cached FAQ'
+
+    def test_faq_update_invalidates_cache(
+        self, auth_api_client_registered_player
+    ):
+        etag = auth_api_client_registered_player.get(self.url)['ETag']
+        self.faq.content = 'Updated FAQ'
+        self.faq.save()
+
+        response = auth_api_client_registered_player.get(
+            self.url, HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+        assert response.json()['faq'] == 'Updated FAQ'
+
+    def test_new_active_faq_invalidates_cache(
+        self, auth_api_client_registered_player
+    ):
+        auth_api_client_registered_player.get(self.url)
+        FAQ.objects.create(content='New FAQ', is_active=True)
+
+        response = auth_api_client_registered_player.get(self.url)
+
+        assert response.json()['faq'] == 'New FAQ'
+
+    def test_faq_delete_invalidates_cache(
+        self, auth_api_client_registered_player
+    ):
+        auth_api_client_registered_player.get(self.url)
+        self.faq.delete()
+
+        response = auth_api_client_registered_player.get(self.url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
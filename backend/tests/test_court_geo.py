@@ -0,0 +1,228 @@
+import pytest
+from django.db import connection
+from rest_framework import status
+
+from apps.courts.enums import LocationEnums
+from apps.courts.geo import bounding_box, covering_cells, encode
+from apps.courts.models import Court, CourtLocation
+
+KM_IN_LATITUDE_DEGREE = 111.195
+
+
+@pytest.mark.django_db
+class TestGeohash:
+    @pytest.mark.parametrize(
+        'latitude, longitude, precision, expected',
+        (
+            (57.64911, 10.40744, 11, 'u4pruydqqvj'),
+            (42.6, -5.6, 5, 'ezs42'),
+            (-90, -180, 4, '0000'),
+            (90, 180, 4, 'zzzz'),
+        ),
+    )
+    def test_encode(self, latitude, longitude, precision, expected):
+        assert encode(latitude, longitude, precision) == expected
+
+    @pytest.mark.parametrize(
+        'latitude, longitude, radius',
+        (
+            (-54.321, 12.345, 10),
+            (35.0, 33.0, 0.1),
+            (13.7, 100.5, 100),
+            (0, 179.99, 20),
+            (89.99, 0, 5),
+        ),
+    )
+    def test_covering_cells_contain_whole_box(
+        self, latitude, longitude, radius
+    ):
+        south, west, north, east = bounding_box(latitude, longitude, radius)
+        cells = covering_cells(south, west, north, east)
+        steps = 10
+
+        assert len(cells) <= LocationEnums.GEOHASH_MAX_CELLS.value
+        for i in range(steps + 1):
+            for j in range(steps + 1):
+                point_lat = south + (north - south) * i / steps
+                point_lon = west + (east - west) * j / steps
+                point_lon = (point_lon + 180) % 360 - 180
+                geohash = encode(point_lat, point_lon)
+                assert any(geohash.startswith(cell) for cell in cells)
+
+
+@pytest.mark.django_db
+class TestCourtLocationNearby:
+    @pytest.fixture
+    def create_location(self):
+        def create(latitude, longitude):
+            return CourtLocation.objects.create(
+                latitude=latitude,
+                longitude=longitude,
+                court_name=f'Court {latitude} {longitude}',
+            )
+
+        return create
+
+    def test_geohash_is_computed_on_save(self, create_location):
+        location = create_location(57.64911, 10.40744)
+
+        location.latitude = 42.6
+        location.longitude = -5.6
+        location.save(update_fields=['latitude', 'longitude'])
+
+        location.refresh_from_db()
+        assert location.geohash == encode(42.6, -5.6)
+
+    def test_nearby_locations_ordered_by_distance(self, create_location):
+        far = create_location(0.2, 0)
+        middle = create_location(-0.05, 0)
+        near = create_location(0, 0.01)
+
+        locations = list(CourtLocation.objects.nearby(0, 0, 10))
+
+        assert locations == [near, middle]
+        assert far not in locations
+        assert locations[1].distance == pytest.approx(
+            0.05 * KM_IN_LATITUDE_DEGREE, rel=1e-3
+        )
+
+    def test_nearby_locations_across_antimeridian(self, create_location):
+        location = create_location(0, -179.99)
+
+        locations = list(CourtLocation.objects.nearby(0, 179.99, 5))
+
+        assert locations == [location]
+
+    @pytest.mark.parametrize(
+        'search',
+        (
+            lambda locations: locations.nearby(0, 0, 10),
+            lambda locations: locations.in_box(-0.1, -0.1, 0.1, 0.1),
+        ),
+        ids=('nearby', 'in_box'),
+    )
+    def test_geo_search_uses_geohash_index(self, create_location, search):
+        create_location(0, 0)
+
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = search(CourtLocation.objects).explain()
+
+        assert 'geohash' in plan, plan
+        assert 'Seq Scan' not in plan, plan
+
+    def test_locations_in_box(self, create_location):
+        inside = create_location(10, 20)
+        create_location(10, 21)
+        create_location(11, 20)
+
+        locations = list(CourtLocation.objects.in_box(9.5, 19.5, 10.5, 20.5))
+
+        assert locations == [inside]
+
+    def test_locations_in_box_across_antimeridian(self, create_location):
+        east = create_location(0, 179.9)
+        west = create_location(0, -179.9)
+        create_location(0, 0)
+
+        locations = set(CourtLocation.objects.in_box(-1, 179, 1, -179))
+
+        assert locations == {east, west}
+
+
+@pytest.mark.django_db
+class TestCourtsGeoFilter:
+    """Test radius and bounding box search of the courts endpoint."""
+
+    def get_court_ids(self, client, url, params):
+        response = client.get(url, params)
+        assert response.status_code == status.HTTP_200_OK
+        return [court['court_id'] for court in response.data]
+
+    def test_radius_search_ignores_player_location(
+        self,
+        auth_api_client_registered_player,
+        court_list_url,
+        court_thailand,
+        court_cyprus,
+    ):
+        location = court_cyprus.location
+
+        court_ids = self.get_court_ids(
+            auth_api_client_registered_player,
+            court_list_url,
+            {'lat': location.latitude, 'lon': location.longitude},
+        )
+
+        assert court_ids == [court_cyprus.id]
+
+    def test_radius_search_ordered_by_distance(
+        self,
+        auth_api_client_registered_player,
+        court_list_url,
+        court_thailand,
+    ):
+        location = court_thailand.location
+        near_location = CourtLocation.objects.create(
+            latitude=location.latitude + 0.02,
+            longitude=location.longitude,
+            court_name='Court near',
+        )
+        near_court = Court.objects.create(location=near_location)
+
+        court_ids = self.get_court_ids(
+            auth_api_client_registered_player,
+            court_list_url,
+            {
+                'lat': location.latitude + 0.015,
+                'lon': location.longitude,
+                'radius': 5,
+            },
+        )
+
+        assert court_ids == [near_court.id, court_thailand.id]
+
+    def test_bbox_search(
+        self,
+        auth_api_client_registered_player,
+        court_list_url,
+        court_thailand,
+        court_cyprus,
+    ):
+        location = court_cyprus.location
+        bbox = (
+            location.longitude - 0.1,
+            location.latitude - 0.1,
+            location.longitude + 0.1,
+            location.latitude + 0.1,
+        )
+
+        court_ids = self.get_court_ids(
+            auth_api_client_registered_player,
+            court_list_url,
+            {'bbox': ','.join(map(str, bbox))},
+        )
+
+        assert court_ids == [court_cyprus.id]
+
+    @pytest.mark.parametrize(
+        'params',
+        (
+            {'lat': 10},
+            {'lon': 10},
+            {'lat': 91, 'lon': 10},
+            {'lat': 10, 'lon': 10, 'radius': 1000},
+            {'bbox': '1,2,3'},
+            {'bbox': '1,2,3,wrong'},
+            {'bbox': '1,20,3,10'},
+            {'bbox': '1,2,181,3'},
+        ),
+    )
+    def test_invalid_geo_query(
+        self, auth_api_client_registered_player, court_list_url, params
+    ):
+        response = auth_api_client_registered_player.get(
+            court_list_url, params
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -2,6 +2,8 @@ import pytest
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
 
+from apps.core.models import CurrencyType
+
 
 @pytest.mark.django_db
 class TestCurrenciesView:
@@ -29,17 +31,17 @@ class TestCurrenciesView:
         """Test successful retrieval of currencies."""
         response = self.client.get(self.url)
         assert response.status_code == 200
-        assert 'currencies' in response.data
+        assert 'currencies' in response.json()
 
     def test_currencies_data_structure(self):
         """Test the structure of the returned currencies data."""
         response = self.client.get(self.url)
         assert response.status_code == 200
-        assert isinstance(response.data, dict)
-        assert 'currencies' in response.data
-        assert isinstance(response.data['currencies'], list)
+        assert isinstance(response.json(), dict)
+        assert 'currencies' in response.json()
+        assert isinstance(response.json()['currencies'], list)
 
-        for currency in response.data['currencies']:
+        for currency in response.json()['currencies']:
             assert isinstance(currency, dict)
             for key, v in self.data_structure['currencies'][0].items():
                 assert key in currency
@@ -72,3 +74,36 @@ class TestCurrenciesView:
         """Test that PATCH method is not allowed."""
         response = self.client.patch(self.url, data={})
         assert response.status_code == 405
+
+    def test_conditional_request_returns_not_modified(self):
+        """Test matching ETag returns 304."""
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_cached_payload_does_not_touch_db(self, django_assert_num_queries):
+        """Test second request is served without DB queries."""
+        self.client.get(self.url)
+
+        with django_assert_num_queries(0):
+            response = self.client.get(self.url)
+
+        assert response.status_code == 200
+
+    def test_currency_change_regenerates_payload(self, country_cyprus):
+        """Test changed currency type is returned with new ETag."""
+        etag = self.client.get(self.url)['ETag']
+        currency = CurrencyType.objects.get(country=country_cyprus)
+        country_cyprus.delete()
+
+        response = self.client.get(self.url)
+
+        assert response['ETag'] != etag
+        returned = next(
+            c
+            for c in response.json()['currencies']
+            if c['currency_id'] == currency.id
+        )
+        assert returned['country']['country_id'] is None
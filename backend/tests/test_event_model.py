@@ -2,6 +2,8 @@ from datetime import timedelta
 
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.dateparse import parse_datetime
 from django.utils.timezone import now
@@ -31,7 +33,7 @@ class TestGameModel:
         assert game.max_players == game_data['max_players']
         assert game.price_per_person == game_data['price_per_person']
         assert game.payment_type == game_data['payment_type']
-        assert list(game.players.all()) == players
+        assert list(game.players.order_by('id')) == players
         assert game.host == player_thailand
         assert game.currency_type == game_data['currency_type']
         assert game.payment_account == game_data['payment_account']
@@ -368,6 +370,59 @@ class TestGameFiltering:
         response = api_client_thailand.get(reverse('api:games-preview'))
         assert response.json() == {'upcoming_game_time': None, 'invites': 1}
 
+    def test_preview_runs_single_query(
+        self,
+        api_client_thailand,
+        player_thailand,
+        game_thailand,
+        django_assert_num_queries,
+    ):
+        with django_assert_num_queries(1):
+            response = api_client_thailand.get(reverse('api:games-preview'))
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_preview_counts_invited_games_once(
+        self,
+        player_thailand,
+        player_cyprus,
+        game_thailand,
+        game_cyprus,
+        player_thailand_female_pro,
+    ):
+        for game, host in (
+            (game_thailand, player_thailand),
+            (game_thailand, player_cyprus),
+            (game_cyprus, player_cyprus),
+        ):
+            GameInvitation.objects.create(
+                game=game, host=host, invited=player_thailand_female_pro
+            )
+
+        preview = Game.objects.preview(player_thailand_female_pro)
+
+        assert preview == {'upcoming_game_time': None, 'invites': 2}
+
+    def test_preview_nearest_game_of_player(
+        self,
+        game_thailand,
+        game_cyprus,
+        player_thailand_female_pro,
+    ):
+        game_thailand.start_time = now() - timedelta(hours=1)
+        game_thailand.save()
+        game_thailand.players.add(player_thailand_female_pro)
+        game_cyprus.start_time = now() + timedelta(hours=5)
+        game_cyprus.save()
+        game_cyprus.players.add(player_thailand_female_pro)
+
+        preview = Game.objects.preview(player_thailand_female_pro)
+
+        assert preview == {
+            'upcoming_game_time': game_cyprus.start_time,
+            'invites': 0,
+        }
+
     def test_my_games_filtering(
         self,
         api_client_thailand,
@@ -429,3 +484,168 @@ class TestGameFiltering:
         )
         assert len(upcoming_games) == 1
         assert upcoming_games.first() == game_thailand
+
+
+@pytest.mark.django_db
+class TestGameListQueries:
+    """Test game list actions run a fixed number of queries."""
+
+    @pytest.fixture
+    def create_games(self, game_data, player_thailand_female_pro):
+        def create(quantity, start_time=None):
+            working_data = game_data.copy()
+            players = working_data.pop('players')
+            levels = working_data.pop('player_levels')
+            if start_time is not None:
+                working_data['start_time'] = start_time
+                working_data['end_time'] = start_time + timedelta(hours=1)
+            for _ in range(quantity):
+                game = Game.objects.create(**working_data)
+                game.players.set(players)
+                game.player_levels.set(levels)
+                GameInvitation.objects.create(
+                    host=game.host,
+                    invited=player_thailand_female_pro,
+                    game=game,
+                )
+
+        return create
+
+    def count_queries(self, client, url):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        return len(context.captured_queries), response.json()['games']
+
+    @pytest.mark.parametrize(
+        'name, start_time, as_invited, queries_limit',
+        (
+            ('api:games-my-games', None, False, 2),
+            ('api:games-upcoming-games', None, False, 3),
+            ('api:games-invited-games', None, True, 3),
+            ('api:games-archive-games', now() - timedelta(days=1), False, 3),
+        ),
+    )
+    def test_list_queries_do_not_depend_on_games_number(
+        self,
+        client,
+        active_user,
+        player_thailand_female_pro,
+        create_games,
+        name,
+        start_time,
+        as_invited,
+        queries_limit,
+    ):
+        user = player_thailand_female_pro.user if as_invited else active_user
+        client.force_authenticate(user)
+        url = reverse(name)
+
+        create_games(1, start_time)
+        queries_for_one, games = self.count_queries(client, url)
+        assert len(games) == 1
+
+        create_games(5, start_time)
+        queries_for_many, games = self.count_queries(client, url)
+        assert len(games) == 6
+
+        assert queries_for_many == queries_for_one
+        assert queries_for_many <= queries_limit
+
+    def test_list_returns_short_game_data(
+        self, api_client_thailand, create_games, player_thailand
+    ):
+        create_games(2)
+
+        response = api_client_thailand.get(reverse('api:games-my-games'))
+
+        game = response.json()['games'][0]
+        assert set(game) == {
+            'game_id',
+            'host',
+            'court_location',
+            'message',
+            'start_time',
+            'end_time',
+        }
+        assert game['host']['level'] == player_thailand.rating.grade
+        assert game['court_location']['location_name']
+
+    @pytest.mark.parametrize(
+        'name', ('api:games-upcoming-games', 'api:games-archive-games')
+    )
+    def test_list_returns_full_game_data(
+        self, api_client_thailand, create_games, name
+    ):
+        create_games(1, now() - timedelta(days=1))
+        create_games(1)
+
+        response = api_client_thailand.get(reverse(name))
+
+        game = response.json()['games'][0]
+        assert {'gender', 'levels', 'players', 'price_per_person'} <= set(game)
+
+    def test_detail_queries_do_not_depend_on_players_number(
+        self,
+        api_client_thailand,
+        game_thailand_with_players,
+        django_assert_max_num_queries,
+    ):
+        url = reverse(
+            'api:games-detail', args=(game_thailand_with_players.id,)
+        )
+
+        with django_assert_max_num_queries(5):
+            response = api_client_thailand.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()['players']) == (
+            game_thailand_with_players.players.count()
+        )
+
+
+@pytest.mark.django_db
+class TestPlayerRelatedGamesStrategies:
+    """Test all strategies of player related games return same games."""
+
+    @pytest.fixture
+    def related_games(
+        self,
+        game_thailand,
+        game_thailand_with_players,
+        game_cyprus,
+        player_thailand,
+        player_cyprus,
+    ):
+        """Player from Thailand hosts two games and plays in Cyprus game."""
+        game_cyprus.players.add(player_thailand)
+        game_thailand_with_players.players.add(player_thailand)
+        return {game_thailand, game_thailand_with_players, game_cyprus}
+
+    @pytest.mark.parametrize('strategy', ['distinct', 'exists', 'union'])
+    def test_strategy_returns_related_games_once(
+        self, strategy, related_games, player_thailand
+    ):
+        games = list(
+            Game.objects.player_related_games(player_thailand, strategy)
+        )
+
+        assert len(games) == len(related_games)
+        assert set(games) == related_games
+
+    @pytest.mark.parametrize('strategy', ['distinct', 'exists', 'union'])
+    def test_strategy_supports_chained_filters(
+        self, strategy, related_games, player_thailand, settings
+    ):
+        settings.GAME_RELATED_GAMES_STRATEGY = strategy
+        archived = min(related_games, key=lambda game: game.id)
+        archived.start_time = now() - timedelta(days=1, hours=2)
+        archived.end_time = now() - timedelta(days=1)
+        archived.save()
+
+        assert list(Game.objects.archive_games(player_thailand)) == [archived]
+        assert Game.objects.upcoming_games(player_thailand).count() == 2
+
+    def test_unknown_strategy(self, player_thailand):
+        with pytest.raises(ValueError):
+            Game.objects.player_related_games(player_thailand, 'wrong')
@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from apps.event.enums import RelatedGamesStrategy
+from apps.event.models import Game, Tourney
+from apps.event.utils import get_events_to_rate
+
+
+@pytest.mark.django_db
+class TestEventIndexes:
+    """
+    Test hot time window queries can use the event indexes.
+    Test tables are tiny and a sequential scan is always cheaper there,
+    so sequential scans are disabled to check which index is chosen.
+    """
+
+    @pytest.fixture(autouse=True)
+    def disable_seqscan(self):
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def assert_uses_index(self, queryset, index_name):
+        plan = queryset.explain()
+        assert index_name in plan, plan
+
+    @pytest.mark.parametrize('strategy', list(RelatedGamesStrategy))
+    def test_archive_games_use_end_time_index(
+        self, settings, player_thailand, strategy
+    ):
+        settings.GAME_RELATED_GAMES_STRATEGY = strategy.value
+        queryset = Game.objects.archive_games(player_thailand)
+
+        self.assert_uses_index(queryset, 'game_end_time_idx')
+
+    def test_archive_host_games_use_host_start_index(
+        self, settings, player_thailand
+    ):
+        settings.GAME_RELATED_GAMES_STRATEGY = RelatedGamesStrategy.UNION
+        queryset = Game.objects.archive_games(player_thailand)
+
+        self.assert_uses_index(queryset, 'game_host_start_idx')
+
+    @pytest.mark.parametrize(
+        'model, index_name',
+        (
+            (Game, 'game_active_end_idx'),
+            (Tourney, 'tourney_active_end_idx'),
+        ),
+    )
+    def test_rate_notification_query_uses_partial_index(
+        self, model, index_name
+    ):
+        queryset = get_events_to_rate(
+            model, timezone.now() - timedelta(hours=1)
+        )
+
+        self.assert_uses_index(queryset, index_name)
+
+    def test_future_games_use_partial_index(self):
+        self.assert_uses_index(
+            Game.objects.future_games(), 'game_active_start_idx'
+        )
+
+    def test_nearby_games_use_geohash_index(self, court_thailand):
+        location = court_thailand.location
+        queryset = Game.objects.nearby_games(
+            location.latitude, location.longitude, 10
+        )
+
+        self.assert_uses_index(queryset, 'geohash')
@@ -0,0 +1,301 @@
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError
+from django.urls import reverse
+from rest_framework import status
+
+from apps.event.models import Game, GameInvitation
+from apps.notifications.constants import NotificationTypes
+from apps.notifications.models import Device
+from apps.notifications.push_service import PushService
+from apps.players.constants import Grades
+from apps.players.models import Player
+
+User = get_user_model()
+
+INVITES_QUERIES_LIMIT = 8
+CREATE_GAME_QUERIES_LIMIT = 17
+
+
+@pytest.fixture
+def invited_players():
+    players = []
+    for i in range(20):
+        user = User.objects.create(
+            username=f'invited_player_{i}',
+            first_name='Invited',
+            last_name=f'Player {i}',
+        )
+        players.append(Player.objects.create(user=user, is_registered=True))
+    return players
+
+
+@pytest.fixture
+def mock_invite_task():
+    with patch(
+        'apps.event.serializers.send_invite_notifications_task'
+    ) as task:
+        yield task
+
+
+@pytest.mark.django_db
+class TestGameBulkInvite:
+    """Test inviting a list of players to the game at once."""
+
+    @pytest.fixture
+    def url(self, game_thailand):
+        return reverse('api:games-invite-players', args=(game_thailand.id,))
+
+    def test_invite_players_in_fixed_number_of_queries(
+        self,
+        api_client_thailand,
+        game_thailand,
+        invited_players,
+        url,
+        mock_invite_task,
+        django_assert_max_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        player_ids = [player.id for player in invited_players]
+
+        with (
+            django_assert_max_num_queries(INVITES_QUERIES_LIMIT),
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            response = api_client_thailand.post(
+                url, {'players': player_ids}, format='json'
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert set(
+            GameInvitation.objects.filter(game=game_thailand).values_list(
+                'invited_id', flat=True
+            )
+        ) == set(player_ids)
+        mock_invite_task.delay.assert_called_once_with(
+            game_thailand.id, player_ids
+        )
+
+    def test_notification_is_not_sent_before_commit(
+        self,
+        api_client_thailand,
+        invited_players,
+        url,
+        mock_invite_task,
+        django_capture_on_commit_callbacks,
+    ):
+        with django_capture_on_commit_callbacks() as callbacks:
+            api_client_thailand.post(
+                url, {'players': [invited_players[0].id]}, format='json'
+            )
+
+        assert len(callbacks) == 1
+        mock_invite_task.delay.assert_not_called()
+
+    @pytest.mark.parametrize(
+        'invalid',
+        ('self', 'repeated', 'missing', 'participant', 'invited', 'level'),
+    )
+    def test_invalid_player_rejects_all_invitations(
+        self,
+        api_client_thailand,
+        game_thailand,
+        player_thailand,
+        invited_players,
+        url,
+        mock_invite_task,
+        invalid,
+    ):
+        player_ids = [player.id for player in invited_players[:3]]
+        invalid_player = invited_players[3]
+        if invalid == 'self':
+            player_ids.append(player_thailand.id)
+        elif invalid == 'repeated':
+            player_ids.append(player_ids[0])
+        elif invalid == 'missing':
+            player_ids.append(invalid_player.id + 1000)
+        elif invalid == 'participant':
+            game_thailand.players.add(invalid_player)
+            player_ids.append(invalid_player.id)
+        elif invalid == 'invited':
+            GameInvitation.objects.create(
+                host=player_thailand,
+                invited=invalid_player,
+                game=game_thailand,
+            )
+            player_ids.append(invalid_player.id)
+        elif invalid == 'level':
+            invalid_player.rating.grade = Grades.PRO.value
+            invalid_player.rating.save()
+            player_ids.append(invalid_player.id)
+
+        response = api_client_thailand.post(
+            url, {'players': player_ids}, format='json'
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not GameInvitation.objects.filter(
+            invited_id__in=player_ids[:3]
+        ).exists()
+        mock_invite_task.delay.assert_not_called()
+
+    def test_invalid_player_is_reported(
+        self, api_client_thailand, invited_players, url
+    ):
+        invalid_player = invited_players[0]
+        invalid_player.rating.grade = Grades.PRO.value
+        invalid_player.rating.save()
+
+        response = api_client_thailand.post(
+            url, {'players': [invalid_player.id]}, format='json'
+        )
+
+        assert str(invalid_player.id) in response.json()['invited'][0]
+
+    def test_invite_devices_of_all_invited_players(
+        self, invited_players, game_thailand
+    ):
+        for player in invited_players[:3]:
+            Device.objects.create(token=f'invite_{player.id}', player=player)
+        player_ids = [player.id for player in invited_players[:2]]
+
+        devices = PushService().get_devices_qs(
+            notification_type=NotificationTypes.GAME_INVITE,
+            player_id=None,
+            event_id=game_thailand.id,
+            player_ids=player_ids,
+        )
+
+        assert {device.player_id for device in devices} == set(player_ids)
+
+
+@pytest.mark.django_db
+class TestGameCreateWithInvites:
+    """Test creating a game with a list of invited players."""
+
+    @pytest.fixture
+    def url(self):
+        return reverse('api:games-list')
+
+    @pytest.mark.parametrize('players_count', (1, 20))
+    def test_create_game_queries_do_not_depend_on_players(
+        self,
+        api_client_thailand,
+        currency_type_thailand,
+        game_create_data,
+        invited_players,
+        url,
+        mock_invite_task,
+        django_assert_max_num_queries,
+        django_capture_on_commit_callbacks,
+        players_count,
+    ):
+        player_ids = [player.id for player in invited_players][:players_count]
+        game_create_data['players'] = player_ids
+
+        with (
+            django_assert_max_num_queries(CREATE_GAME_QUERIES_LIMIT),
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            response = api_client_thailand.post(
+                url, game_create_data, format='json'
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        game_id = response.json()['game_id']
+        assert set(
+            GameInvitation.objects.filter(game_id=game_id).values_list(
+                'invited_id', flat=True
+            )
+        ) == set(player_ids)
+        mock_invite_task.delay.assert_called_once_with(game_id, player_ids)
+
+    def test_create_game_without_players(
+        self,
+        api_client_thailand,
+        currency_type_thailand,
+        game_create_data,
+        url,
+        mock_invite_task,
+        django_capture_on_commit_callbacks,
+    ):
+        game_create_data.pop('players')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client_thailand.post(
+                url, game_create_data, format='json'
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert not GameInvitation.objects.exists()
+        mock_invite_task.delay.assert_not_called()
+
+    @pytest.mark.parametrize('invalid', ('self', 'missing', 'level'))
+    def test_invalid_player_rejects_game(
+        self,
+        api_client_thailand,
+        currency_type_thailand,
+        game_create_data,
+        player_thailand,
+        invited_players,
+        url,
+        mock_invite_task,
+        invalid,
+    ):
+        player_ids = [player.id for player in invited_players[:3]]
+        invalid_player = invited_players[3]
+        if invalid == 'self':
+            player_ids.append(player_thailand.id)
+            message = 'You can not invite yourself.'
+        elif invalid == 'missing':
+            player_ids.append(invalid_player.id + 1000)
+            message = (
+                f'Invalid pk "{invalid_player.id + 1000}" '
+                '- object does not exist.'
+            )
+        elif invalid == 'level':
+            invalid_player.rating.grade = Grades.PRO.value
+            invalid_player.rating.save()
+            player_ids.append(invalid_player.id)
+            message = (
+                f'Level of the player {Grades.PRO.value} not allowed in '
+                f'this game. Allowed levels: '
+                f'{", ".join(game_create_data["levels"])}'
+            )
+        game_create_data['players'] = player_ids
+
+        response = api_client_thailand.post(
+            url, game_create_data, format='json'
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {'players': [message]}
+        assert not Game.objects.exists()
+        assert not GameInvitation.objects.exists()
+        mock_invite_task.delay.assert_not_called()
+
+    def test_failed_invitations_roll_back_game(
+        self,
+        api_client_thailand,
+        currency_type_thailand,
+        game_create_data,
+        invited_players,
+        url,
+        mock_invite_task,
+    ):
+        game_create_data['players'] = [invited_players[0].id]
+
+        with (
+            patch.object(
+                GameInvitation.objects,
+                'bulk_create',
+                side_effect=DatabaseError,
+            ),
+            pytest.raises(DatabaseError),
+        ):
+            api_client_thailand.post(url, game_create_data, format='json')
+
+        assert not Game.objects.exists()
+        mock_invite_task.delay.assert_not_called()
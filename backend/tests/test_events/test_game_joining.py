@@ -0,0 +1,150 @@
+from threading import Barrier, Thread
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.event.models import Game
+from apps.players.models import Player
+
+User = get_user_model()
+
+PARALLEL_JOINS = 8
+
+
+def create_players(quantity, prefix='joining_player'):
+    players = []
+    for i in range(quantity):
+        user = User.objects.create(
+            username=f'{prefix}_{i}',
+            first_name='Joining',
+            last_name=f'Player {i}',
+        )
+        players.append(Player.objects.create(user=user, is_registered=True))
+    return players
+
+
+def join(player, game):
+    client = APIClient()
+    client.force_authenticate(player.user)
+    return client.post(reverse('api:games-joining-game', args=(game.id,)))
+
+
+@pytest.mark.django_db
+class TestGamePlayersCounter:
+    """Test current_players counter of the game."""
+
+    def test_counter_follows_players_relation(
+        self, game_thailand, bulk_create_registered_players
+    ):
+        players = bulk_create_registered_players
+
+        game_thailand.players.set(players)
+        game_thailand.refresh_from_db()
+        assert game_thailand.current_players == len(players)
+
+        game_thailand.players.remove(players[0])
+        game_thailand.refresh_from_db()
+        assert game_thailand.current_players == len(players) - 1
+
+        game_thailand.players.clear()
+        game_thailand.refresh_from_db()
+        assert game_thailand.current_players == 0
+
+    def test_counter_follows_reverse_relation(
+        self, game_thailand, player_cyprus
+    ):
+        player_cyprus.games_players.add(game_thailand)
+        game_thailand.refresh_from_db()
+        assert game_thailand.current_players == 1
+
+        player_cyprus.games_players.clear()
+        game_thailand.refresh_from_db()
+        assert game_thailand.current_players == 0
+
+    def test_refresh_players_count(self, game_thailand_with_players):
+        Game.objects.update(current_players=0)
+
+        Game.objects.all().refresh_players_count()
+
+        game_thailand_with_players.refresh_from_db()
+        assert (
+            game_thailand_with_players.current_players
+            == game_thailand_with_players.players.count()
+        )
+
+    def test_join_takes_place(self, game_thailand, player_cyprus):
+        response = join(player_cyprus, game_thailand)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['is_joined'] is True
+        game_thailand.refresh_from_db()
+        assert game_thailand.current_players == 1
+        assert player_cyprus in game_thailand.players.all()
+
+    def test_join_full_game(self, game_thailand, player_cyprus):
+        game_thailand.players.set(create_players(game_thailand.max_players))
+
+        response = join(player_cyprus, game_thailand)
+
+        assert response.json()['is_joined'] is False
+        assert player_cyprus not in game_thailand.players.all()
+        game_thailand.refresh_from_db()
+        assert game_thailand.current_players == game_thailand.max_players
+
+    def test_repeated_join_does_not_take_place(
+        self, game_thailand, player_cyprus
+    ):
+        join(player_cyprus, game_thailand)
+
+        response = join(player_cyprus, game_thailand)
+
+        assert response.json()['is_joined'] is True
+        game_thailand.refresh_from_db()
+        assert game_thailand.current_players == 1
+        assert game_thailand.players.count() == 1
+
+    def test_join_does_not_count_players(self, game_thailand, player_cyprus):
+        with CaptureQueriesContext(connection) as context:
+            join(player_cyprus, game_thailand)
+
+        sql = ' '.join(q['sql'] for q in context.captured_queries).upper()
+        assert 'COUNT(' not in sql
+
+
+@pytest.mark.django_db(transaction=True)
+class TestGameParallelJoining:
+    """Test parallel joins can not overbook the game."""
+
+    def test_parallel_joins(self, game_thailand):
+        players = create_players(PARALLEL_JOINS)
+        barrier = Barrier(PARALLEL_JOINS)
+        results = []
+
+        def join_in_thread(player):
+            try:
+                barrier.wait()
+                results.append(join(player, game_thailand).json())
+            finally:
+                connection.close()
+
+        threads = [
+            Thread(target=join_in_thread, args=(player,)) for player in players
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        game_thailand.refresh_from_db()
+        assert len(results) == PARALLEL_JOINS
+        assert (
+            sum(result['is_joined'] for result in results)
+            == game_thailand.max_players
+        )
+        assert game_thailand.players.count() == game_thailand.max_players
+        assert game_thailand.current_players == game_thailand.max_players
@@ -0,0 +1,303 @@
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.event.models import GameInvitation, GameWaitlist, PlayerEventFeed
+from apps.notifications.constants import NotificationTypes
+from apps.notifications.models import Device
+from apps.notifications.push_service import PushService
+from apps.players.models import Player
+
+User = get_user_model()
+
+
+def get_client(player):
+    client = APIClient()
+    client.force_authenticate(player.user)
+    return client
+
+
+@pytest.fixture
+def create_players():
+    def create(quantity, prefix):
+        players = []
+        for i in range(quantity):
+            user = User.objects.create(
+                username=f'{prefix}_{i}',
+                first_name='Waitlist',
+                last_name=f'Player {i}',
+            )
+            players.append(
+                Player.objects.create(user=user, is_registered=True)
+            )
+        return players
+
+    return create
+
+
+@pytest.fixture
+def full_game(game_thailand, player_thailand, create_players):
+    game_thailand.players.set(
+        [player_thailand]
+        + create_players(game_thailand.max_players - 1, 'participant')
+    )
+    game_thailand.refresh_from_db()
+    return game_thailand
+
+
+@pytest.fixture
+def waiting_players(create_players):
+    return create_players(3, 'waiting_player')
+
+
+@pytest.fixture
+def mock_promotion_task():
+    with patch(
+        'apps.notifications.tasks.send_waitlist_promotion_task'
+    ) as task:
+        yield task
+
+
+@pytest.mark.django_db
+class TestGameWaitlist:
+    """Test waitlist of the full game."""
+
+    def get_url(self, game, name='waitlist'):
+        return reverse(f'api:games-{name}', args=(game.id,))
+
+    def test_full_game_puts_players_in_waitlist(
+        self, full_game, waiting_players
+    ):
+        for position, player in enumerate(waiting_players, start=1):
+            response = get_client(player).post(self.get_url(full_game))
+
+            assert response.status_code == status.HTTP_201_CREATED
+            assert response.json() == {
+                'is_joined': False,
+                'position': position,
+            }
+        assert list(
+            full_game.waitlist.values_list('player_id', flat=True)
+        ) == [player.id for player in waiting_players]
+
+    def test_repeated_request_keeps_position(self, full_game, waiting_players):
+        for player in waiting_players[:2]:
+            get_client(player).post(self.get_url(full_game))
+
+        response = get_client(waiting_players[0]).post(self.get_url(full_game))
+
+        assert response.json()['position'] == 1
+        assert full_game.waitlist.count() == 2
+
+    def test_game_with_free_place_joins_player(
+        self, game_thailand, waiting_players
+    ):
+        player = waiting_players[0]
+        GameInvitation.objects.create(
+            host=game_thailand.host, invited=player, game=game_thailand
+        )
+
+        response = get_client(player).post(self.get_url(game_thailand))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {'is_joined': True, 'position': None}
+        assert player in game_thailand.players.all()
+        assert not GameWaitlist.objects.exists()
+        assert not GameInvitation.objects.exists()
+
+    def test_participant_can_not_wait(self, full_game, api_client_thailand):
+        response = api_client_thailand.post(self.get_url(full_game))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not GameWaitlist.objects.exists()
+
+    def test_leave_waitlist(self, full_game, waiting_players):
+        client = get_client(waiting_players[0])
+        client.post(self.get_url(full_game))
+
+        response = client.delete(self.get_url(full_game))
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert not GameWaitlist.objects.exists()
+        response = client.delete(self.get_url(full_game))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_join_game_removes_player_from_waitlist(
+        self, game_thailand, waiting_players
+    ):
+        player = waiting_players[0]
+        GameWaitlist.objects.create(game=game_thailand, player=player)
+
+        response = get_client(player).post(
+            self.get_url(game_thailand, 'joining-game')
+        )
+
+        assert response.json()['is_joined'] is True
+        assert not GameWaitlist.objects.exists()
+
+
+@pytest.mark.django_db
+class TestGameWaitlistPromotion:
+    """Test the first waiting player takes the place of the left one."""
+
+    @pytest.fixture
+    def waitlist(self, full_game, waiting_players):
+        for player in waiting_players:
+            GameWaitlist.objects.create(game=full_game, player=player)
+        return waiting_players
+
+    @pytest.fixture
+    def participant(self, full_game, player_thailand):
+        return full_game.players.exclude(pk=player_thailand.pk).first()
+
+    def assert_promoted(self, game, left_player, promoted_player):
+        game.refresh_from_db()
+        assert left_player not in game.players.all()
+        assert promoted_player in game.players.all()
+        assert game.current_players == game.max_players
+        assert game.players.count() == game.max_players
+        assert not game.waitlist.filter(player=promoted_player).exists()
+
+    def test_leave_game_promotes_first_waiting_player(
+        self,
+        full_game,
+        participant,
+        waitlist,
+        mock_promotion_task,
+        django_capture_on_commit_callbacks,
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            response = get_client(participant).post(
+                reverse('api:games-leave-game', args=(full_game.id,))
+            )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        self.assert_promoted(full_game, participant, waitlist[0])
+        assert list(
+            full_game.waitlist.values_list('player_id', flat=True)
+        ) == [player.id for player in waitlist[1:]]
+        mock_promotion_task.delay.assert_called_once_with(
+            full_game.id, [waitlist[0].id]
+        )
+
+    def test_promoted_player_invitation_is_deleted(
+        self, full_game, player_thailand, participant, waitlist
+    ):
+        GameInvitation.objects.create(
+            host=player_thailand, invited=waitlist[0], game=full_game
+        )
+        assert PlayerEventFeed.objects.filter(
+            player=waitlist[0], role=PlayerEventFeed.Roles.INVITED
+        ).exists()
+
+        get_client(participant).post(
+            reverse('api:games-leave-game', args=(full_game.id,))
+        )
+
+        self.assert_promoted(full_game, participant, waitlist[0])
+        assert not GameInvitation.objects.filter(
+            game=full_game, invited=waitlist[0]
+        ).exists()
+        assert not PlayerEventFeed.objects.filter(
+            player=waitlist[0],
+            game=full_game,
+            role=PlayerEventFeed.Roles.INVITED,
+        ).exists()
+
+    def test_leave_game_without_waitlist_frees_place(
+        self, full_game, participant, mock_promotion_task
+    ):
+        get_client(participant).post(
+            reverse('api:games-leave-game', args=(full_game.id,))
+        )
+
+        full_game.refresh_from_db()
+        assert full_game.current_players == full_game.max_players - 1
+        mock_promotion_task.delay.assert_not_called()
+
+    @pytest.mark.parametrize('who', ('host', 'stranger'))
+    def test_leave_game_by_not_participant_or_host(
+        self, full_game, api_client_thailand, waitlist, who
+    ):
+        client = (
+            api_client_thailand if who == 'host' else get_client(waitlist[0])
+        )
+
+        response = client.post(
+            reverse('api:games-leave-game', args=(full_game.id,))
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        full_game.refresh_from_db()
+        assert full_game.current_players == full_game.max_players
+
+    def test_host_removes_player(
+        self,
+        full_game,
+        participant,
+        waitlist,
+        api_client_thailand,
+        mock_promotion_task,
+        django_capture_on_commit_callbacks,
+    ):
+        url = reverse(
+            'api:games-remove-player', args=(full_game.id, participant.id)
+        )
+
+        with (
+            patch(
+                'apps.event.views.inform_removed_players_task'
+            ) as removed_task,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            response = api_client_thailand.delete(url)
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        self.assert_promoted(full_game, participant, waitlist[0])
+        removed_task.delay.assert_called_once_with(
+            full_game.id, participant.id, 'game'
+        )
+        mock_promotion_task.delay.assert_called_once_with(
+            full_game.id, [waitlist[0].id]
+        )
+
+    def test_only_host_removes_players(self, full_game, participant):
+        other = full_game.players.exclude(
+            pk__in=(full_game.host_id, participant.id)
+        ).first()
+        url = reverse(
+            'api:games-remove-player', args=(full_game.id, participant.id)
+        )
+
+        response = get_client(other).delete(url)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert participant in full_game.players.all()
+
+    def test_remove_not_participant(
+        self, full_game, waitlist, api_client_thailand
+    ):
+        url = reverse(
+            'api:games-remove-player', args=(full_game.id, waitlist[0].id)
+        )
+
+        response = api_client_thailand.delete(url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_promotion_notification_devices(self, full_game, waitlist):
+        for player in waitlist:
+            Device.objects.create(token=f'promoted_{player.id}', player=player)
+
+        devices = PushService().get_devices_qs(
+            notification_type=NotificationTypes.GAME_PROMOTED,
+            player_id=None,
+            event_id=full_game.id,
+            player_ids=[waitlist[0].id],
+        )
+
+        assert [device.player_id for device in devices] == [waitlist[0].id]
@@ -0,0 +1,138 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.courts.enums import LocationEnums
+from apps.courts.models import Court, CourtLocation
+from apps.event.models import Game
+
+
+@pytest.mark.django_db
+class TestNearbyGames:
+    """Test upcoming public games search around the point."""
+
+    @pytest.fixture
+    def url(self):
+        return reverse('api:games-nearby-games')
+
+    @pytest.fixture
+    def point(self, location_for_court_thailand):
+        return {
+            'lat': location_for_court_thailand.latitude,
+            'lon': location_for_court_thailand.longitude,
+        }
+
+    @pytest.fixture
+    def create_game(self, game_data):
+        def create(court, **kwargs):
+            working_data = game_data.copy()
+            working_data.pop('players')
+            working_data.pop('player_levels')
+            working_data.pop('court_id')
+            working_data.update(court=court, **kwargs)
+            return Game.objects.create(**working_data)
+
+        return create
+
+    @pytest.fixture
+    def court_near(self, location_for_court_thailand):
+        location = CourtLocation.objects.create(
+            latitude=location_for_court_thailand.latitude + 0.01,
+            longitude=location_for_court_thailand.longitude,
+            court_name='Court near',
+        )
+        return Court.objects.create(location=location)
+
+    def get_game_ids(self, response):
+        assert response.status_code == status.HTTP_200_OK
+        return [game['game_id'] for game in response.json()['games']]
+
+    def test_games_ordered_by_distance(
+        self,
+        api_client_thailand,
+        url,
+        point,
+        court_thailand,
+        court_near,
+        create_game,
+    ):
+        start_time = timezone.now() + timedelta(days=1)
+        near_game = create_game(
+            court_near,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=1),
+        )
+        game = create_game(court_thailand)
+
+        response = api_client_thailand.get(url, point)
+
+        assert self.get_game_ids(response) == [game.id, near_game.id]
+        distances = [g['distance'] for g in response.json()['games']]
+        assert distances[0] == pytest.approx(0, abs=1e-6)
+        assert distances[1] == pytest.approx(1.11, rel=1e-2)
+
+    def test_only_upcoming_public_active_games(
+        self, api_client_thailand, url, point, court_thailand, create_game
+    ):
+        game = create_game(court_thailand)
+        create_game(court_thailand, is_private=True)
+        create_game(court_thailand, is_active=False)
+        past_time = timezone.now() - timedelta(days=1)
+        create_game(
+            court_thailand,
+            start_time=past_time,
+            end_time=past_time + timedelta(hours=1),
+        )
+
+        response = api_client_thailand.get(url, point)
+
+        assert self.get_game_ids(response) == [game.id]
+
+    def test_games_out_of_radius_are_excluded(
+        self, api_client_thailand, url, point, court_near, create_game
+    ):
+        create_game(court_near)
+
+        response = api_client_thailand.get(url, {**point, 'radius': 1})
+
+        assert self.get_game_ids(response) == []
+
+    @pytest.mark.parametrize(
+        'params',
+        (
+            {'lon': 12.345},
+            {'lat': 91, 'lon': 12.345},
+            {'lat': 1, 'lon': 12.345, 'radius': 'wrong'},
+            {
+                'lat': 1,
+                'lon': 12.345,
+                'radius': LocationEnums.MAX_RADIUS_KM.value + 1,
+            },
+        ),
+    )
+    def test_invalid_query(
+        self, api_client_thailand, player_thailand, url, params
+    ):
+        response = api_client_thailand.get(url, params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_queries_do_not_depend_on_games(
+        self,
+        api_client_thailand,
+        url,
+        point,
+        court_thailand,
+        create_game,
+        django_assert_max_num_queries,
+    ):
+        for _ in range(5):
+            create_game(court_thailand)
+
+        with django_assert_max_num_queries(4):
+            response = api_client_thailand.get(url, point)
+
+        assert len(self.get_game_ids(response)) == 5
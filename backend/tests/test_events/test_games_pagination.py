@@ -0,0 +1,147 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.event.models import Game
+from apps.event.pagination import GameKeysetPagination
+
+
+@pytest.mark.django_db
+class TestGamesKeysetPagination:
+    """Test opt-in keyset pagination of game list actions."""
+
+    @pytest.fixture
+    def create_games(self, game_data):
+        """Create games, every two games share the same time."""
+
+        def create(quantity, past=False):
+            working_data = game_data.copy()
+            working_data.pop('players')
+            working_data.pop('player_levels')
+            base_time = timezone.now() + (
+                -timedelta(days=30) if past else timedelta(days=1)
+            )
+            games = []
+            for i in range(quantity):
+                start_time = base_time + timedelta(hours=i // 2)
+                working_data['start_time'] = start_time
+                working_data['end_time'] = start_time + timedelta(hours=1)
+                games.append(Game.objects.create(**working_data))
+            return games
+
+        return create
+
+    def get_all_pages(self, client, url, page_size):
+        """Follow next links and return ids of games on every page."""
+        pages = []
+        response = client.get(url, {'page_size': page_size})
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            pages.append([game['game_id'] for game in data['games']])
+            if data['next'] is None:
+                return pages
+            response = client.get(data['next'])
+
+    def test_list_is_not_paginated_by_default(
+        self, api_client_thailand, create_games
+    ):
+        create_games(5)
+
+        response = api_client_thailand.get(reverse('api:games-upcoming-games'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json().keys() == {'games'}
+        assert len(response.json()['games']) == 5
+
+    def test_upcoming_pages_ordered_by_start_time_and_id(
+        self, api_client_thailand, create_games
+    ):
+        games = create_games(7)
+        expected = [
+            game.id
+            for game in sorted(games, key=lambda g: (g.start_time, g.id))
+        ]
+
+        pages = self.get_all_pages(
+            api_client_thailand, reverse('api:games-upcoming-games'), 2
+        )
+
+        assert [len(page) for page in pages] == [2, 2, 2, 1]
+        assert sum(pages, []) == expected
+
+    def test_archive_pages_ordered_from_latest_end_time(
+        self, api_client_thailand, create_games
+    ):
+        games = create_games(6, past=True)
+        expected = [
+            game.id
+            for game in sorted(
+                games, key=lambda g: (g.end_time, g.id), reverse=True
+            )
+        ]
+
+        pages = self.get_all_pages(
+            api_client_thailand, reverse('api:games-archive-games'), 4
+        )
+
+        assert [len(page) for page in pages] == [4, 2]
+        assert sum(pages, []) == expected
+
+    def test_my_games_pages(self, api_client_thailand, create_games):
+        games = create_games(3)
+
+        pages = self.get_all_pages(
+            api_client_thailand, reverse('api:games-my-games'), 1
+        )
+
+        assert sum(pages, []) == [game.id for game in games]
+
+    def test_next_page_uses_keyset_instead_of_offset(
+        self, api_client_thailand, create_games
+    ):
+        create_games(5)
+        url = reverse('api:games-upcoming-games')
+        next_url = api_client_thailand.get(url, {'page_size': 2}).json()[
+            'next'
+        ]
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client_thailand.get(next_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        sql = ' '.join(q['sql'] for q in context.captured_queries).upper()
+        assert 'OFFSET' not in sql
+
+    @pytest.mark.parametrize(
+        'value, expected',
+        (
+            ('5', 5),
+            ('wrong', GameKeysetPagination.page_size),
+            ('0', GameKeysetPagination.page_size),
+            ('100000', GameKeysetPagination.max_page_size),
+        ),
+    )
+    def test_page_size(self, value, expected):
+        request = Request(APIRequestFactory().get('/', {'page_size': value}))
+
+        page_size = GameKeysetPagination('start_time').get_page_size(request)
+
+        assert page_size == expected
+
+    @pytest.mark.parametrize('cursor', ['wrong', 'eyJ2IjogMX0='])
+    def test_invalid_cursor(self, api_client_thailand, create_games, cursor):
+        create_games(1)
+
+        response = api_client_thailand.get(
+            reverse('api:games-upcoming-games'), {'cursor': cursor}
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
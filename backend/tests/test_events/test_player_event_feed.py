@@ -0,0 +1,237 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+
+from apps.event.models import Game, GameInvitation, PlayerEventFeed
+
+Roles = PlayerEventFeed.Roles
+
+
+def get_feed(game):
+    return set(
+        PlayerEventFeed.objects.filter(game=game).values_list(
+            'player_id', 'role'
+        )
+    )
+
+
+@pytest.mark.django_db
+class TestPlayerEventFeed:
+    """Test the player event feed follows games, players and invites."""
+
+    def test_new_game_adds_host(self, game_thailand, player_thailand):
+        assert get_feed(game_thailand) == {(player_thailand.id, Roles.HOST)}
+
+    def test_feed_follows_players(
+        self, game_thailand, player_thailand, bulk_create_registered_players
+    ):
+        players = bulk_create_registered_players
+        host_row = (player_thailand.id, Roles.HOST)
+
+        game_thailand.players.set(players)
+        assert get_feed(game_thailand) == {host_row} | {
+            (player.id, Roles.PLAYER) for player in players
+        }
+
+        game_thailand.players.remove(players[0])
+        assert (players[0].id, Roles.PLAYER) not in get_feed(game_thailand)
+
+        game_thailand.players.clear()
+        assert get_feed(game_thailand) == {host_row}
+
+    def test_feed_follows_reverse_players(
+        self, game_thailand, game_cyprus, player_cyprus
+    ):
+        player_cyprus.games_players.add(game_thailand)
+        assert (player_cyprus.id, Roles.PLAYER) in get_feed(game_thailand)
+
+        player_cyprus.games_players.clear()
+        assert (player_cyprus.id, Roles.PLAYER) not in get_feed(game_thailand)
+        assert (player_cyprus.id, Roles.HOST) in get_feed(game_cyprus)
+
+    def test_feed_follows_joining_and_leaving(
+        self, game_thailand, player_cyprus
+    ):
+        game_thailand.add_player(player_cyprus)
+        assert (player_cyprus.id, Roles.PLAYER) in get_feed(game_thailand)
+
+        game_thailand.remove_player(player_cyprus)
+        assert (player_cyprus.id, Roles.PLAYER) not in get_feed(game_thailand)
+
+    def test_feed_follows_invitations(
+        self,
+        game_thailand,
+        player_thailand,
+        player_cyprus,
+        player_thailand_female_pro,
+    ):
+        invitations = [
+            GameInvitation.objects.create(
+                game=game_thailand,
+                host=host,
+                invited=player_thailand_female_pro,
+            )
+            for host in (player_thailand, player_cyprus)
+        ]
+        invited_row = (player_thailand_female_pro.id, Roles.INVITED)
+        assert invited_row in get_feed(game_thailand)
+
+        invitations[0].delete()
+        assert invited_row in get_feed(game_thailand)
+
+        GameInvitation.objects.filter(game=game_thailand).delete()
+        assert invited_row not in get_feed(game_thailand)
+
+    def test_bulk_invite_adds_invited_players(
+        self,
+        api_client_thailand,
+        game_thailand,
+        bulk_create_registered_players,
+    ):
+        player_ids = [player.id for player in bulk_create_registered_players]
+
+        api_client_thailand.post(
+            reverse('api:games-invite-players', args=(game_thailand.id,)),
+            {'players': player_ids},
+            format='json',
+        )
+
+        assert {
+            player_id
+            for player_id, role in get_feed(game_thailand)
+            if role == Roles.INVITED
+        } == set(player_ids)
+
+    def test_new_game_adds_all_roles(
+        self,
+        api_client_thailand,
+        currency_type_thailand,
+        game_create_data,
+        player_thailand,
+        bulk_create_registered_players,
+    ):
+        invited = bulk_create_registered_players[0]
+        game_create_data['players'] = [invited.id]
+
+        response = api_client_thailand.post(
+            reverse('api:games-list'), game_create_data, format='json'
+        )
+
+        assert get_feed(response.json()['game_id']) == {
+            (player_thailand.id, Roles.HOST),
+            (player_thailand.id, Roles.PLAYER),
+            (invited.id, Roles.INVITED),
+        }
+
+    def test_batch_adds_rows_with_one_insert(
+        self,
+        game_thailand,
+        player_thailand,
+        bulk_create_registered_players,
+        django_assert_num_queries,
+    ):
+        player, invited = bulk_create_registered_players[:2]
+
+        with django_assert_num_queries(1), PlayerEventFeed.objects.batch():
+            PlayerEventFeed.objects.add(
+                Roles.PLAYER, [game_thailand], [player.id]
+            )
+            PlayerEventFeed.objects.add(
+                Roles.INVITED, [game_thailand], [invited.id]
+            )
+
+        assert get_feed(game_thailand) == {
+            (player_thailand.id, Roles.HOST),
+            (player.id, Roles.PLAYER),
+            (invited.id, Roles.INVITED),
+        }
+
+    def test_failed_batch_adds_no_rows(
+        self, game_thailand, player_thailand, player_cyprus
+    ):
+        with pytest.raises(ValueError), PlayerEventFeed.objects.batch():
+            PlayerEventFeed.objects.add(
+                Roles.PLAYER, [game_thailand], [player_cyprus.id]
+            )
+            raise ValueError
+
+        assert get_feed(game_thailand) == {(player_thailand.id, Roles.HOST)}
+
+    def test_inactive_game_is_excluded(
+        self, game_thailand, player_thailand, player_cyprus
+    ):
+        GameInvitation.objects.create(
+            game=game_thailand, host=player_thailand, invited=player_cyprus
+        )
+        game_thailand.is_active = False
+        game_thailand.save()
+
+        assert not Game.objects.upcoming_games(player_thailand).exists()
+        assert not Game.objects.my_upcoming_games(player_thailand).exists()
+        assert not Game.objects.invited_games(player_cyprus).exists()
+        assert Game.objects.preview(player_thailand) == {
+            'upcoming_game_time': None,
+            'invites': 0,
+        }
+        assert Game.objects.preview(player_cyprus)['invites'] == 0
+
+    def test_feed_follows_game_changes(
+        self, game_thailand_with_players, player_cyprus
+    ):
+        game = game_thailand_with_players
+        game.start_time += timedelta(days=1)
+        game.end_time += timedelta(days=1)
+        game.host = player_cyprus
+        game.save()
+
+        feed = PlayerEventFeed.objects.filter(game=game)
+        assert set(feed.values_list('start_time', 'end_time')) == {
+            (game.start_time, game.end_time)
+        }
+        assert feed.get(role=Roles.HOST).player == player_cyprus
+
+    def test_rebuild_restores_feed(
+        self, game_thailand_with_players, game_cyprus, player_thailand
+    ):
+        GameInvitation.objects.create(
+            game=game_cyprus, host=game_cyprus.host, invited=player_thailand
+        )
+        expected = set(
+            PlayerEventFeed.objects.values_list(
+                'player_id', 'game_id', 'role', 'start_time', 'end_time'
+            )
+        )
+        PlayerEventFeed.objects.all().delete()
+
+        created = PlayerEventFeed.objects.rebuild()
+
+        assert created == len(expected)
+        assert (
+            set(
+                PlayerEventFeed.objects.values_list(
+                    'player_id', 'game_id', 'role', 'start_time', 'end_time'
+                )
+            )
+            == expected
+        )
+
+    def test_game_delete_removes_feed(self, game_thailand_with_players):
+        game_thailand_with_players.delete()
+
+        assert not PlayerEventFeed.objects.exists()
+
+    @pytest.mark.parametrize(
+        'roles',
+        ((Roles.HOST, Roles.PLAYER), (Roles.HOST,), (Roles.INVITED,)),
+    )
+    def test_home_screen_queries_scan_feed_index(self, player_thailand, roles):
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+        plan = PlayerEventFeed.objects.upcoming(
+            player_thailand, roles
+        ).explain()
+
+        assert 'event_feed_role_start_idx' in plan, plan
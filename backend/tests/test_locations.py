@@ -2,7 +2,7 @@ import pytest
 from django.urls import reverse
 from rest_framework import status
 
-from apps.locations.models import Country
+from apps.locations.models import City, Country
 
 
 @pytest.fixture
@@ -30,11 +30,11 @@ class TestCountriesAPI:
 
         assert response.status_code == status.HTTP_200_OK
 
-        assert 'countries' in response.data
-        assert isinstance(response.data['countries'], list)
+        assert 'countries' in response.json()
+        assert isinstance(response.json()['countries'], list)
 
-        if response.data['countries']:
-            country = response.data['countries'][0]
+        if response.json()['countries']:
+            country = response.json()['countries'][0]
             assert 'country_id' in country
             assert 'country_name' in country
             assert 'cities' in country
@@ -54,7 +54,7 @@ class TestCountriesAPI:
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data['countries'] == []
+        assert response.json()['countries'] == []
 
         Country.objects.get_or_create(name='Cyprus')
         Country.objects.get_or_create(name='Thailand')
@@ -68,7 +68,7 @@ class TestCountriesAPI:
 
         assert response.status_code == status.HTTP_200_OK
 
-        countries_data = response.data['countries']
+        countries_data = response.json()['countries']
         empty_country = next(
             (
                 c
@@ -109,10 +109,70 @@ class TestCountriesAPI:
 
         assert response.status_code == status.HTTP_200_OK
 
-        countries_data = response.data['countries']
+        countries_data = response.json()['countries']
         country_names = [c['country_name'] for c in countries_data]
 
         expected_order = ['Cyprus', 'Malaysia', 'Thailand', 'Vietnam']
         assert country_names == expected_order
 
         assert country_names == sorted(country_names)
+
+
+@pytest.mark.django_db
+class TestCountriesAPICache:
+    """Tests for cached countries payload and conditional requests."""
+
+    def test_response_has_validators(self, api_client, setup_test_data):
+        """Test strong ETag and Cache-Control headers."""
+        response = api_client.get(reverse('api:countries'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'].startswith('"')
+        assert 'public' in response['Cache-Control']
+        assert 'max-age' in response['Cache-Control']
+
+    def test_cached_payload_does_not_touch_db(
+        self, api_client, setup_test_data, django_assert_num_queries
+    ):
+        """Test second request is served without DB queries."""
+        url = reverse('api:countries')
+        first = api_client.get(url)
+
+        with django_assert_num_queries(0):
+            second = api_client.get(url)
+
+        assert second.content == first.content
+
+    def test_if_none_match_returns_not_modified(
+        self, api_client, setup_test_data
+    ):
+        """Test matching ETag returns 304 without body."""
+        url = reverse('api:countries')
+        etag = api_client.get(url)['ETag']
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b''
+        assert response['ETag'] == etag
+
+    def test_city_change_regenerates_payload(
+        self, api_client, setup_test_data
+    ):
+        """Test new city changes payload and ETag."""
+        url = reverse('api:countries')
+        etag = api_client.get(url)['ETag']
+        City.objects.create(
+            name='Limassol', country=Country.objects.get(name='Cyprus')
+        )
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+        cyprus = next(
+            c
+            for c in response.json()['countries']
+            if c['country_name'] == 'Cyprus'
+        )
+        assert [c['city_name'] for c in cyprus['cities']] == ['Limassol']
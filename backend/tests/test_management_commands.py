@@ -3,7 +3,10 @@ import json
 import pytest
 from django.core.management import call_command
 
+from apps.courts.models import CourtLocation
+from apps.event.models import Game, PlayerEventFeed
 from apps.locations.models import City, Country
+from apps.players.models import Player
 
 
 def run_load_locations(tmp_path, data):
@@ -81,3 +84,74 @@ def test_load_locations_duplicate_objects(tmp_path, countries_cities_data):
     assert (
         City.objects.filter(name='Paphos', country__name='Cyprus').count() == 1
     )
+
+
+@pytest.mark.django_db
+def test_benchmark_related_games_leaves_database_unchanged(capsys):
+    """
+    Test that benchmark reports every strategy.
+    Seeded data is rolled back.
+    """
+    players_count = Player.objects.count()
+
+    call_command(
+        'benchmark_related_games',
+        players=5,
+        games=20,
+        players_per_game=2,
+        samples=2,
+    )
+
+    output = capsys.readouterr().out
+    for strategy in ('distinct', 'exists', 'union'):
+        assert f'{strategy} upcoming' in output
+        assert f'{strategy}  archive' in output
+    assert Player.objects.count() == players_count
+    assert not Game.objects.exists()
+
+
+@pytest.mark.django_db
+def test_rebuild_player_event_feed(game_thailand_with_players):
+    """
+    Test that the feed is recreated from games and their players.
+    """
+    expected = set(PlayerEventFeed.objects.values_list('player', 'role'))
+    PlayerEventFeed.objects.all().delete()
+
+    call_command('rebuild_player_event_feed')
+
+    assert (
+        set(PlayerEventFeed.objects.values_list('player', 'role')) == expected
+    )
+
+
+@pytest.mark.django_db
+def test_update_court_geohash(location_for_court_thailand):
+    """
+    Test that geohash is recomputed for locations updated in bulk.
+    """
+    expected = location_for_court_thailand.geohash
+    CourtLocation.objects.update(geohash='')
+
+    call_command('update_court_geohash')
+
+    location_for_court_thailand.refresh_from_db()
+    assert location_for_court_thailand.geohash == expected
+
+
+@pytest.mark.django_db
+def test_benchmark_player_search_leaves_database_unchanged(capsys):
+    """
+    Test that benchmark reports both searches.
+    Seeded data is rolled back.
+    """
+    players_count = Player.objects.count()
+
+    call_command(
+        'benchmark_player_search', players=20, samples=2, keystrokes=2
+    )
+
+    output = capsys.readouterr().out
+    for search in ('legacy', 'normalized'):
+        assert f'{search} 1 letters' in output
+    assert Player.objects.count() == players_count
@@ -0,0 +1,147 @@
+import pytest
+
+from apps.notifications.dispatch import PushDispatchPool
+from apps.notifications.models import (
+    Device,
+    NotificationRetry,
+    Notifications,
+)
+
+
+@pytest.mark.django_db
+class TestPushDispatchPool:
+    """Test PushDispatchPool without push service."""
+
+    def test_dispatch_returns_errors_in_items_order(self):
+        """Test every item gets its own result in the original order."""
+        pool = PushDispatchPool(max_workers=4)
+
+        def send(item):
+            if item % 2:
+                raise ValueError(item)
+
+        results = pool.dispatch(send, range(6))
+        pool.shutdown()
+
+        assert [item for item, _ in results] == list(range(6))
+        assert [error is None for _, error in results] == [
+            True,
+            False,
+            True,
+            False,
+            True,
+            False,
+        ]
+
+    def test_dispatch_single_worker_runs_in_caller_thread(self):
+        """Test pool with one worker does not create threads."""
+        pool = PushDispatchPool(max_workers=1)
+
+        results = pool.dispatch(lambda item: item, [1, 2, 3])
+
+        assert all(error is None for _, error in results)
+        assert pool._executor is None
+
+
+@pytest.mark.django_db
+class TestPushServiceConcurrentDispatch:
+    """Test concurrent sending to fake FCM HTTP server."""
+
+    @pytest.fixture
+    def many_devices(self, players):
+        devices = [
+            Device(token=f'fcm_dispatch_token_{i}', player=players['player1'])
+            for i in range(40)
+        ]
+        return Device.objects.bulk_create(devices)
+
+    def test_concurrent_send_respects_concurrency_cap(
+        self,
+        push_service_fake_fcm,
+        fake_fcm_server,
+        sample_notification,
+        many_devices,
+        monkeypatch,
+    ):
+        """Test requests are sent in parallel but not above the cap."""
+        service = push_service_fake_fcm
+        monkeypatch.setattr(service.dispatcher, 'max_workers', 4)
+
+        result = service.send_push_notifications(
+            many_devices, sample_notification
+        )
+
+        assert result['successful'] == len(many_devices)
+        assert sorted(fake_fcm_server.tokens) == sorted(
+            d.token for d in many_devices
+        )
+        assert 1 < fake_fcm_server.max_in_flight <= 4
+        assert Notifications.objects.count() == len(many_devices)
+
+    def test_concurrent_send_reuses_connections(
+        self,
+        push_service_fake_fcm,
+        fake_fcm_server,
+        sample_notification,
+        many_devices,
+    ):
+        """Test keep-alive connections are reused between requests."""
+        service = push_service_fake_fcm
+
+        service.send_push_notifications(many_devices, sample_notification)
+        service.send_push_notifications(many_devices, sample_notification)
+
+        assert len(fake_fcm_server.tokens) == 2 * len(many_devices)
+        assert (
+            len(fake_fcm_server.connections) <= service.dispatcher.max_workers
+        )
+
+    def test_concurrent_send_collects_failed_devices(
+        self,
+        push_service_fake_fcm,
+        fake_fcm_server,
+        sample_notification,
+        many_devices,
+    ):
+        """Test failed requests are counted and scheduled for retry."""
+        failed_tokens = {d.token for d in many_devices[:3]}
+        fake_fcm_server.error_statuses = dict.fromkeys(failed_tokens, 500)
+
+        result = push_service_fake_fcm.send_push_notifications(
+            many_devices, sample_notification
+        )
+
+        assert result['failed'] == len(failed_tokens)
+        assert result['successful'] == len(many_devices) - len(failed_tokens)
+        retried_tokens = set(
+            NotificationRetry.objects.values_list('token', flat=True)
+        )
+        assert retried_tokens == failed_tokens
+
+    def test_concurrent_send_deactivates_unregistered_devices(
+        self,
+        push_service_fake_fcm,
+        fake_fcm_server,
+        sample_notification,
+        many_devices,
+    ):
+        """Test unregistered tokens are deactivated and not retried."""
+        dead_tokens = {d.token for d in many_devices[:2]}
+        fake_fcm_server.error_statuses = dict.fromkeys(dead_tokens, 404)
+        fake_fcm_server.error_statuses[many_devices[2].token] = 500
+
+        result = push_service_fake_fcm.send_push_notifications(
+            many_devices, sample_notification
+        )
+
+        assert result['failed'] == 3
+        assert result['deactivated'] == len(dead_tokens)
+        assert (
+            set(
+                Device.objects.filter(is_active=False).values_list(
+                    'token', flat=True
+                )
+            )
+            == dead_tokens
+        )
+        assert NotificationRetry.objects.get().token == many_devices[2].token
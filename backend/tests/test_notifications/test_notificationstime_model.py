@@ -2,11 +2,14 @@ from datetime import timedelta
 
 import pytest
 
+from apps.notifications.cache import notification_settings_cache
 from apps.notifications.constants import (
     DEV_NOTIFICATION_TIME,
+    NOTIFICATION_INIT_DATA,
     PROD_NOTIFICATION_TIME,
+    NotificationTypes,
 )
-from apps.notifications.models import NotificationsTime
+from apps.notifications.models import NotificationsBase, NotificationsTime
 
 
 @pytest.mark.django_db
@@ -111,3 +114,70 @@ class TestNotificationsTime:
         )
         assert first_active.is_active is False
         assert second_active.is_active is True
+
+
+@pytest.mark.django_db
+class TestNotificationSettingsCache:
+    """Tests for cached notification templates and time settings."""
+
+    def test_active_time_is_cached(self, django_assert_num_queries):
+        """Test active settings are loaded from DB only once."""
+        active = NotificationsTime.get_active()
+
+        with django_assert_num_queries(0):
+            assert NotificationsTime.get_active() == active
+            NotificationsTime.get_pre_event_time()
+            NotificationsTime.get_advance_notification_time()
+
+    def test_active_time_cache_invalidated_on_save(self):
+        """Test saving settings invalidates cached active settings."""
+        NotificationsTime.get_active()
+        new_active = NotificationsTime.objects.create(
+            name='New Active Notifications Time',
+            pre_event_notification=timedelta(minutes=15),
+            is_active=True,
+        )
+
+        assert NotificationsTime.get_active() == new_active
+        assert NotificationsTime.get_pre_event_time() == timedelta(minutes=15)
+
+    def test_templates_are_loaded_with_one_query(
+        self, all_notification_types, django_assert_num_queries
+    ):
+        """Test all notification templates are loaded with one query."""
+        with django_assert_num_queries(1):
+            for notification_type in NOTIFICATION_INIT_DATA:
+                template = NotificationsBase.get_by_type(notification_type)
+                assert template.type == notification_type
+
+    def test_template_cache_invalidated_on_save(self, all_notification_types):
+        """Test changed template is reloaded after save."""
+        template = NotificationsBase.get_by_type(NotificationTypes.GAME_RATE)
+        template.title = 'New title'
+        template.save()
+
+        assert (
+            NotificationsBase.get_by_type(NotificationTypes.GAME_RATE).title
+            == 'New title'
+        )
+
+    def test_template_cache_invalidated_by_version_bump(
+        self, all_notification_types
+    ):
+        """Test bumped version makes local values stale."""
+        NotificationsBase.get_by_type(NotificationTypes.GAME_RATE)
+        NotificationsBase.objects.filter(
+            type=NotificationTypes.GAME_RATE
+        ).update(title='Updated in admin')
+
+        notification_settings_cache.invalidate()
+
+        assert (
+            NotificationsBase.get_by_type(NotificationTypes.GAME_RATE).title
+            == 'Updated in admin'
+        )
+
+    def test_missing_template_raises_does_not_exist(self):
+        """Test unknown type raises DoesNotExist."""
+        with pytest.raises(NotificationsBase.DoesNotExist):
+            NotificationsBase.get_by_type('unknown_type')
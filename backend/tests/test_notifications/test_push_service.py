@@ -1,11 +1,36 @@
+from datetime import timedelta
 from threading import Thread
+from unittest.mock import Mock, patch
 
 import pytest
-from pyfcm.errors import FCMError
-
-from apps.notifications.constants import NotificationTypes
-from apps.notifications.models import Notifications
+from django.utils import timezone
+from firebase_admin import messaging
+from firebase_admin.exceptions import InvalidArgumentError, UnavailableError
+from pyfcm.errors import (
+    FCMError,
+    FCMNotRegisteredError,
+    FCMServerError,
+    InvalidDataError,
+)
+
+from apps.event.models import Game
+from apps.notifications.constants import (
+    MAX_RETRIES,
+    RETRY_PUSH_TIME,
+    NotificationTypes,
+)
+from apps.notifications.models import (
+    Device,
+    NotificationRetry,
+    Notifications,
+)
 from apps.notifications.push_service import PushService
+from apps.notifications.retry import (
+    enqueue_retries,
+    get_retry_time,
+    process_due_retries,
+)
+from apps.notifications.utils import is_permanent_fcm_error
 
 
 @pytest.mark.django_db
@@ -400,7 +425,7 @@ class TestPushServiceWithTasksIntegration:
         sample_device,
         mock_tasks_import,
     ):
-        """Test FCMError triggers retry_notification_task creation."""
+        """Test FCMError queues notification for batched retry."""
         service = push_service_enabled
         service.push_service.notify.side_effect = FCMError('FCM fail')
 
@@ -408,4 +433,330 @@ class TestPushServiceWithTasksIntegration:
             sample_device, sample_notification
         )
         assert result is False
-        assert mock_tasks_import.apply_async.called
+        assert not mock_tasks_import.apply_async.called
+        retry = NotificationRetry.objects.get(token=sample_device.token)
+        assert retry.notification_type == sample_notification.type
+        assert retry.attempt == 1
+
+
+@pytest.mark.django_db
+class TestPushServiceBatchSending:
+    """Test sending notifications with FCM multicast requests."""
+
+    def test_batch_send_creates_notifications_in_bulk(
+        self,
+        push_service_batch,
+        mock_fcm_multicast,
+        in_game_notification_type,
+        devices,
+        game_for_notification,
+        django_assert_max_num_queries,
+    ):
+        """Test one multicast request and one insert for all devices."""
+        service = push_service_batch
+        active_devices = devices['active_devices']
+
+        with django_assert_max_num_queries(2):
+            result = service.send_push_notifications_batch(
+                active_devices,
+                in_game_notification_type,
+                event_id=game_for_notification.id,
+            )
+
+        assert result == {
+            'total_devices': 3,
+            'successful': 3,
+            'failed': 0,
+            'deactivated': 0,
+        }
+        assert mock_fcm_multicast.call_count == 1
+        assert Notifications.objects.filter(
+            game=game_for_notification,
+            notification_type=in_game_notification_type,
+        ).count() == len(active_devices)
+        assert not service.push_service.notify.called
+
+    def test_batch_send_splits_tokens_by_provider_limit(
+        self,
+        push_service_batch,
+        mock_fcm_multicast,
+        sample_notification,
+        devices,
+        monkeypatch,
+    ):
+        """Test tokens are grouped into chunks up to the provider limit."""
+        monkeypatch.setattr(
+            'apps.notifications.push_service.FCM_MULTICAST_MAX_TOKENS', 2
+        )
+        result = push_service_batch.send_push_notifications_batch(
+            devices['active_devices'], sample_notification
+        )
+
+        assert result['successful'] == 3
+        assert mock_fcm_multicast.call_count == 2
+        sent_tokens = [
+            call.args[0].tokens for call in mock_fcm_multicast.call_args_list
+        ]
+        assert [len(tokens) for tokens in sent_tokens] == [2, 1]
+
+    def test_batch_send_collects_per_token_results(
+        self,
+        push_service_batch,
+        mock_fcm_multicast,
+        mock_tasks_import,
+        sample_notification,
+        devices,
+    ):
+        """Test failed tokens are retried and get no notification model."""
+        failed_device = devices['device2']
+        mock_fcm_multicast.failed_tokens = {failed_device.token}
+
+        result = push_service_batch.send_push_notifications_batch(
+            devices['active_devices'], sample_notification
+        )
+
+        assert result['successful'] == 2
+        assert result['failed'] == 1
+        assert not Notifications.objects.filter(
+            player=failed_device.player
+        ).exists()
+        assert NotificationRetry.objects.get().token == failed_device.token
+
+    def test_batch_send_without_firebase_app_sends_by_device(
+        self, push_service_enabled, sample_notification, devices
+    ):
+        """Test fallback to per-device sending without Firebase app."""
+        service = push_service_enabled
+        service.fb_admin = None
+
+        result = service.send_push_notifications_batch(
+            devices['active_devices'], sample_notification
+        )
+
+        assert result['successful'] == 3
+        assert service.push_service.notify.call_count == 3
+
+
+@pytest.mark.django_db
+class TestPushServiceDeadTokens:
+    """Test handling of permanent FCM errors."""
+
+    @pytest.mark.parametrize(
+        ('error', 'is_permanent'),
+        [
+            (FCMNotRegisteredError('Token not registered'), True),
+            (messaging.UnregisteredError('Unregistered'), True),
+            (messaging.SenderIdMismatchError('Mismatch'), True),
+            (
+                InvalidDataError(
+                    'The registration token is not a valid FCM '
+                    'registration token'
+                ),
+                True,
+            ),
+            (
+                InvalidArgumentError(
+                    'The registration token is not a valid FCM '
+                    'registration token'
+                ),
+                True,
+            ),
+            (InvalidDataError('Invalid JSON payload'), False),
+            (FCMServerError('FCM server error'), False),
+            (UnavailableError('Service unavailable'), False),
+            (FCMError('FCM fail'), False),
+            (Exception('Connection error'), False),
+        ],
+    )
+    def test_fcm_error_classification(self, error, is_permanent):
+        """Test only token-related errors are permanent."""
+        assert is_permanent_fcm_error(error) is is_permanent
+
+    def test_unregistered_token_deactivates_device(
+        self,
+        push_service_enabled,
+        sample_notification,
+        sample_device,
+    ):
+        """Test unregistered device is deactivated without retry."""
+        service = push_service_enabled
+        service.push_service.notify.side_effect = FCMNotRegisteredError(
+            'Token not registered'
+        )
+
+        result = service.send_notification_by_device(
+            sample_device, sample_notification
+        )
+
+        assert result is False
+        sample_device.refresh_from_db()
+        assert sample_device.is_active is False
+        assert not NotificationRetry.objects.exists()
+
+    def test_batch_send_deactivates_devices_in_bulk(
+        self,
+        push_service_batch,
+        mock_fcm_multicast,
+        sample_notification,
+        devices,
+        django_assert_max_num_queries,
+    ):
+        """Test dead tokens of batch are deactivated with one query."""
+        dead_devices = [devices['device1'], devices['device2']]
+
+        def send_each_for_multicast(message, app=None):
+            return Mock(
+                responses=[
+                    Mock(
+                        success=False,
+                        exception=messaging.UnregisteredError('Unregistered'),
+                    )
+                    if token in {d.token for d in dead_devices}
+                    else Mock(success=True, exception=None)
+                    for token in message.tokens
+                ]
+            )
+
+        mock_fcm_multicast.side_effect = send_each_for_multicast
+
+        with django_assert_max_num_queries(2):
+            result = push_service_batch.send_push_notifications_batch(
+                devices['active_devices'], sample_notification
+            )
+
+        assert result['deactivated'] == len(dead_devices)
+        assert (
+            not Device.objects.active()
+            .filter(pk__in=[d.pk for d in dead_devices])
+            .exists()
+        )
+        assert not NotificationRetry.objects.exists()
+
+
+@pytest.mark.django_db
+class TestNotificationRetryQueue:
+    """Test batched retries of failed notifications."""
+
+    def test_retry_time_grows_exponentially_and_aligns_to_window(self):
+        """Test retry windows with backoff and jitter."""
+        now = timezone.now()
+        for attempt in range(1, MAX_RETRIES + 1):
+            retry_at = get_retry_time(attempt, now=now)
+            delay = (retry_at - now).total_seconds()
+            min_delay = RETRY_PUSH_TIME * 2 ** (attempt - 1)
+            assert min_delay <= delay <= 2 * min_delay + RETRY_PUSH_TIME
+            assert retry_at.timestamp() % RETRY_PUSH_TIME == 0
+
+    def test_retries_after_max_attempts_are_dropped(self, sample_notification):
+        """Test tokens are not queued after the last attempt."""
+        queued = enqueue_retries(
+            ['fcm_test_token_1'],
+            sample_notification.type,
+            attempt=MAX_RETRIES + 1,
+        )
+
+        assert queued == 0
+        assert not NotificationRetry.objects.exists()
+
+    def test_due_retries_are_replayed_as_one_batch(
+        self,
+        push_service_batch,
+        mock_fcm_multicast,
+        in_game_notification_type,
+        devices,
+        game_for_notification,
+    ):
+        """Test due retries of one window are sent with one request."""
+        tokens = [d.token for d in devices['active_devices']]
+        enqueue_retries(
+            tokens, in_game_notification_type.type, game_for_notification.id
+        )
+        enqueue_retries(
+            ['fcm_test_token_5'],
+            in_game_notification_type.type,
+            attempt=MAX_RETRIES,
+        )
+        now = timezone.now() + timedelta(seconds=3 * RETRY_PUSH_TIME)
+
+        result = process_due_retries(push_service_batch, now=now)
+
+        assert result == {'retries': len(tokens), 'batches': 1}
+        assert mock_fcm_multicast.call_count == 1
+        assert sorted(mock_fcm_multicast.call_args.args[0].tokens) == sorted(
+            tokens
+        )
+        assert NotificationRetry.objects.count() == 1
+        assert Notifications.objects.filter(
+            game=game_for_notification
+        ).count() == len(tokens)
+
+    def test_failed_replay_is_queued_with_next_attempt(
+        self,
+        push_service_batch,
+        mock_fcm_multicast,
+        sample_notification,
+        sample_device,
+    ):
+        """Test transient failure of retry moves token to next attempt."""
+        mock_fcm_multicast.failed_tokens = {sample_device.token}
+        NotificationRetry.objects.create(
+            token=sample_device.token,
+            notification_type=sample_notification.type,
+            retry_at=timezone.now(),
+        )
+
+        process_due_retries(push_service_batch)
+
+        retry = NotificationRetry.objects.get()
+        assert retry.attempt == 2
+        assert retry.retry_at > timezone.now()
+
+    def test_failed_batch_does_not_stop_other_batches(
+        self,
+        push_service_batch,
+        mock_fcm_multicast,
+        in_game_notification_type,
+        devices,
+        game_for_notification,
+    ):
+        """Test retries of a deleted event do not lose other retries."""
+        deleted_event_id = game_for_notification.id + 1000
+        valid_device, deleted_event_device = devices['active_devices'][:2]
+        now = timezone.now()
+        NotificationRetry.objects.create(
+            token=deleted_event_device.token,
+            notification_type=in_game_notification_type.type,
+            event_id=deleted_event_id,
+            retry_at=now - timedelta(minutes=1),
+        )
+        NotificationRetry.objects.create(
+            token=valid_device.token,
+            notification_type=in_game_notification_type.type,
+            event_id=game_for_notification.id,
+            retry_at=now,
+        )
+        send_batch = push_service_batch.send_push_notifications_batch
+
+        def send_existing_events(**kwargs):
+            if kwargs['event_id'] == deleted_event_id:
+                raise Game.DoesNotExist('Game does not exist.')
+            return send_batch(**kwargs)
+
+        with patch.object(
+            push_service_batch,
+            'send_push_notifications_batch',
+            side_effect=send_existing_events,
+        ):
+            result = process_due_retries(push_service_batch, now=now)
+
+        assert result == {'retries': 2, 'batches': 2}
+        assert mock_fcm_multicast.call_args.args[0].tokens == [
+            valid_device.token
+        ]
+        assert Notifications.objects.filter(
+            player=valid_device.player, game=game_for_notification
+        ).exists()
+        retry = NotificationRetry.objects.get()
+        assert retry.token == deleted_event_device.token
+        assert retry.event_id == deleted_event_id
+        assert retry.attempt == 2
@@ -0,0 +1,222 @@
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from apps.locations.models import City
+from apps.players.autocomplete import (
+    PlayerPrefixIndex,
+    player_autocomplete_cache,
+)
+from apps.players.constants import PlayerIntEnums
+from apps.players.models import Player
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestPlayerPrefixIndex:
+    @pytest.fixture
+    def index(self):
+        return PlayerPrefixIndex(
+            [
+                (1, 'Anna', 'Kai', 'anna', 'kai'),
+                (2, 'Kaito', 'Lee', 'kaito', 'lee'),
+                (3, 'Kai', 'Kaiser', 'kai', 'kaiser'),
+                (4, 'Bob', 'Brown', 'bob', 'brown'),
+            ]
+        )
+
+    def get_ids(self, suggestions):
+        return [suggestion['player_id'] for suggestion in suggestions]
+
+    def test_exact_matches_first_then_alphabetical(self, index):
+        assert self.get_ids(index.suggest('kai', 10)) == [1, 3, 2]
+
+    def test_player_is_suggested_once(self, index):
+        assert self.get_ids(index.suggest('kais', 10)) == [3]
+
+    def test_limit_and_exclude(self, index):
+        assert self.get_ids(index.suggest('kai', 2, exclude=1)) == [3, 2]
+
+    def test_no_matches(self, index):
+        assert index.suggest('zed', 10) == []
+
+    def test_suggestion_has_original_names(self, index):
+        assert index.suggest('bo', 10) == [
+            {'player_id': 4, 'first_name': 'Bob', 'last_name': 'Brown'}
+        ]
+
+
+@pytest.mark.django_db
+class TestPlayerAutocompleteAPI:
+    @pytest.fixture
+    def url(self):
+        return reverse('api:players-autocomplete')
+
+    @pytest.fixture
+    def create_player(self, city_in_thailand):
+        def create(first_name, last_name, city=city_in_thailand, **kwargs):
+            user = User.objects.create_user(
+                username=f'{first_name}_{last_name}',
+                first_name=first_name,
+                last_name=last_name,
+            )
+            kwargs.setdefault('is_registered', True)
+            return Player.objects.create(
+                user=user, country=city.country, city=city, **kwargs
+            )
+
+        return create
+
+    def get_ids(self, response):
+        assert response.status_code == status.HTTP_200_OK
+        return [suggestion['player_id'] for suggestion in response.json()]
+
+    def test_suggestions_from_the_same_city(
+        self, api_client_thailand, player_thailand, url, create_player
+    ):
+        kai = create_player('Kai', 'Park')
+        other_city = City.objects.create(
+            name='Other city', country=player_thailand.country
+        )
+        create_player('Kaito', 'Lee', city=other_city)
+        create_player('Kaiser', 'Ray', is_registered=False)
+
+        response = api_client_thailand.get(url, {'search': 'KA'})
+
+        assert self.get_ids(response) == [kai.id]
+
+    def test_suggestions_are_served_from_memory(
+        self,
+        api_client_thailand,
+        player_thailand,
+        url,
+        create_player,
+    ):
+        create_player('Kai', 'Park')
+        api_client_thailand.get(url, {'search': 'ka'})
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client_thailand.get(url, {'search': 'kai'})
+
+        assert len(self.get_ids(response)) == 1
+        assert not any(
+            'search_first_name' in query['sql']
+            for query in context.captured_queries
+        )
+
+    def test_changes_are_visible_after_commit(
+        self,
+        api_client_thailand,
+        player_thailand,
+        url,
+        create_player,
+        django_capture_on_commit_callbacks,
+    ):
+        api_client_thailand.get(url, {'search': 'ka'})
+
+        with django_capture_on_commit_callbacks(execute=True):
+            kai = create_player('Kai', 'Park')
+        with django_capture_on_commit_callbacks(execute=True):
+            kai.user.first_name = 'Mai'
+            kai.user.save()
+
+        assert (
+            self.get_ids(api_client_thailand.get(url, {'search': 'ka'})) == []
+        )
+        assert self.get_ids(
+            api_client_thailand.get(url, {'search': 'ma'})
+        ) == [kai.id]
+
+    @pytest.mark.parametrize(
+        'field, value, invalidated',
+        (
+            ('gender', 'FEMALE', False),
+            ('is_registered', False, True),
+            ('search_first_name', 'mai', True),
+        ),
+    )
+    def test_indexes_are_invalidated_by_indexed_fields_only(
+        self,
+        player_thailand,
+        create_player,
+        django_capture_on_commit_callbacks,
+        field,
+        value,
+        invalidated,
+    ):
+        player = Player.objects.get(pk=create_player('Kai', 'Park').pk)
+        setattr(player, field, value)
+
+        with (
+            patch.object(
+                player_autocomplete_cache, 'invalidate'
+            ) as invalidate,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            player.save()
+
+        assert invalidate.called is invalidated
+
+    @pytest.mark.parametrize(
+        'first_name, invalidated', (('Kai', False), ('Mai', True))
+    )
+    def test_indexes_are_invalidated_by_changed_user_names(
+        self,
+        create_player,
+        django_capture_on_commit_callbacks,
+        first_name,
+        invalidated,
+    ):
+        user = User.objects.get(pk=create_player('Kai', 'Park').user_id)
+        user.first_name = first_name
+
+        with (
+            patch.object(
+                player_autocomplete_cache, 'invalidate'
+            ) as invalidate,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            user.save()
+
+        assert invalidate.called is invalidated
+
+    def test_current_player_is_not_suggested(
+        self, api_client_thailand, player_thailand, url
+    ):
+        search = player_thailand.user.first_name[:2]
+
+        response = api_client_thailand.get(url, {'search': search})
+
+        assert player_thailand.id not in self.get_ids(response)
+
+    @pytest.mark.parametrize(
+        'params',
+        (
+            {},
+            {'search': 'ka', 'limit': 0},
+            {
+                'search': 'ka',
+                'limit': PlayerIntEnums.AUTOCOMPLETE_MAX_LIMIT + 1,
+            },
+        ),
+    )
+    def test_invalid_query(
+        self, api_client_thailand, player_thailand, url, params
+    ):
+        response = api_client_thailand.get(url, params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_rebuild_command(self, player_thailand, create_player, capsys):
+        create_player('Kai', 'Park')
+
+        call_command('rebuild_player_autocomplete')
+
+        assert 'Rebuilt 1 indexes' in capsys.readouterr().out
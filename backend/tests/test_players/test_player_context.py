@@ -0,0 +1,74 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.players.context import get_request_player
+from apps.players.models import Player
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestRequestPlayer:
+    """Test the player of the request is loaded once."""
+
+    def get_request(self, user):
+        http_request = APIRequestFactory().get('/')
+        http_request.user = user
+        request = Request(http_request)
+        request.user = user
+        return request
+
+    def test_player_is_loaded_once_with_relations(
+        self, player_thailand, django_assert_num_queries
+    ):
+        request = self.get_request(
+            User.objects.get(pk=player_thailand.user_id)
+        )
+
+        with django_assert_num_queries(1):
+            player = get_request_player(request)
+            assert player.country == player_thailand.country
+            assert player.city == player_thailand.city
+            assert player.rating.grade == player_thailand.rating.grade
+        with django_assert_num_queries(0):
+            assert get_request_player(request) is player
+            assert get_request_player(request._request) is player
+        assert not User.player.is_cached(request.user)
+
+    def test_player_is_reloaded_by_next_request(self, player_thailand):
+        user = User.objects.get(pk=player_thailand.user_id)
+        get_request_player(self.get_request(user))
+        Player.objects.filter(pk=player_thailand.pk).update(
+            is_registered=False
+        )
+        player = get_request_player(self.get_request(user))
+
+        assert player.is_registered is False
+
+    def test_player_loaded_with_user_is_reused(
+        self, player_thailand, django_assert_num_queries
+    ):
+        user = User.objects.select_related(
+            'player__country', 'player__city', 'player__rating'
+        ).get(pk=player_thailand.user_id)
+        request = self.get_request(user)
+
+        with django_assert_num_queries(0):
+            assert get_request_player(request) == player_thailand
+
+    def test_user_without_player(self, active_user, django_assert_num_queries):
+        request = self.get_request(active_user)
+
+        with django_assert_num_queries(1):
+            assert get_request_player(request) is None
+        with django_assert_num_queries(0):
+            assert get_request_player(request) is None
+
+    def test_anonymous_user(self, django_assert_num_queries):
+        request = self.get_request(AnonymousUser())
+
+        with django_assert_num_queries(0):
+            assert get_request_player(request) is None
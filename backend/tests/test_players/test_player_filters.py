@@ -1,6 +1,8 @@
 import pytest
 from django.contrib.auth import get_user_model
-from rest_framework.test import APIRequestFactory
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory
 
 from apps.locations.models import City, Country
 from apps.players.filters import PlayersFilter
@@ -432,6 +434,88 @@ class TestPlayersFilter:
         assert filtered_players.count() == total_players
 
 
+@pytest.mark.django_db
+class TestPlayersSearchNames:
+    """Tests for normalized search names of players."""
+
+    def search(self, player, value):
+        request = APIRequestFactory().get('/players/', {'search': value})
+        request.user = player.user
+        filter_instance = PlayersFilter(
+            {'search': value}, queryset=Player.objects.all()
+        )
+        filter_instance.request = request
+        return list(filter_instance.qs)
+
+    def test_search_names_are_normalized(self, setup_test_data):
+        player = setup_test_data['thailand_players'][0]
+
+        assert player.search_first_name == 'john'
+        assert player.search_last_name == 'smith'
+
+    def test_user_names_change_updates_search_names(self, setup_test_data):
+        player = setup_test_data['thailand_players'][0]
+        player.user.first_name = '  Jean   Paul '
+        player.user.save()
+
+        player.refresh_from_db()
+        assert player.search_first_name == 'jean paul'
+
+    def test_user_save_without_names_does_not_update_player(
+        self, setup_test_data, django_assert_num_queries
+    ):
+        user = setup_test_data['thailand_players'][0].user
+
+        with django_assert_num_queries(1):
+            user.save(update_fields=['last_login'])
+
+    @pytest.mark.parametrize('value', ('JOHN', 'john', '  John '))
+    def test_search_ignores_case_and_spaces(self, setup_test_data, value):
+        requesting_player = setup_test_data['requesting_player_bangkok']
+
+        players = self.search(requesting_player, value)
+
+        assert [p.user.username for p in players] == ['john_bangkok']
+
+    def test_search_ranks_exact_prefix_contains(self, setup_test_data):
+        requesting_player = setup_test_data['requesting_player_bangkok']
+        city = requesting_player.city
+        names = (('Anna', 'Makai'), ('Kaito', 'Lee'), ('Kai', 'Park'))
+        created = {}
+        for first_name, last_name in names:
+            user = User.objects.create_user(
+                username=first_name,
+                first_name=first_name,
+                last_name=last_name,
+            )
+            created[first_name] = Player.objects.create(
+                user=user, country=city.country, city=city
+            )
+
+        players = self.search(requesting_player, 'kai')
+
+        assert players == [created['Kai'], created['Kaito'], created['Anna']]
+        assert [p.relevance for p in players] == [1, 2, 3]
+
+    def test_search_in_players_list(self, setup_test_data):
+        requesting_player = setup_test_data['requesting_player_bangkok']
+        client = APIClient()
+        client.force_authenticate(requesting_player.user)
+
+        response = client.get(reverse('api:players-list'), {'search': 'jan'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [p['first_name'] for p in response.json()] == ['Jane']
+
+    def test_update_search_names(self, setup_test_data):
+        Player.objects.update(search_first_name='', search_last_name='')
+
+        updated = Player.objects.update_search_names()
+
+        assert updated == Player.objects.count()
+        assert not Player.objects.filter(search_first_name='').exists()
+
+
 @pytest.mark.django_db
 class TestPlayersFilterAPI:
     """Class for API filter tests."""
@@ -27,4 +27,8 @@ CELERYBEAT_SCHEDULE = {
         'task': 'apps.notifications.tasks.send_rate_notification_task',
         'schedule': crontab(minute='*/10'),
     },
+    'replay-notification-retries-every-minute': {
+        'task': 'apps.notifications.tasks.process_notification_retries_task',
+        'schedule': crontab(),
+    },
 }
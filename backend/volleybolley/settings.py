@@ -148,9 +148,19 @@ USE_I18N = True
 
 USE_TZ = True
 
+# Embed player claims in JWT tokens and trust them on read only requests
+# without is_active and revoked token checks until the access token expires.
+# Tokens issued before a registration or location change of the player are
+# checked in the database until they are refreshed.
+PLAYER_TOKEN_CLAIMS = (
+    os.getenv('PLAYER_TOKEN_CLAIMS', 'False').lower() == 'true'
+)
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.authentication.authentication.PlayerTokenAuthentication'
+        if PLAYER_TOKEN_CLAIMS
+        else 'apps.authentication.authentication.PlayerJWTAuthentication',
     ),
     'TEST_REQUEST_DEFAULT_FORMAT': 'json',
     'TEST_REQUEST_RENDERER_CLASSES': [
@@ -236,6 +246,11 @@ FIREBASE_SERVICE_ACCOUNT = {
     'client_x509_cert_url': os.getenv('FIREBASE_CLIENT_CERT_URL', ''),
     'universe_domain': os.getenv('FIREBASE_UNIVERSE_DOMAIN', 'googleapis.com'),
 }
+PUSH_BATCH_SEND = os.getenv('PUSH_BATCH_SEND', 'True').lower() == 'true'
+PUSH_DISPATCH_MAX_WORKERS = int(os.getenv('PUSH_DISPATCH_MAX_WORKERS', 16))
+
+# SQL shape of games related to a player query: distinct, exists or union.
+GAME_RELATED_GAMES_STRATEGY = os.getenv('GAME_RELATED_GAMES_STRATEGY', 'union')
 
 
 STATIC_URL = '/static/'
@@ -386,6 +401,31 @@ REDIS_PORT = os.environ.get('REDIS_PORT', '6379')
 REDIS_DB = os.environ.get('REDIS_DB', '0')
 REDIS_PASSWORD = os.environ.get('REDIS_PASSWORD', 'redis_pass')
 REDIS_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+REDIS_CACHE_DB = os.environ.get('REDIS_CACHE_DB', '1')
+REDIS_CACHE_URL = (
+    f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/{REDIS_CACHE_DB}"
+)
+
+# Cache Configuration
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'redis')
+CACHE_BACKENDS = {
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'dummy': 'django.core.cache.backends.dummy.DummyCache',
+}
+if TESTING:
+    CACHE_BACKEND = 'locmem'
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND],
+        'LOCATION': (
+            REDIS_CACHE_URL if CACHE_BACKEND == 'redis' else 'volleybolley'
+        ),
+        'KEY_PREFIX': os.getenv('CACHE_KEY_PREFIX', 'volleybolley'),
+        'VERSION': int(os.getenv('CACHE_VERSION', 1)),
+        'TIMEOUT': int(os.getenv('CACHE_DEFAULT_TIMEOUT', 300)),
+    }
+}
 
 # Celery Configuration Options
 CELERY_BROKER_URL = REDIS_URL